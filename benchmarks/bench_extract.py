@@ -0,0 +1,143 @@
+"""
+Page extraction benchmark.
+
+Runs the scraper's extraction (src/tools/web_search/extract.py) over the
+saved HTML pages in benchmarks/fixtures and compares it with the previous
+three-parse pipeline (trafilatura on the raw bytes, a BeautifulSoup tree
+for the metadata and another one for the fallback text), which is kept
+below as the baseline. Both run in-process; no worker pool or network.
+
+Usage (from the repository root):
+    python benchmarks/bench_extract.py [--repeat 20] [--max-length 3000]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(REPO_ROOT, "benchmarks", "fixtures")
+sys.path.insert(0, REPO_ROOT)
+
+from src.tools.web_search.extract import extract_html  # noqa: E402
+
+SCRAPE_SETTINGS = {}
+
+
+def baseline_extract(content: bytes, url: str, max_length: int, scrape_settings: dict) -> dict:
+    """Condensed copy of the extraction before the single-parse pipeline (up to three parses per page)."""
+    from bs4 import BeautifulSoup
+    import trafilatura
+    from trafilatura.settings import use_config
+
+    result = {"content": None, "image_url": None, "favicon_url": None, "og_title": None, "og_description": None}
+
+    traf_config = use_config()
+    traf_config.set("DEFAULT", "min_extracted_size", str(scrape_settings.get("min_extracted_size", 250)))
+    traf_config.set("DEFAULT", "min_output_size", str(scrape_settings.get("min_output_size", 1)))
+    traf_config.set("DEFAULT", "min_extracted_comm_size", str(scrape_settings.get("min_extracted_comm_size", 1)))
+    traf_config.set("DEFAULT", "min_output_comm_size", str(scrape_settings.get("min_output_comm_size", 1)))
+    traf_config.set("DEFAULT", "extraction_timeout", str(scrape_settings.get("extraction_timeout", 0)))
+    text = trafilatura.extract(content, include_comments=False, config=traf_config)
+    if text:
+        result["content"] = text[:max_length] + "..." if len(text) > max_length else text
+
+    soup = BeautifulSoup(content, "lxml")
+    og_title = soup.find("meta", property="og:title") or soup.find("meta", attrs={"name": "og:title"})
+    if og_title:
+        result["og_title"] = og_title.get("content")
+    if not result["og_title"] and soup.title and soup.title.string:
+        result["og_title"] = str(soup.title.string)
+    og_desc = (soup.find("meta", property="og:description") or soup.find("meta", attrs={"name": "description"}) or
+               soup.find("meta", attrs={"name": "og:description"}))
+    if og_desc:
+        result["og_description"] = og_desc.get("content")
+    og_image = (soup.find("meta", property="og:image") or soup.find("meta", attrs={"name": "og:image"}) or
+                soup.find("meta", itemprop="image"))
+    if og_image:
+        result["image_url"] = og_image.get("content")
+    for pattern in [{"rel": "apple-touch-icon"}, {"rel": "apple-touch-icon-precomposed"},
+                    {"rel": "icon", "type": "image/png"}, {"rel": "shortcut icon"}, {"rel": "icon"}]:
+        icon_link = soup.find("link", attrs=pattern)
+        if icon_link and icon_link.get("href"):
+            from urllib.parse import urljoin
+            href = icon_link.get("href")
+            result["favicon_url"] = href if href.startswith("http") else urljoin(url, href)
+            break
+
+    if not result["content"]:
+        # The old fallback parsed the page again before cleaning it
+        from src.tools.web_search.extract import REMOVE_TAGS
+        soup = BeautifulSoup(content, "lxml")
+        for tag in REMOVE_TAGS:
+            for element in soup.find_all(tag):
+                element.decompose()
+        main = soup.find("article") or soup.find("main") or soup.body or soup
+        paragraphs = []
+        for tag in main.find_all(["p", "h1", "h2", "h3", "h4", "h5", "h6", "li"]):
+            text = tag.get_text(separator=" ", strip=True)
+            if text and len(text) > 30 and text not in paragraphs:
+                paragraphs.append(text)
+        text = "\n\n".join(paragraphs)
+        result["content"] = (text[:max_length] + "..." if len(text) > max_length else text) or None
+    return result
+
+
+def time_runs(fn, content, url, max_length, repeat):
+    timings = []
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(content, url, max_length, SCRAPE_SETTINGS)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(timings), result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=20, help="Runs per page (the median is reported)")
+    parser.add_argument("--max-length", type=int, default=3000, help="Content length limit, as in scrape_url")
+    parser.add_argument("--no-baseline", action="store_true", help="Only time the current pipeline")
+    args = parser.parse_args()
+
+    fixtures = sorted(name for name in os.listdir(FIXTURES_DIR) if name.endswith(".html"))
+    if not fixtures:
+        raise SystemExit(f"No fixtures in {FIXTURES_DIR}")
+
+    try:
+        import bs4  # noqa: F401
+    except ImportError:
+        args.no_baseline = True
+        print("beautifulsoup4 is not installed: skipping the baseline\n")
+
+    print(f"{'page':<16} {'KiB':>6} {'current ms':>11} {'baseline ms':>12} {'speedup':>8}  metadata")
+    totals = [0.0, 0.0]
+    for name in fixtures:
+        with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+            content = f.read()
+        url = f"https://example.org/{name}"
+
+        extract_html(content, url, args.max_length, SCRAPE_SETTINGS)  # Warm caches (config, XPath)
+        current_ms, current = time_runs(extract_html, content, url, args.max_length, args.repeat)
+        totals[0] += current_ms
+
+        if args.no_baseline:
+            print(f"{name:<16} {len(content) / 1024:>6.0f} {current_ms:>11.2f}")
+            continue
+
+        baseline_ms, baseline = time_runs(baseline_extract, content, url, args.max_length, args.repeat)
+        totals[1] += baseline_ms
+        same = all(current[key] == baseline[key] for key in ("og_title", "og_description", "image_url", "favicon_url"))
+        print(f"{name:<16} {len(content) / 1024:>6.0f} {current_ms:>11.2f} {baseline_ms:>12.2f} "
+              f"{baseline_ms / current_ms:>7.2f}x  {'same' if same else 'DIFFERENT'}")
+
+    if args.no_baseline:
+        print(f"\nTotal: {totals[0]:.2f} ms per pass")
+    else:
+        print(f"\nTotal: {totals[0]:.2f} ms vs {totals[1]:.2f} ms ({totals[1] / totals[0]:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
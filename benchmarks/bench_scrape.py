@@ -0,0 +1,266 @@
+"""
+Offline scraper benchmark and extraction-quality harness.
+
+Replays the pages in benchmarks/corpus (listed in manifest.json) through
+scrape_url() via a local HTTP stub, so the whole scraping path runs:
+streaming fetch, content-type and charset handling, extraction in the
+worker pool. No network access is needed; the scrape cache is disabled.
+
+Reports:
+    - pages per second and median latency per page
+    - peak memory (RSS) of this process and of the worker processes
+    - how many pages were extracted by trafilatura, the fallback, or as text
+    - word overlap (precision / recall / F1) with the hand-labelled gold
+      extract of each page; a page marked "expect_empty" must give no content
+      and pages with "gold": null (not labelled yet) are left out of the score
+
+Usage (from the repository root):
+    python benchmarks/bench_scrape.py [--repeat 5] [--concurrency 4] [--workers 2]
+    python benchmarks/bench_scrape.py --json results.json --min-f1 0.8
+    python benchmarks/bench_scrape.py --record https://example.org/page --name example --category blog
+
+--record is the only mode that uses the network: it saves a real page into
+the corpus as unlabelled ("gold": null) until its gold file is written by hand.
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import http.server
+import json
+import os
+import re
+import resource
+import statistics
+import sys
+import threading
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(REPO_ROOT, "benchmarks", "corpus")
+MANIFEST = os.path.join(CORPUS_DIR, "manifest.json")
+sys.path.insert(0, REPO_ROOT)
+
+_WORD = re.compile(r"\w+")
+
+
+def load_manifest() -> list:
+    with open(MANIFEST, "r", encoding="utf-8") as f:
+        return json.load(f)["pages"]
+
+
+class CorpusHandler(http.server.BaseHTTPRequestHandler):
+    """Serves /<name> with the recorded body and Content-Type."""
+    pages = {}
+    latency = 0.0
+
+    def do_GET(self):
+        page = self.pages.get(self.path.lstrip("/"))
+        if page is None:
+            self.send_error(404)
+            return
+        if self.latency:
+            time.sleep(self.latency)
+        body, content_type = page
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub(pages: list, latency: float):
+    CorpusHandler.latency = latency
+    for page in pages:
+        with open(os.path.join(CORPUS_DIR, page["file"]), "rb") as f:
+            CorpusHandler.pages[page["name"]] = (f.read(), page["content_type"])
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), CorpusHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def overlap(extracted: str, gold: str) -> dict:
+    """Word-level precision, recall and F1 (bags of lowercase words)."""
+    got = collections.Counter(_WORD.findall((extracted or "").lower()))
+    want = collections.Counter(_WORD.findall(gold.lower()))
+    common = sum((got & want).values())
+    precision = common / sum(got.values()) if got else 0.0
+    recall = common / sum(want.values())
+    f1 = 2 * precision * recall / (precision + recall) if common else 0.0
+    return {"precision": precision, "recall": recall, "f1": f1}
+
+
+def score(page: dict, extracted: str) -> dict:
+    """The page's overlap scores, or None for each when it has no gold extract yet."""
+    if page.get("expect_empty"):
+        # Nothing should have been extracted
+        value = 0.0 if _WORD.search(extracted or "") else 1.0
+        return {"precision": value, "recall": value, "f1": value}
+    if not page.get("gold"):
+        return {"precision": None, "recall": None, "f1": None}
+    with open(os.path.join(CORPUS_DIR, page["gold"]), "r", encoding="utf-8") as f:
+        return overlap(extracted, f.read())
+
+
+def peak_rss_mib(who) -> float:
+    return resource.getrusage(who).ru_maxrss / 1024.0  # KiB on Linux
+
+
+def run(args) -> dict:
+    # Local stub only: keep any configured proxy away from it
+    os.environ["NO_PROXY"] = os.environ["no_proxy"] = "127.0.0.1,localhost"
+
+    from src.core.config import ConfigManager
+    config = ConfigManager()
+    # In-memory overrides for this process, never saved
+    config.config["scrape_cache_enabled"] = False
+    if args.workers is not None:
+        config.config["worker_processes"] = args.workers
+
+    from src.core.favicons import FaviconStore
+    from src.core.workers import WorkerPool
+    from src.tools.web_search.scraper import scrape_url
+
+    # scrape_url warms the favicon store, which downloads icons and indexes the stub's host
+    FaviconStore.remember = lambda self, *args, **kwargs: None
+
+    pages = load_manifest()
+    server = start_stub(pages, args.latency / 1000.0)
+    base = f"http://127.0.0.1:{server.server_address[1]}/"
+    urls = [base + page["name"] for page in pages]
+
+    def scrape(url):
+        start = time.perf_counter()
+        result = scrape_url(url, args.max_length, args.timeout, use_cache=False)
+        return result, (time.perf_counter() - start) * 1000.0
+
+    # Warm-up pass: starts the worker processes; its results are the ones scored
+    results = [scrape(url)[0] for url in urls]
+
+    latencies = []
+    with concurrent.futures.ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            latencies.extend(latency for _, latency in pool.map(scrape, urls))
+        elapsed = time.perf_counter() - start
+
+    WorkerPool().shutdown()  # Worker peak memory is only reported once they have exited
+    server.shutdown()
+
+    report = {"pages": [], "extractors": collections.Counter()}
+    for page, result in zip(pages, results):
+        extractor = result.get("extractor") or "none"
+        report["extractors"][extractor] += 1
+        report["pages"].append({
+            "name": page["name"],
+            "category": page["category"],
+            "bytes": len(CorpusHandler.pages[page["name"]][0]),
+            "extractor": extractor,
+            "chars": len(result.get("content") or ""),
+            **score(page, result.get("content")),
+        })
+
+    report["extractors"] = dict(report["extractors"])
+    report["fetches"] = len(latencies)
+    report["pages_per_second"] = len(latencies) / elapsed if elapsed else 0.0
+    report["median_latency_ms"] = statistics.median(latencies) if latencies else 0.0
+    report["peak_rss_mib"] = peak_rss_mib(resource.RUSAGE_SELF)
+    report["worker_peak_rss_mib"] = peak_rss_mib(resource.RUSAGE_CHILDREN)
+    scored = [p["f1"] for p in report["pages"] if p["f1"] is not None]
+    report["scored_pages"] = len(scored)
+    report["mean_f1"] = statistics.mean(scored) if scored else None
+    return report
+
+
+def print_report(report: dict, args):
+    print(f"{'page':<16} {'category':<10} {'KiB':>5} {'extractor':<12} {'chars':>6} "
+          f"{'prec':>5} {'recall':>6} {'F1':>5}")
+    for page in report["pages"]:
+        if page["f1"] is None:
+            scores = f"{'-':>5} {'-':>6} {'-':>5}  (unlabelled)"
+        else:
+            scores = f"{page['precision']:>5.2f} {page['recall']:>6.2f} {page['f1']:>5.2f}"
+        print(f"{page['name']:<16} {page['category']:<10} {page['bytes'] / 1024:>5.1f} {page['extractor']:<12} "
+              f"{page['chars']:>6} {scores}")
+
+    split = ", ".join(f"{name} {count}" for name, count in sorted(report["extractors"].items()))
+    workers = "in-process" if args.workers == 0 else "worker pool"
+    print(f"\nExtraction:  {split}")
+    if report["mean_f1"] is None:
+        print("Quality:     no labelled pages")
+    else:
+        print(f"Quality:     mean F1 {report['mean_f1']:.3f} over {report['scored_pages']} labelled pages")
+    print(f"Throughput:  {report['pages_per_second']:.1f} pages/s over {report['fetches']} fetches "
+          f"(concurrency {args.concurrency}, {workers}), median {report['median_latency_ms']:.1f} ms/page")
+    print(f"Peak memory: {report['peak_rss_mib']:.0f} MiB main process, "
+          f"{report['worker_peak_rss_mib']:.0f} MiB largest worker")
+
+
+def record(args):
+    """Save a live page into the corpus (the only network access of this script)."""
+    from src.core.network.http_client import get_session
+
+    if not args.name or not args.category:
+        raise SystemExit("--record needs --name and --category")
+    response = get_session().get(args.record, timeout=args.timeout)
+    response.raise_for_status()
+    content_type = response.headers.get("Content-Type", "text/html")
+    extension = ".txt" if content_type.startswith("text/plain") else ".html"
+
+    with open(os.path.join(CORPUS_DIR, args.name + extension), "wb") as f:
+        f.write(response.content)
+    with open(MANIFEST, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest["pages"] = [p for p in manifest["pages"] if p["name"] != args.name]
+    manifest["pages"].append({
+        "name": args.name,
+        "file": args.name + extension,
+        "category": args.category,
+        "content_type": content_type,
+        "gold": None,  # Unlabelled: not scored until the gold file exists
+        "source": args.record,
+    })
+    with open(MANIFEST, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=4, ensure_ascii=False)
+        f.write("\n")
+    print(f"Saved {len(response.content) // 1024} KiB as {args.name}{extension}.")
+    print(f"Write the main text of the page into benchmarks/corpus/{args.name}.gold.txt by hand, then set its "
+          f"\"gold\" in manifest.json (or \"expect_empty\": true if nothing should be extracted).")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Timed passes over the corpus")
+    parser.add_argument("--concurrency", type=int, default=1, help="Pages scraped at the same time")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Extraction worker processes (0 = in-process; default: the configured value)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated server latency in ms")
+    parser.add_argument("--max-length", type=int, default=100000, help="Content length limit passed to scrape_url")
+    parser.add_argument("--timeout", type=int, default=10, help="Request timeout in seconds")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON")
+    parser.add_argument("--min-f1", type=float, default=None, help="Exit with status 1 if the mean F1 is lower")
+    parser.add_argument("--record", metavar="URL", help="Save a live page into the corpus instead of benchmarking")
+    parser.add_argument("--name", help="Corpus name for --record")
+    parser.add_argument("--category", help="Category for --record (news, docs, blog, forum, js-shell...)")
+    args = parser.parse_args()
+
+    if args.record:
+        record(args)
+        return
+
+    report = run(args)
+    print_report(report, args)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+    if args.min_f1 is not None and report["mean_f1"] is not None and report["mean_f1"] < args.min_f1:
+        print(f"\nMean F1 {report['mean_f1']:.3f} is under {args.min_f1}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
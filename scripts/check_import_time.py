@@ -0,0 +1,92 @@
+"""
+Startup import regression check.
+
+Runs `python -X importtime` on the modules needed to show the first
+window and fails if any heavy SDK or subsystem is imported eagerly, or if
+the cumulative import time exceeds the budget.
+
+Usage (from the repository root):
+    python scripts/check_import_time.py [--module src.ui.window] [--budget-ms 1500] [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+# Packages that must only be imported on demand (first use of the feature)
+DEFERRED_MODULES = [
+    "ollama", "openai", "anthropic", "google.genai",   # Provider SDKs
+    "trafilatura", "bs4", "lxml", "ddgs", "aiohttp",    # Web search / scraping
+    "pypdf", "docx", "weasyprint", "markdown",          # Documents and PDF reports
+    "vosk", "sounddevice",                              # Voice stack
+]
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_importtime(module):
+    """Return [(module, self_us, cumulative_us)] for a fresh interpreter importing module."""
+    cmd = [sys.executable, "-X", "importtime", "-c", f"import {module}"]
+    proc = subprocess.run(cmd, cwd=REPO_ROOT, capture_output=True, text=True)
+    if proc.returncode != 0:
+        print(proc.stderr[-2000:])
+        raise SystemExit(f"Importing {module} failed (exit code {proc.returncode})")
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        # import time:       self [us] |   cumulative | imported package
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        try:
+            _, rest = line.split(":", 1)
+            self_us, cumulative_us, name = rest.split("|", 2)
+            entries.append((name.strip(), int(self_us), int(cumulative_us)))
+        except ValueError:
+            continue
+    return entries
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="src.ui.window", help="Module imported to reach the first window")
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="Maximum cumulative import time")
+    parser.add_argument("--top", type=int, default=15, help="How many of the slowest imports to list")
+    args = parser.parse_args()
+
+    entries = run_importtime(args.module)
+    if not entries:
+        raise SystemExit("No -X importtime output was captured")
+
+    failures = []
+
+    imported = {name for name, _, _ in entries}
+    for deferred in DEFERRED_MODULES:
+        if deferred in imported:
+            failures.append(f"'{deferred}' is imported at startup")
+
+    # Top-level entries (no leading indentation in the original output) sum to the total
+    total_ms = entries[-1][2] / 1000.0
+    for name, _, cumulative in entries:
+        if name == args.module:
+            total_ms = cumulative / 1000.0
+
+    print(f"Cumulative import time of {args.module}: {total_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    print(f"\nSlowest {args.top} imports (cumulative):")
+    for name, self_us, cumulative in sorted(entries, key=lambda e: e[2], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000.0:8.1f} ms  {self_us / 1000.0:8.1f} ms self  {name}")
+
+    if total_ms > args.budget_ms:
+        failures.append(f"import time {total_ms:.1f} ms exceeds the {args.budget_ms:.0f} ms budget")
+
+    if failures:
+        print("\nFAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("\nOK: no deferred modules imported at startup")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,9 @@
+import time
 from src.core.config import ConfigManager
-from src.core.providers.ollama import OllamaProvider
-from src.core.providers.openai_provider import OpenAIProvider
-from src.core.providers.google_provider import GoogleProvider
-from src.core.providers.anthropic_provider import AnthropicProvider
+from src.core.tracing import Tracer
+
+# Provider modules (and their SDKs) are imported inside _get_provider so
+# only the active provider's SDK is ever loaded.
 
 class AIClient:
     def __init__(self):
@@ -25,14 +26,19 @@ class AIClient:
             api_key = self.config.get("api_key", "")
 
         if provider_type == "ollama":
+            from src.core.providers.ollama import OllamaProvider
             return OllamaProvider(model)
         elif provider_type == "openai":
+            from src.core.providers.openai_provider import OpenAIProvider
             return OpenAIProvider(api_key, model_name=model)
         elif provider_type == "gemini":
+            from src.core.providers.google_provider import GoogleProvider
             return GoogleProvider(api_key, model_name=model)
         elif provider_type == "anthropic":
+            from src.core.providers.anthropic_provider import AnthropicProvider
             return AnthropicProvider(api_key, model_name=model)
         elif provider_type == "zai":
+            from src.core.providers.openai_provider import OpenAIProvider
             # Check if coding plan API should be used
             use_coding = self.config.get("zai_coding_plan", False)
             if use_coding:
@@ -41,21 +47,44 @@ class AIClient:
                 base_url = "https://api.z.ai/api/paas/v4/"
             return OpenAIProvider(api_key, base_url=base_url, model_name=model)
         elif provider_type == "mistral":
+            from src.core.providers.openai_provider import OpenAIProvider
             return OpenAIProvider(api_key, base_url="https://api.mistral.ai/v1", model_name=model)
         
+        from src.core.providers.ollama import OllamaProvider
         return OllamaProvider(model)
 
+    def _span(self, name, messages, tools):
+        return Tracer().span(
+            name, "llm",
+            provider=self.config.get("provider", "ollama"),
+            model=getattr(self.provider, "model_name", None),
+            messages=len(messages),
+            tools=len(tools or [])
+        )
+
     def generate_response(self, messages, tools=None):
-        try:
-            return self.provider.generate_response(messages, tools)
-        except Exception as e:
-            return {"message": {"content": f"Error: {str(e)}", "role": "assistant"}}
+        with self._span("llm.generate", messages, tools) as span:
+            try:
+                return self.provider.generate_response(messages, tools)
+            except Exception as e:
+                span.set(error=str(e))
+                return {"message": {"content": f"Error: {str(e)}", "role": "assistant"}}
 
     def stream_response(self, messages, tools=None):
-        try:
-            yield from self.provider.stream_response(messages, tools)
-        except Exception as e:
-            yield {"message": {"content": f"Error: {str(e)}", "role": "assistant"}}
+        with self._span("llm.stream", messages, tools) as span:
+            start = time.perf_counter()
+            chunks = 0
+            try:
+                for chunk in self.provider.stream_response(messages, tools):
+                    if chunks == 0:
+                        span.set(first_chunk_ms=round((time.perf_counter() - start) * 1000.0, 1))
+                    chunks += 1
+                    yield chunk
+            except Exception as e:
+                span.set(error=str(e))
+                yield {"message": {"content": f"Error: {str(e)}", "role": "assistant"}}
+            finally:
+                span.set(chunks=chunks)
 
     def list_models(self):
         return self.provider.list_models()
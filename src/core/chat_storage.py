@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 import shutil
+import threading
 from src.core.config import get_artifacts_dir
 
 
@@ -23,6 +24,46 @@ class ChatStorage:
             self.storage_dir = Path(xdg_data) / 'gaia' / 'chats'
         
         self.storage_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Metadata index (id -> title/dates/length) so listing chats never
+        # has to parse every conversation. Kept next to the chats folder.
+        self.index_path = self.storage_dir.parent / f"{self.storage_dir.name}_index.json"
+        self._index_lock = threading.Lock()
+        self._index = None
+    
+    @staticmethod
+    def _metadata(chat: dict) -> dict:
+        """Metadata entry for a chat (everything but the history)."""
+        return {
+            'id': chat['id'],
+            'title': chat.get('title', 'New Chat'),
+            'created_at': chat.get('created_at', ''),
+            'updated_at': chat.get('updated_at', ''),
+            '_history_length': len(chat.get('history', []))
+        }
+    
+    def _read_index(self) -> dict:
+        """Return the in-memory index, loading it from disk once. Caller holds the lock."""
+        if self._index is None:
+            self._index = {}
+            if self.index_path.exists():
+                try:
+                    with open(self.index_path, 'r', encoding='utf-8') as f:
+                        self._index = json.load(f)
+                except (json.JSONDecodeError, OSError):
+                    # Rebuilt from the chat files by list_chats()
+                    self._index = {}
+        return self._index
+    
+    def _write_index(self) -> None:
+        """Persist the index atomically. Caller holds the lock."""
+        try:
+            tmp_path = self.index_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._index, f, ensure_ascii=False)
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            print(f"[ChatStorage] Failed to write chat index: {e}")
     
     def create_chat(self, title: str = "New Chat", save: bool = True) -> dict:
         """Create a new chat with a unique ID.
@@ -50,6 +91,12 @@ class ChatStorage:
         file_path = self.storage_dir / f"{chat['id']}.json"
         with open(file_path, 'w', encoding='utf-8') as f:
             json.dump(chat, f, indent=2, ensure_ascii=False)
+        
+        with self._index_lock:
+            entry = self._metadata(chat)
+            entry['_mtime'] = file_path.stat().st_mtime
+            self._read_index()[chat['id']] = entry
+            self._write_index()
     
     def load_chat(self, chat_id: str, limit_messages: Optional[int] = None) -> Optional[dict]:
         """Load a single chat by ID. If limit_messages is provided, only load the most recent messages."""
@@ -76,29 +123,58 @@ class ChatStorage:
         except Exception as e:
             print(f"[ERROR] Failed to delete artifacts for {chat_id}: {e}")
 
+        with self._index_lock:
+            if self._read_index().pop(chat_id, None) is not None:
+                self._write_index()
+
         if file_path.exists():
             file_path.unlink()
             return True
         return False
     
     def list_chats(self) -> list[dict]:
-        """List all saved chats with metadata only (no history), sorted by updated_at (newest first)."""
-        chats = []
-        for file_path in self.storage_dir.glob('*.json'):
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    chat = json.load(f)
-                    # Only return metadata, not full history for better performance
-                    chats.append({
-                        'id': chat['id'],
-                        'title': chat.get('title', 'New Chat'),
-                        'created_at': chat.get('created_at', ''),
-                        'updated_at': chat.get('updated_at', ''),
-                        '_history_length': len(chat.get('history', []))
-                    })
-            except (json.JSONDecodeError, KeyError):
-                # Skip corrupted files
-                continue
+        """List all saved chats with metadata only (no history), sorted by updated_at (newest first).
+        
+        Served from the metadata index; only chat files that are new or were
+        modified outside the app are parsed.
+        """
+        with self._index_lock:
+            index = self._read_index()
+            changed = False
+            seen = set()
+            
+            for file_path in self.storage_dir.glob('*.json'):
+                chat_id = file_path.stem
+                seen.add(chat_id)
+                try:
+                    mtime = file_path.stat().st_mtime
+                except OSError:
+                    continue
+                
+                entry = index.get(chat_id)
+                if entry and entry.get('_mtime') == mtime:
+                    continue
+                
+                try:
+                    with open(file_path, 'r', encoding='utf-8') as f:
+                        chat = json.load(f)
+                    entry = self._metadata(chat)
+                    entry['_mtime'] = mtime
+                    index[chat_id] = entry
+                    changed = True
+                except (json.JSONDecodeError, KeyError, OSError):
+                    # Skip corrupted files
+                    continue
+            
+            for chat_id in list(index.keys()):
+                if chat_id not in seen:
+                    del index[chat_id]
+                    changed = True
+            
+            if changed:
+                self._write_index()
+            
+            chats = [{k: v for k, v in entry.items() if k != '_mtime'} for entry in index.values()]
         
         # Sort by updated_at, newest first
         chats.sort(key=lambda c: c.get('updated_at', ''), reverse=True)
@@ -111,6 +187,15 @@ class ChatStorage:
             chat['title'] = title
             self.save_chat(chat)
     
+    def update_last_message_metadata(self, chat_id: str, metadata: dict) -> bool:
+        """Merge metadata into the chat's last assistant message on disk (for chats with no open page)."""
+        chat = self.load_chat(chat_id)
+        if chat and chat.get('history') and chat['history'][-1]['role'] == 'assistant':
+            chat['history'][-1].setdefault('metadata', {}).update(metadata)
+            self.save_chat(chat)
+            return True
+        return False
+
     def add_message(self, chat_id: str, role: str, content: str, metadata: Optional[dict] = None) -> None:
         """Add a message to a chat and save."""
         chat = self.load_chat(chat_id)
@@ -1,6 +1,8 @@
 import asyncio
 import threading
 
+from src.core.tracing import Tracer
+
 class AsyncThreadingSemaphore:
     """
     An asyncio-compatible wrapper around a threading.Semaphore.
@@ -12,7 +14,8 @@ class AsyncThreadingSemaphore:
     async def __aenter__(self):
         # Acquire the semaphore in a thread pool to avoid blocking the event loop
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._sem.acquire)
+        with Tracer().span("llm.queue_wait", "queue"):
+            await loop.run_in_executor(None, self._sem.acquire)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
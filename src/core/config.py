@@ -18,7 +18,7 @@ class ConfigManager:
         "dr_max_results": 3,
         "dr_outline_steps": 5,
         "dr_search_breadth": 3,
-        "dr_max_scrape_length": 5000,
+        "dr_max_scrape_length": 15000,
         "scrape_settings": {
             "min_extracted_size": 250,
             "min_output_size": 1,
@@ -0,0 +1,225 @@
+"""
+Persistent per-domain favicon store.
+
+Keeps one icon file per domain in ~/.cache/gaia/favicons together with a
+small JSON index (domain -> source URL, file, negative-cache expiry).
+This module has no GTK dependency so the scraper can feed it the favicon
+URLs it extracts; the UI side (src/ui/images/favicons.py) only decodes.
+"""
+
+import os
+import json
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+USER_AGENT = "Mozilla/5.0 GaiaBot/1.0"
+FALLBACK_SERVICE = "https://www.google.com/s2/favicons?sz=64&domain={domain}"
+
+
+def get_favicon_cache_dir():
+    """Get the favicon cache directory in ~/.cache/gaia/favicons."""
+    cache_dir = os.path.expanduser("~/.cache/gaia/favicons")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def normalize_domain(url_or_domain: str) -> str:
+    """Reduce a URL or host to the key used for caching ('www.' is dropped)."""
+    if not url_or_domain:
+        return ""
+    host = url_or_domain
+    if "://" in url_or_domain:
+        host = urlparse(url_or_domain).hostname or ""
+    host = host.split("/")[0].split(":")[0].lower()
+    if host.startswith("www."):
+        host = host[4:]
+    return host
+
+
+class FaviconStore:
+    """
+    Singleton domain -> favicon file store with negative caching.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    MISSING_TTL = 7 * 24 * 3600   # Domains without an icon are not retried for a week
+    REFRESH_AFTER = 30 * 24 * 3600
+    REQUEST_TIMEOUT = 5
+    MAX_ICON_BYTES = 512 * 1024
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(FaviconStore, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.cache_dir = get_favicon_cache_dir()
+        self.index_file = os.path.join(self.cache_dir, "index.json")
+        self._state_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="gaia-favicon")
+        self._in_flight = {}  # domain -> Future
+        self._index = {}
+        self._load_index()
+
+    def _load_index(self):
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r") as f:
+                    self._index = json.load(f)
+            except Exception as e:
+                print(f"[FaviconStore] Error loading index: {e}")
+                self._index = {}
+
+    def _save_index(self):
+        """Persist the index. Caller holds the state lock."""
+        try:
+            tmp_path = self.index_file + ".tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(self._index, f)
+            os.replace(tmp_path, self.index_file)
+        except Exception as e:
+            print(f"[FaviconStore] Error saving index: {e}")
+
+    def _file_for(self, domain):
+        return os.path.join(self.cache_dir, hashlib.sha1(domain.encode("utf-8")).hexdigest() + ".icon")
+
+    # --- Lookups (cheap, safe to call from the main loop) ---
+
+    def get_path(self, domain: str):
+        """Return the cached icon path for a domain, or None."""
+        domain = normalize_domain(domain)
+        with self._state_lock:
+            entry = self._index.get(domain)
+        if entry and entry.get("file"):
+            path = os.path.join(self.cache_dir, entry["file"])
+            if os.path.exists(path):
+                return path
+        return None
+
+    def is_missing(self, domain: str) -> bool:
+        """True if the domain is known to have no usable icon (negative cache)."""
+        domain = normalize_domain(domain)
+        with self._state_lock:
+            entry = self._index.get(domain)
+        return bool(entry and entry.get("missing_until", 0) > time.time())
+
+    # --- Feeding ---
+
+    def remember(self, page_url: str, favicon_url: str = None, prefetch: bool = True):
+        """
+        Record the favicon URL found on a page (e.g. by scrape_url) and
+        download it in the background so later cards render without network.
+        """
+        domain = normalize_domain(page_url)
+        if not domain:
+            return
+
+        with self._state_lock:
+            entry = self._index.setdefault(domain, {})
+            changed = bool(favicon_url) and entry.get("source") != favicon_url
+            if changed:
+                entry["source"] = favicon_url
+                # A new source deserves a new attempt even if we failed before
+                entry.pop("missing_until", None)
+                self._save_index()
+
+        if prefetch:
+            needs_fetch = changed or self.get_path(domain) is None
+            if needs_fetch and not self.is_missing(domain):
+                self.fetch_async(domain)
+
+    def mark_missing(self, domain: str):
+        """Negative-cache a domain (e.g. when its icon cannot be decoded)."""
+        domain = normalize_domain(domain)
+        with self._state_lock:
+            entry = self._index.setdefault(domain, {})
+            path = os.path.join(self.cache_dir, entry["file"]) if entry.get("file") else None
+            entry["file"] = None
+            entry["missing_until"] = time.time() + self.MISSING_TTL
+            self._save_index()
+        if path and os.path.exists(path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    # --- Fetching ---
+
+    def fetch_async(self, domain: str, callback=None):
+        """
+        Fetch a domain's icon on the store's worker pool.
+        callback(path_or_None) runs on the worker thread. Requests for the
+        same domain are coalesced.
+        """
+        domain = normalize_domain(domain)
+        with self._state_lock:
+            future = self._in_flight.get(domain)
+            if future is None:
+                future = self._executor.submit(self.fetch, domain)
+                self._in_flight[domain] = future
+                future.add_done_callback(lambda f, d=domain: self._in_flight.pop(d, None))
+        if callback:
+            future.add_done_callback(lambda f: callback(f.result() if not f.exception() else None))
+        return future
+
+    def fetch(self, domain: str):
+        """Blocking fetch. Returns the icon path or None (and negative-caches)."""
+        domain = normalize_domain(domain)
+        if not domain:
+            return None
+
+        path = self.get_path(domain)
+        with self._state_lock:
+            entry = dict(self._index.get(domain, {}))
+        if path and time.time() - entry.get("fetched_at", 0) < self.REFRESH_AFTER:
+            return path
+        if entry.get("missing_until", 0) > time.time():
+            return None
+
+        candidates = []
+        if entry.get("source"):
+            candidates.append(entry["source"])
+        candidates.append(FALLBACK_SERVICE.format(domain=domain))
+
+        from src.core.network.http_client import get_session
+        answered = False
+        for url in candidates:
+            try:
+                resp = get_session().get(url, headers={"User-Agent": USER_AGENT}, timeout=self.REQUEST_TIMEOUT)
+                answered = True
+                content_type = resp.headers.get("Content-Type", "")
+                if (resp.status_code != 200 or not resp.content or
+                        len(resp.content) > self.MAX_ICON_BYTES or
+                        content_type.startswith("text/")):
+                    continue
+
+                target = self._file_for(domain)
+                tmp_path = target + ".part"
+                with open(tmp_path, "wb") as f:
+                    f.write(resp.content)
+                os.replace(tmp_path, target)
+
+                with self._state_lock:
+                    stored = self._index.setdefault(domain, {})
+                    stored["file"] = os.path.basename(target)
+                    stored["fetched_at"] = time.time()
+                    stored.pop("missing_until", None)
+                    self._save_index()
+                return target
+            except Exception as e:
+                print(f"[FaviconStore] Failed to fetch {url}: {e}")
+
+        if path:
+            # Keep serving the old icon if a refresh failed
+            return path
+
+        # Only negative-cache real answers, not being offline
+        if answered:
+            self.mark_missing(domain)
+        return None
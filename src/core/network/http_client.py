@@ -1,63 +1,225 @@
+"""
+Shared, long-lived HTTP clients for every outbound fetch.
+
+Creating a client per request throws away the TCP and TLS connections. The
+clients here are created once and reused:
+
+    get_session()          requests.Session for sync code (scraper, tools, UI)
+    get_httpx_client()     httpx.Client for the provider SDKs (HTTP/2 if h2 is installed)
+    get_aiohttp_session()  aiohttp.ClientSession, one per event loop
+    get_ollama_client()    ollama.Client
+
+All of them follow the proxy / Tor settings and are rebuilt when those
+change. The aiohttp connector caches hostname lookups for `dns_cache_ttl`
+seconds; requests and httpx resolve once per pooled connection.
+"""
+
+import threading
+import weakref
 
-import os
-import httpx
 from src.core.config import ConfigManager
 
-def get_httpx_client(timeout=1200.0):
-    """
-    Creates an httpx.Client configured with the global proxy settings.
-    Handles SOCKS proxies via httpx_socks if needed.
-    """
+USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+
+DEFAULT_POOL_SIZE = 16       # Keep-alive connections per host (config: http_pool_size)
+DEFAULT_DNS_CACHE_TTL = 300  # Seconds (config: dns_cache_ttl, 0 disables)
+
+_lock = threading.Lock()
+_session = None
+_session_proxy = None
+_httpx_clients = {}          # (timeout, proxy) -> httpx.Client
+_ollama_clients = {}         # (host, timeout, proxy) -> ollama.Client
+_aiohttp_sessions = weakref.WeakKeyDictionary()  # event loop -> (aiohttp.ClientSession, proxy)
+
+
+def get_proxy_url():
+    """The configured proxy URL with a scheme, or None if the proxy is off."""
     config = ConfigManager()
     proxy_url = config.get("proxy_url", "").strip()
-    enabled = config.get("proxy_enabled", False)
-
-    # If proxy disabled or empty, return None to let SDKs use defaults (or create standard client)
-    if not enabled or not proxy_url:
-        return httpx.Client(timeout=timeout)
+    if not config.get("proxy_enabled", False) or not proxy_url:
+        return None
 
-    # Standardize scheme if missing
+    # Standardize scheme if missing (a bare Tor port is a common mistake)
     if "://" not in proxy_url:
-        if (proxy_url.startswith("localhost:9050") or proxy_url.startswith("127.0.0.1:9050") or 
+        if (proxy_url.startswith("localhost:9050") or proxy_url.startswith("127.0.0.1:9050") or
             proxy_url == "9050"):
             proxy_url = "socks5://" + proxy_url
         else:
-            proxy_url = "http://" + proxy_url 
+            proxy_url = "http://" + proxy_url
+    return proxy_url
 
-    print(f"[Network] Configured Proxy: {proxy_url}")
 
-    if proxy_url.startswith("socks"):
+def _pool_size():
+    return int(ConfigManager().get("http_pool_size", DEFAULT_POOL_SIZE))
+
+
+# --- Clients ---
+
+def get_session():
+    """The shared requests.Session. Safe to use from several threads for plain requests."""
+    global _session, _session_proxy
+    proxy_url = get_proxy_url()
+    with _lock:
+        if _session is None or _session_proxy != proxy_url:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            session.headers.update({"User-Agent": USER_AGENT})
+            adapter = HTTPAdapter(pool_connections=_pool_size(), pool_maxsize=_pool_size())
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            if proxy_url:
+                # SOCKS URLs need PySocks (requests[socks])
+                session.proxies.update({"http": proxy_url, "https": proxy_url})
+            _session = session
+            _session_proxy = proxy_url
+        return _session
+
+
+def _httpx_kwargs(timeout):
+    import httpx
+    kwargs = {
+        "timeout": timeout,
+        "limits": httpx.Limits(max_keepalive_connections=_pool_size(), keepalive_expiry=60.0),
+    }
+    try:
+        import h2  # noqa: F401  (optional, enables HTTP/2)
+        kwargs["http2"] = True
+    except ImportError:
+        pass
+    return kwargs
+
+
+def get_httpx_client(timeout=1200.0):
+    """
+    The shared httpx.Client for this timeout, configured with the global proxy settings.
+    Handles SOCKS proxies via httpx_socks if needed.
+    """
+    import httpx
+    proxy_url = get_proxy_url()
+    key = (timeout, proxy_url)
+    with _lock:
+        client = _httpx_clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+
+        kwargs = _httpx_kwargs(timeout)
+        if proxy_url:
+            print(f"[Network] Configured Proxy: {proxy_url}")
+
+        if proxy_url and proxy_url.startswith("socks"):
+            try:
+                from httpx_socks import SyncTransport
+                kwargs["transport"] = SyncTransport.from_url(proxy_url)
+            except ImportError:
+                print("Error: httpx-socks not installed. Cannot use SOCKS proxy.")
+            except Exception as e:
+                print(f"Error creating SOCKS transport: {e}")
+        elif proxy_url:
+            # Standard HTTP/HTTPS proxy
+            kwargs["proxy"] = proxy_url
+
+        client = httpx.Client(**kwargs)
+        _httpx_clients[key] = client
+        return client
+
+
+def get_async_httpx_client(timeout=1200.0):
+    """
+    Creates an httpx.AsyncClient with proxy support. Async clients are bound
+    to one event loop, so the caller owns (and closes) the returned client.
+    """
+    import httpx
+    proxy_url = get_proxy_url()
+    kwargs = _httpx_kwargs(timeout)
+
+    if proxy_url and proxy_url.startswith("socks"):
         try:
-            from httpx_socks import SyncTransport
-            transport = SyncTransport.from_url(proxy_url)
-            return httpx.Client(transport=transport, timeout=timeout)
+            from httpx_socks import AsyncTransport
+            kwargs["transport"] = AsyncTransport.from_url(proxy_url)
         except ImportError:
-            print("Error: httpx-socks not installed. Cannot use SOCKS proxy.")
-            return httpx.Client(timeout=timeout)
-        except Exception as e:
-            print(f"Error creating SOCKS transport: {e}")
-            return httpx.Client(timeout=timeout)
-    else:
-        # Standard HTTP/HTTPS proxy
-        return httpx.Client(proxy=proxy_url, timeout=timeout)
+            pass
+    elif proxy_url:
+        kwargs["proxy"] = proxy_url
+    return httpx.AsyncClient(**kwargs)
 
-def get_async_httpx_client(timeout=1200.0):
+
+def get_ollama_client(host=None, timeout=1200.0):
+    """The shared ollama.Client (keeps its connection to the Ollama server open)."""
+    import ollama
+    proxy_url = get_proxy_url()
+    key = (host, timeout, proxy_url)
+    with _lock:
+        client = _ollama_clients.get(key)
+        if client is None:
+            # ollama.Client picks the proxy up from the environment (apply_proxy_settings)
+            client = ollama.Client(host=host, timeout=timeout)
+            _ollama_clients[key] = client
+        return client
+
+
+def get_aiohttp_session():
     """
-    Creates an httpx.AsyncClient with proxy support.
+    The aiohttp.ClientSession of the running event loop. Must be called from a
+    coroutine; call close_aiohttp_session() before closing a short-lived loop.
     """
-    config = ConfigManager()
-    proxy_url = config.get("proxy_url", "").strip()
-    enabled = config.get("proxy_enabled", False)
+    import asyncio
+    import aiohttp
 
-    if not enabled or not proxy_url:
-        return httpx.AsyncClient(timeout=timeout)
+    loop = asyncio.get_running_loop()
+    proxy_url = get_proxy_url()
+    with _lock:
+        entry = _aiohttp_sessions.get(loop)
+        if entry is not None and not entry[0].closed:
+            if entry[1] == proxy_url:
+                return entry[0]
+            loop.create_task(entry[0].close())  # Proxy changed: retire the old session
 
-    if proxy_url.startswith("socks"):
+    ttl = int(ConfigManager().get("dns_cache_ttl", DEFAULT_DNS_CACHE_TTL))
+    connector_kwargs = {
+        "limit": _pool_size() * 4,
+        "limit_per_host": _pool_size(),
+        "use_dns_cache": bool(ttl),
+        "ttl_dns_cache": ttl or None,
+    }
+    connector = None
+    if proxy_url and proxy_url.startswith("socks"):
         try:
-            from httpx_socks import AsyncTransport
-            transport = AsyncTransport.from_url(proxy_url)
-            return httpx.AsyncClient(transport=transport, timeout=timeout)
+            from aiohttp_socks import ProxyConnector
+            connector = ProxyConnector.from_url(proxy_url, **connector_kwargs)
         except ImportError:
-            return httpx.AsyncClient(timeout=timeout)
-    else:
-        return httpx.AsyncClient(proxy=proxy_url, timeout=timeout)
+            print("Error: aiohttp-socks not installed. Cannot use SOCKS proxy.")
+    if connector is None:
+        connector = aiohttp.TCPConnector(**connector_kwargs)
+
+    # trust_env applies HTTP(S)_PROXY set by apply_proxy_settings
+    session = aiohttp.ClientSession(connector=connector, trust_env=True, headers={"User-Agent": USER_AGENT})
+    with _lock:
+        _aiohttp_sessions[loop] = (session, proxy_url)
+    return session
+
+
+async def close_aiohttp_session():
+    """Close the running loop's aiohttp session, if it has one."""
+    import asyncio
+    with _lock:
+        entry = _aiohttp_sessions.pop(asyncio.get_running_loop(), None)
+    if entry is not None and not entry[0].closed:
+        await entry[0].close()
+
+
+def reset_clients():
+    """
+    Drop every shared client so the next request opens fresh connections
+    (after a proxy change or a new Tor identity). Old clients are not closed
+    here because other threads may still be using them.
+    """
+    global _session, _session_proxy
+    with _lock:
+        _session = None
+        _session_proxy = None
+        _httpx_clients.clear()
+        _ollama_clients.clear()
+    # aiohttp sessions belong to their loops; they are replaced on their next use
+    # after a proxy change and closed by close_aiohttp_session()
@@ -34,3 +34,7 @@ def apply_proxy_settings():
             del os.environ["HTTPS_PROXY"]
         if "ALL_PROXY" in os.environ:
             del os.environ["ALL_PROXY"]
+
+    # Shared clients were built for the previous settings
+    from src.core.network.http_client import reset_clients
+    reset_clients()
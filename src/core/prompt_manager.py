@@ -82,9 +82,11 @@ class PromptManager:
                 return val # Return raw if formatting fails or no args matching
         return val
 
-    def get_system_prompt(self, enabled_tools_map):
+    def get_system_prompt(self, enabled_tools_map, selected_tools=None):
         """
         Generates the full system prompt based on enabled tools.
+        If selected_tools is given (see ToolSelector), guidelines of enabled
+        tools that are not offered this turn are left out.
         """
         p = self.prompts
         guidelines = []
@@ -93,16 +95,21 @@ class PromptManager:
         def is_enabled(name):
             return enabled_tools_map.get(name, True)
 
+        def is_offered(name):
+            return selected_tools is None or name in selected_tools
+
         # 1. WEB PROJECTS
         if is_enabled("web_builder"):
-            guidelines.append(p["guidelines"]["web_builder_enabled"])
+            if is_offered("web_builder"):
+                guidelines.append(p["guidelines"]["web_builder_enabled"])
         else:
             guidelines.append(p["guidelines"]["web_builder_disabled"])
 
         # 2. TARGETED EDITS (List of strings in JSON)
         if is_enabled("file_editor"):
-            for line in p["guidelines"]["file_editor_enabled"]:
-                guidelines.append(line)
+            if any(is_offered(t) for t in ["file_editor", "file_list", "file_reader"]):
+                for line in p["guidelines"]["file_editor_enabled"]:
+                    guidelines.append(line)
         else:
             guidelines.append(p["guidelines"]["file_editor_disabled"])
 
@@ -111,12 +118,13 @@ class PromptManager:
 
         # 4. WEB SEARCH
         if is_enabled("web_search"):
-            guidelines.append(p["guidelines"]["web_search_enabled"])
+            if is_offered("web_search"):
+                guidelines.append(p["guidelines"]["web_search_enabled"])
         else:
             guidelines.append(p["guidelines"]["web_search_disabled"])
 
         # 5. CALENDAR
-        if any(is_enabled(t) for t in ["calendar_add_event", "calendar_list_events"]):
+        if any(is_enabled(t) and is_offered(t) for t in ["calendar_add_event", "calendar_list_events"]):
             current_time_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             calendar_prompt = p["guidelines"]["calendar_enabled"].format(current_time=current_time_str)
             guidelines.append(calendar_prompt)
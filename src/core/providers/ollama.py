@@ -1,5 +1,5 @@
-import ollama
 from src.core.providers.base import BaseProvider
+from src.core.network.http_client import get_ollama_client
 
 class OllamaProvider(BaseProvider):
     def __init__(self, model_name="granite4:latest"):
@@ -10,7 +10,7 @@ class OllamaProvider(BaseProvider):
         if tools:
             kwargs['tools'] = tools
         
-        client = ollama.Client(timeout=1200.0)
+        client = get_ollama_client(timeout=1200.0)
         return client.chat(model=self.model_name, messages=messages, **kwargs)
 
     def stream_response(self, messages, tools=None):
@@ -20,7 +20,7 @@ class OllamaProvider(BaseProvider):
         
         # Use a custom client with increased timeout to prevent "Read operation timed out"
         # during long code generation tasks.
-        client = ollama.Client(timeout=1200.0) 
+        client = get_ollama_client(timeout=1200.0)
         stream = client.chat(model=self.model_name, messages=messages, **kwargs)
         
         for chunk in stream:
@@ -60,7 +60,7 @@ class OllamaProvider(BaseProvider):
 
     def list_models(self):
         try:
-            response = ollama.list()
+            response = get_ollama_client().list()
             models = []
             raw_models = []
             if isinstance(response, dict):
@@ -0,0 +1,306 @@
+"""
+Lightweight structured tracing.
+
+Spans are grouped into runs (an agent turn, a deep research job, a web
+build). A finished run is written as a Chrome trace / Perfetto JSON file to
+~/.gaia/traces and a per-span summary table is printed.
+
+Tracing is off unless the `tracing_enabled` config key or the GAIA_TRACE
+environment variable is set (checked whenever a run starts). When off,
+`span()` returns a shared no-op object, so instrumented code pays a single
+attribute check.
+
+Usage:
+    tracer = Tracer()
+    with tracer.run("agent_turn", chat_id=chat_id):
+        with tracer.span("llm.stream", "llm", model=model) as span:
+            ...
+            span.set(chunks=n)
+
+The current run is carried in a contextvar, so it follows asyncio tasks.
+Functions handed to thread pools must be wrapped with bind_context().
+"""
+
+import asyncio
+import contextvars
+import functools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from src.core.config import ConfigManager
+
+_current_run = contextvars.ContextVar("gaia_trace_run", default=None)
+
+
+def get_traces_dir():
+    """Directory holding exported trace files (~/.gaia/traces)."""
+    traces_dir = os.path.join(Path.home(), ".gaia", "traces")
+    os.makedirs(traces_dir, exist_ok=True)
+    return traces_dir
+
+
+def bind_context(fn, *args, **kwargs):
+    """
+    Bind fn to the caller's context (and so to the current trace run) before
+    handing it to a thread pool, e.g. loop.run_in_executor(None, bind_context(fn, x)).
+    """
+    ctx = contextvars.copy_context()
+    return functools.partial(ctx.run, fn, *args, **kwargs)
+
+
+class _NoopSpan:
+    """Returned when tracing is disabled or no run is active."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, **attrs):
+        pass
+
+
+class _NoopRun(_NoopSpan):
+    def activate(self):
+        return self
+
+    def finish(self, **attrs):
+        return None
+
+
+_NOOP_SPAN = _NoopSpan()
+_NOOP_RUN = _NoopRun()
+
+
+class Span:
+    """A timed section of work recorded as a Chrome trace "complete" event."""
+    __slots__ = ("run", "name", "category", "attrs", "_start")
+
+    def __init__(self, run, name, category, attrs):
+        self.run = run
+        self.name = name
+        self.category = category
+        self.attrs = attrs
+        self._start = 0
+
+    def __enter__(self):
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.attrs["error"] = exc_type.__name__
+        self.run.add_event(self.name, self.category, self._start, end, self.attrs)
+        return False
+
+    def set(self, **attrs):
+        """Attach attributes discovered while the span runs (sizes, counts, outcomes)."""
+        self.attrs.update(attrs)
+
+
+class TraceRun:
+    """Collects the events of one run and exports them when finished."""
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.events = []
+        self.started_at = datetime.now()
+        self._start = time.perf_counter_ns()
+        self._lock = threading.Lock()
+        self._lanes = {}  # (thread id, task id) -> lane number shown as a "thread" in Perfetto
+        self._finished = False
+
+    def _lane(self):
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = (threading.get_ident(), id(task) if task else 0)
+        lane = self._lanes.get(key)
+        if lane is None:
+            lane = len(self._lanes) + 1
+            self._lanes[key] = lane
+            label = threading.current_thread().name
+            if task:
+                label += f" / {task.get_name()}"
+            self.events.append({
+                "name": "thread_name", "ph": "M", "pid": 1, "tid": lane,
+                "args": {"name": label}
+            })
+        return lane
+
+    def add_event(self, name, category, start_ns, end_ns, attrs):
+        with self._lock:
+            if self._finished:
+                return
+            self.events.append({
+                "name": name,
+                "cat": category or "default",
+                "ph": "X",
+                "ts": (start_ns - self._start) / 1000.0,
+                "dur": (end_ns - start_ns) / 1000.0,
+                "pid": 1,
+                "tid": self._lane(),
+                "args": attrs,
+            })
+
+    def activate(self):
+        """Context manager making this run current (e.g. for a callback on another thread)."""
+        return _RunActivation(self)
+
+    def finish(self, **attrs):
+        """Export the trace file and print the summary. Returns the file path."""
+        with self._lock:
+            if self._finished:
+                return None
+            self._finished = True
+            self.attrs.update(attrs)
+            duration_ns = time.perf_counter_ns() - self._start
+            events = list(self.events)
+
+        events.insert(0, {
+            "name": self.name, "cat": "run", "ph": "X", "ts": 0,
+            "dur": duration_ns / 1000.0, "pid": 1, "tid": 0, "args": self.attrs
+        })
+        events.insert(0, {"name": "process_name", "ph": "M", "pid": 1, "args": {"name": f"gaia: {self.name}"}})
+
+        path = os.path.join(
+            get_traces_dir(),
+            f"{self.started_at.strftime('%Y%m%d-%H%M%S')}-{self.name}-{id(self) & 0xffff:04x}.json"
+        )
+        try:
+            with open(path, "w") as f:
+                json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f, default=str)
+        except OSError as e:
+            print(f"[Tracing] Could not write trace: {e}")
+            path = None
+
+        print(self.summary(duration_ns))
+        if path:
+            print(f"[Tracing] Trace written to {path} (open in ui.perfetto.dev or chrome://tracing)")
+        return path
+
+    def summary(self, duration_ns=None) -> str:
+        """Per-span-name table: count, total, average, max and share of the run's wall time."""
+        if duration_ns is None:
+            duration_ns = time.perf_counter_ns() - self._start
+        wall_ms = duration_ns / 1e6
+
+        totals = {}
+        with self._lock:
+            for event in self.events:
+                if event.get("ph") != "X":
+                    continue
+                entry = totals.setdefault(event["name"], [0, 0.0, 0.0])
+                ms = event["dur"] / 1000.0
+                entry[0] += 1
+                entry[1] += ms
+                entry[2] = max(entry[2], ms)
+
+        lines = [
+            f"[Tracing] Run '{self.name}' took {wall_ms / 1000.0:.2f} s",
+            f"  {'span':<32} {'count':>6} {'total ms':>11} {'avg ms':>9} {'max ms':>9} {'% wall':>7}",
+        ]
+        for name, (count, total, longest) in sorted(totals.items(), key=lambda item: item[1][1], reverse=True):
+            share = (total / wall_ms * 100.0) if wall_ms else 0.0
+            lines.append(f"  {name[:32]:<32} {count:>6} {total:>11.1f} {total / count:>9.1f} {longest:>9.1f} {share:>6.1f}%")
+        return "\n".join(lines)
+
+
+class _RunActivation:
+    def __init__(self, run):
+        self.run = run
+        self._token = None
+
+    def __enter__(self):
+        self._token = _current_run.set(self.run)
+        return self.run
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_run.reset(self._token)
+        return False
+
+
+class _RunScope:
+    """`with tracer.run(...)`: starts, activates and finishes a run."""
+
+    def __init__(self, tracer, name, attrs):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.run = None
+        self._token = None
+
+    def __enter__(self):
+        self.run = self.tracer.start_run(self.name, **self.attrs)
+        self._token = _current_run.set(self.run)
+        return self.run
+
+    def __exit__(self, exc_type, exc, tb):
+        _current_run.reset(self._token)
+        if exc_type is not None:
+            self.run.finish(error=exc_type.__name__)
+        else:
+            self.run.finish()
+        return False
+
+
+class Tracer:
+    """Singleton entry point for tracing."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(Tracer, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = ConfigManager()
+        self.enabled = False
+        self.refresh()
+
+    def refresh(self):
+        """Re-read the enabled flag (config `tracing_enabled` or env GAIA_TRACE)."""
+        env = os.environ.get("GAIA_TRACE", "").lower() in ("1", "true", "yes", "on")
+        self.enabled = env or bool(self.config.get("tracing_enabled", False))
+        return self.enabled
+
+    def start_run(self, name, **attrs):
+        """Start a run that is finished explicitly (for work that ends in a callback)."""
+        if not self.refresh():
+            return _NOOP_RUN
+        return TraceRun(self, name, attrs)
+
+    def run(self, name, **attrs):
+        """
+        Context manager for a run. Inside an active run it only opens a span,
+        so e.g. web builder planning shows up inside the agent turn that called it.
+        """
+        if not self.refresh():
+            return _NOOP_RUN
+        if _current_run.get() is not None:
+            return self.span(name, "run", **attrs)
+        return _RunScope(self, name, attrs)
+
+    def span(self, name, category="", **attrs):
+        """Time a section of work in the current run (no-op outside a run)."""
+        if not self.enabled:
+            return _NOOP_SPAN
+        run = _current_run.get()
+        if run is None:
+            return _NOOP_SPAN
+        return Span(run, name, category, attrs)
+
+    def current_run(self):
+        return _current_run.get()
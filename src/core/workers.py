@@ -0,0 +1,170 @@
+"""
+Shared worker processes for CPU-heavy work.
+
+HTML extraction, PDF/DOCX text extraction and report rendering hold the GIL
+for long stretches. Running them in the GTK process makes the UI stutter
+during deep research, so they are sent to a small pool of warm worker
+processes instead. The heavy libraries are pre-imported when a worker starts.
+
+Jobs must be module-level functions with picklable arguments and results.
+A crashing worker (segfault, OOM kill) only breaks the pool. The pool is
+rebuilt and the caller gets a WorkerCrashedError instead of losing the app.
+
+Config keys:
+    worker_processes        number of workers (0 runs jobs in-process)
+    worker_memory_limit_mb  address-space limit per worker (0 disables)
+    worker_max_tasks        jobs before a worker is recycled
+"""
+
+import concurrent.futures
+import multiprocessing
+import os
+import threading
+from concurrent.futures.process import BrokenProcessPool
+
+from src.core.config import ConfigManager
+
+DEFAULT_MEMORY_LIMIT_MB = 1536
+DEFAULT_MAX_TASKS = 50
+
+# Imported by every worker on start so the first job does not pay for them
+PRELOAD_MODULES = ["lxml.html", "bs4", "trafilatura", "pypdf", "docx", "markdown", "weasyprint"]
+
+
+class WorkerCrashedError(RuntimeError):
+    """A worker process died while running a job."""
+
+
+def _default_workers():
+    return max(1, min(4, (os.cpu_count() or 2) // 2))
+
+
+def _worker_init(memory_limit_mb, preload):
+    """Runs once in each worker process."""
+    if memory_limit_mb:
+        try:
+            import resource
+            limit = memory_limit_mb * 1024 * 1024
+            resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+        except (ImportError, ValueError, OSError) as e:
+            print(f"[Workers] Could not set memory limit: {e}")
+
+    # Background work must never compete with the UI process
+    try:
+        os.nice(5)
+    except OSError:
+        pass
+
+    import importlib
+    for name in preload:
+        try:
+            importlib.import_module(name)
+        except Exception:
+            pass  # Optional dependency; the job itself reports the ImportError
+
+
+def _ping():
+    return os.getpid()
+
+
+class WorkerPool:
+    """Singleton around a spawn-based ProcessPoolExecutor."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(WorkerPool, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = ConfigManager()
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self.restarts = 0
+
+    @property
+    def max_workers(self) -> int:
+        return int(self.config.get("worker_processes", _default_workers()))
+
+    def _get_executor(self):
+        with self._executor_lock:
+            if self._executor is None and self.max_workers > 0:
+                try:
+                    # Never fork a GTK process: spawn fresh interpreters instead
+                    self._executor = concurrent.futures.ProcessPoolExecutor(
+                        max_workers=self.max_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_worker_init,
+                        initargs=(
+                            int(self.config.get("worker_memory_limit_mb", DEFAULT_MEMORY_LIMIT_MB)),
+                            PRELOAD_MODULES,
+                        ),
+                        max_tasks_per_child=int(self.config.get("worker_max_tasks", DEFAULT_MAX_TASKS)),
+                    )
+                except (OSError, ValueError) as e:
+                    print(f"[Workers] Process pool unavailable, running jobs in-process: {e}")
+                    self._executor = None
+            return self._executor
+
+    def _restart(self, broken):
+        """Drop a broken executor; the next job starts a fresh one."""
+        with self._executor_lock:
+            if self._executor is broken:
+                self._executor = None
+                self.restarts += 1
+                print(f"[Workers] A worker process crashed, restarting the pool (restart #{self.restarts})")
+        try:
+            broken.shutdown(wait=False, cancel_futures=True)
+        except Exception:
+            pass
+
+    def warm_up(self):
+        """Start the workers in the background so their imports are done before the first job."""
+        def run():
+            executor = self._get_executor()
+            if executor is None:
+                return
+            try:
+                for future in [executor.submit(_ping) for _ in range(self.max_workers)]:
+                    future.result()
+            except BrokenProcessPool:
+                self._restart(executor)
+            except Exception as e:
+                print(f"[Workers] Warm-up failed: {e}")
+
+        threading.Thread(target=run, name="gaia-worker-warmup", daemon=True).start()
+
+    def run(self, fn, *args, timeout: float = None):
+        """
+        Run fn(*args) in a worker and return its result. Exceptions raised by
+        fn are re-raised here. Raises WorkerCrashedError if the worker died and
+        concurrent.futures.TimeoutError if the timeout expired.
+        """
+        executor = self._get_executor()
+        if executor is None:
+            return fn(*args)
+
+        try:
+            future = executor.submit(fn, *args)
+        except (BrokenProcessPool, RuntimeError):
+            # Broken or shut down between _get_executor and submit: retry once on a fresh pool
+            self._restart(executor)
+            executor = self._get_executor()
+            if executor is None:
+                return fn(*args)
+            future = executor.submit(fn, *args)
+
+        try:
+            return future.result(timeout=timeout)
+        except BrokenProcessPool as e:
+            self._restart(executor)
+            raise WorkerCrashedError(f"Worker crashed while running {fn.__name__}") from e
+
+    def shutdown(self):
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
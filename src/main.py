@@ -16,10 +16,12 @@ if project_root not in sys.path:
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, Gdk
-from src.ui.window import MainWindow
+from gi.repository import Gtk, Adw, Gdk, GLib
 from src.core.chat_storage import ChatStorage
 
+# Seconds after the first window before worker processes are started
+WORKER_WARM_UP_DELAY = 5
+
 class GaiaApplication(Adw.Application):
     def __init__(self):
         super().__init__(application_id='io.github.askscience.gaia',
@@ -35,11 +37,25 @@ class GaiaApplication(Adw.Application):
             if windows:
                 win = windows[0]
             else:
+                # Imported here: spawned worker processes re-import this module
+                # and must not load the whole UI
+                from src.ui.window import MainWindow
                 win = MainWindow(storage=self.storage, application=self)
                 self.load_css()
+                GLib.timeout_add_seconds(WORKER_WARM_UP_DELAY, self._warm_up_workers)
         
         win.present()
 
+    def _warm_up_workers(self):
+        from src.core.workers import WorkerPool
+        WorkerPool().warm_up()
+        return False
+
+    def do_shutdown(self):
+        from src.core.workers import WorkerPool
+        WorkerPool().shutdown()
+        Adw.Application.do_shutdown(self)
+
     def load_css(self):
         # Add project root to icon theme search path
         icon_theme = Gtk.IconTheme.get_for_display(Gdk.Display.get_default())
@@ -71,4 +87,7 @@ def main():
     return app.run(sys.argv)
 
 if __name__ == '__main__':
+    # Needed by the worker processes in frozen (PyInstaller) builds
+    import multiprocessing
+    multiprocessing.freeze_support()
     sys.exit(main())
@@ -1,6 +1,10 @@
 from abc import ABC, abstractmethod
 
 class BaseTool(ABC):
+    # Seconds the agent loop waits for this tool before giving up (None: no limit).
+    # Users can override it per tool with the `tool_timeouts` config map.
+    timeout = 120
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -22,6 +26,14 @@ class BaseTool(ABC):
     def execute(self, **kwargs):
         pass
 
+    async def aexecute(self, **kwargs):
+        """
+        Optional coroutine version of execute(). Tools that override it run on
+        the shared tool event loop (see ToolExecutor) instead of a worker thread,
+        and are cancelled through asyncio when the user presses Stop.
+        """
+        raise NotImplementedError
+
     def to_ollama_format(self):
         return {
             'type': 'function',
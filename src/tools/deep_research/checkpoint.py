@@ -0,0 +1,159 @@
+"""
+Checkpoints of deep research runs.
+
+Every run gets a directory under ~/.gaia/artifacts/<project>/deepresearch/
+(the report is saved there too). DeepResearchGraph writes checkpoint.json
+after each stage: the outline, the section plans, the image pool, every
+finished section with its notes, and the page summaries paid for so far.
+A run that was closed, crashed or failed can be resumed from it: finished
+work is loaded instead of being redone and only the missing sections run.
+"""
+
+import dataclasses
+import json
+import os
+import time
+
+from src.core.config import get_artifacts_dir
+from src.tools.deep_research.state import ResearchNote
+
+CHECKPOINT_FILE = "checkpoint.json"
+
+STATUS_RUNNING = "running"
+STATUS_COMPLETED = "completed"
+STATUS_CANCELLED = "cancelled"
+STATUS_FAILED = "failed"
+
+
+def get_runs_dir(project_id: str) -> str:
+    return os.path.join(get_artifacts_dir(), project_id, "deepresearch")
+
+
+class RunCheckpoint:
+    """The persisted progress of one deep research run."""
+
+    def __init__(self, run_dir: str, data: dict):
+        self.run_dir = run_dir
+        self.data = data
+
+    @classmethod
+    def create(cls, project_id: str, query: str) -> "RunCheckpoint":
+        run_dir = os.path.join(get_runs_dir(project_id), f"research_{int(time.time())}")
+        os.makedirs(run_dir, exist_ok=True)
+        checkpoint = cls(run_dir, {
+            "query": query,
+            "project_id": project_id,
+            "status": STATUS_RUNNING,
+            "created": time.time(),
+            "outline": None,
+            "section_plans": {},
+            "images": None,
+            "sections": {},
+            "page_summaries": {},
+        })
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_dir: str):
+        try:
+            with open(os.path.join(run_dir, CHECKPOINT_FILE), "r", encoding="utf-8") as f:
+                return cls(run_dir, json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    @classmethod
+    def find_resumable(cls, project_id: str, query: str = None):
+        """The newest unfinished run of the project (for this query, if given), or None."""
+        runs_dir = get_runs_dir(project_id)
+        try:
+            names = sorted(os.listdir(runs_dir), reverse=True)
+        except OSError:
+            return None
+        for name in names:
+            checkpoint = cls.load(os.path.join(runs_dir, name))
+            if not checkpoint or checkpoint.status == STATUS_COMPLETED:
+                continue
+            if query and checkpoint.query.strip().lower() != query.strip().lower():
+                continue
+            return checkpoint
+        return None
+
+    def save(self):
+        """Write atomically, so a crash never leaves half a checkpoint."""
+        self.data["updated"] = time.time()
+        path = os.path.join(self.run_dir, CHECKPOINT_FILE)
+        try:
+            with open(path + ".tmp", "w", encoding="utf-8") as f:
+                json.dump(self.data, f, ensure_ascii=False)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"[DeepResearch] Could not save checkpoint: {e}")
+
+    # --- Progress ---
+
+    @property
+    def query(self) -> str:
+        return self.data["query"]
+
+    @property
+    def status(self) -> str:
+        return self.data.get("status", STATUS_RUNNING)
+
+    @property
+    def outline(self):
+        return self.data.get("outline")
+
+    @property
+    def section_plans(self) -> dict:
+        return self.data.setdefault("section_plans", {})
+
+    @property
+    def images(self):
+        return self.data.get("images")
+
+    @property
+    def page_summaries(self) -> dict:
+        return self.data.setdefault("page_summaries", {})
+
+    def set_outline(self, outline: list):
+        self.data["outline"] = outline
+        self.save()
+
+    def set_section_plan(self, section: str, sub_queries: list):
+        self.section_plans[section] = sub_queries
+        self.save()
+
+    def set_images(self, images: list):
+        self.data["images"] = images
+        self.save()
+
+    def get_section(self, section: str):
+        """A finished section as returned by section_researcher_node, or None."""
+        saved = self.data.get("sections", {}).get(section)
+        if saved is None:
+            return None
+        return {
+            "notes": [ResearchNote(**note) for note in saved["notes"]],
+            "content": saved["content"],
+            "section": section,
+        }
+
+    def set_section(self, result: dict, page_summaries: dict = None):
+        self.data.setdefault("sections", {})[result["section"]] = {
+            "notes": [dataclasses.asdict(note) for note in result.get("notes", [])],
+            "content": result.get("content", ""),
+        }
+        if page_summaries:
+            self.page_summaries.update(page_summaries)
+        self.save()
+
+    def finish(self, status: str, **info):
+        self.data["status"] = status
+        self.data.update(info)
+        self.save()
+
+    def describe(self) -> str:
+        outline = self.outline or []
+        done = len(self.data.get("sections", {}))
+        return f"'{self.query}' ({done}/{len(outline)} sections done)" if outline else f"'{self.query}' (not planned yet)"
@@ -0,0 +1,119 @@
+"""
+Relevance-ranked context for deep research extraction calls.
+
+Instead of the first few thousand characters of a page, the extraction
+prompt gets the parts of the page that match the section: the text is cut
+into paragraph chunks, the chunks are ranked with BM25 (the same index the
+tool selector uses) against the section title and the research query, and
+the best ones are packed into a token budget. Chunks keep their page order
+and gaps are marked with an ellipsis line.
+
+relevant_facts() does the same for a page summary shared by several
+sections: each section keeps the facts that concern it.
+"""
+
+import re
+from collections import Counter
+
+from src.tools.selection import BM25Index, estimate_tokens, tokenize
+
+CHUNK_CHARS = 600       # Target chunk size: a long paragraph or a few short ones
+CONTEXT_WEIGHT = 0.5    # Query terms count half as much as the section title
+LEAD_BONUS = 0.1        # Share of the best score given to the opening chunk (it often summarises the page)
+GAP_MARKER = "[...]"
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def split_chunks(text: str, target_chars: int = CHUNK_CHARS) -> list:
+    """Split text into chunks of about target_chars, on paragraph and then sentence boundaries."""
+    pieces = []
+    for paragraph in (line.strip() for line in text.splitlines()):
+        if not paragraph:
+            continue
+        if len(paragraph) <= target_chars * 1.5:
+            pieces.append(paragraph)
+            continue
+        sentence_run = ""
+        for sentence in _SENTENCE_END.split(paragraph):
+            if sentence_run and len(sentence_run) + len(sentence) > target_chars:
+                pieces.append(sentence_run)
+                sentence_run = ""
+            sentence_run = f"{sentence_run} {sentence}" if sentence_run else sentence
+        if sentence_run:
+            pieces.append(sentence_run)
+
+    # Merge short paragraphs (list items, captions) with their neighbours
+    chunks = []
+    for piece in pieces:
+        if chunks and len(chunks[-1]) + len(piece) < target_chars:
+            chunks[-1] += "\n" + piece
+        else:
+            chunks.append(piece)
+    return chunks
+
+
+def select_chunks(text: str, focus: str, context: str = "", budget_tokens: int = 750) -> str:
+    """
+    The most relevant part of text for focus (the section title) and
+    context (the research query) that fits in budget_tokens.
+    Text already within the budget is returned unchanged.
+    """
+    if not text or estimate_tokens(text) <= budget_tokens:
+        return text
+
+    chunks = split_chunks(text)
+    weights = Counter(tokenize(focus))
+    for term in tokenize(context):
+        weights[term] += CONTEXT_WEIGHT
+    scores = BM25Index({i: tokenize(chunk) for i, chunk in enumerate(chunks)}).score(weights)
+    if not scores:
+        # Nothing matches: the opening of the page is the best guess
+        return text[:budget_tokens * 4]
+
+    scores[0] = scores.get(0, 0.0) + LEAD_BONUS * max(scores.values())
+    chosen, used = [], 0
+    for index in sorted(scores, key=lambda i: (-scores[i], i)):
+        cost = estimate_tokens(chunks[index]) + 1
+        if used + cost <= budget_tokens:
+            chosen.append(index)
+            used += cost
+    if not chosen:
+        # The best chunk alone is over the budget: cut it
+        return chunks[max(scores, key=scores.get)][:budget_tokens * 4]
+
+    parts, previous = [], -1
+    for index in sorted(chosen):
+        if index != previous + 1:
+            parts.append(GAP_MARKER)
+        parts.append(chunks[index])
+        previous = index
+    if previous != len(chunks) - 1:
+        parts.append(GAP_MARKER)
+    return "\n\n".join(parts)
+
+
+def relevant_facts(summary: str, focus: str, context: str = "", min_facts: int = 3) -> str:
+    """
+    The lines of a page summary (one fact per line) that match focus (the
+    section title), in their original order. When fewer than min_facts
+    match, the best scoring others fill up: the page came from the section's
+    own searches, so it is relevant even without shared words.
+    """
+    facts = [line.strip() for line in (summary or "").splitlines() if line.strip()]
+    if len(facts) <= min_facts:
+        return "\n".join(facts)
+
+    weights = Counter(tokenize(focus))
+    for term in tokenize(context):
+        weights[term] += CONTEXT_WEIGHT
+    scores = BM25Index({i: tokenize(fact) for i, fact in enumerate(facts)}).score(weights)
+
+    # Query terms alone match almost every fact: only section terms select one
+    focus_terms = set(tokenize(focus))
+    chosen = {i for i in scores if focus_terms & set(tokenize(facts[i]))}
+    for i in sorted(range(len(facts)), key=lambda i: -scores.get(i, 0.0)):
+        if len(chosen) >= min_facts:
+            break
+        chosen.add(i)
+    return "\n".join(facts[i] for i in sorted(chosen))
@@ -10,7 +10,11 @@ def MAX_SEARCH_RESULTS():
     return config.get("dr_max_results", 3)
 
 def MAX_SCRAPE_LENGTH():
-    return config.get("dr_max_scrape_length", 5000)
+    return config.get("dr_max_scrape_length", 15000)
+
+# Page text sent to each extraction call (the best matching chunks of the scraped text)
+def EXTRACT_TOKEN_BUDGET():
+    return config.get("dr_extract_token_budget", 750)
 
 def OUTLINE_STEPS():
     return config.get("dr_outline_steps", 5)
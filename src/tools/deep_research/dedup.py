@@ -0,0 +1,124 @@
+"""
+Near-duplicate page elimination for deep research.
+
+Syndicated articles, mirrors and scraped copies often show up several
+times among the pages fetched for a run. Every scraped page gets a 64-bit
+SimHash of its word 3-shingles; a page whose fingerprint is within
+MAX_DISTANCE bits of one already kept is not summarised again. Within a
+section it is dropped and the best copy is kept (pages are considered
+longest first); a copy of a page kept for another section is replaced by
+that page, whose summary is shared across the run (see frontier.py).
+"""
+
+import hashlib
+import re
+
+from src.tools.web_search.cache import normalize_url
+
+FINGERPRINT_BITS = 64
+SHINGLE_SIZE = 3
+# Differing bits for two pages to count as the same text. Unrelated pages differ
+# in about 32 bits; a copy with a few edits or some extra boilerplate in 3 to 8
+MAX_DISTANCE = 8
+MIN_SHINGLES = 20  # Shorter pages are never treated as duplicates
+
+_WORD = re.compile(r"\w+")
+
+
+def _shingle_hash(shingle: str) -> int:
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+def simhash(text: str):
+    """64-bit SimHash of the text's word shingles, None if the text is too short to compare."""
+    words = _WORD.findall(text.lower())
+    shingles = {}
+    for i in range(len(words) - SHINGLE_SIZE + 1):
+        shingle = " ".join(words[i:i + SHINGLE_SIZE])
+        shingles[shingle] = shingles.get(shingle, 0) + 1
+    if len(shingles) < MIN_SHINGLES:
+        return None
+
+    weights = [0] * FINGERPRINT_BITS
+    for shingle, count in shingles.items():
+        value = _shingle_hash(shingle)
+        for bit in range(FINGERPRINT_BITS):
+            weights[bit] += count if value >> bit & 1 else -count
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def _url_key(url: str) -> str:
+    """The key the URL frontier uses for a page."""
+    try:
+        return normalize_url(url)
+    except ValueError:
+        return url
+
+
+def distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _quality(page: dict) -> tuple:
+    """Ranking of copies of the same text: more content, then a real title."""
+    return (len(page.get("content") or ""), page.get("title") not in (None, "", "Untitled"))
+
+
+class ContentDeduplicator:
+    """Fingerprints of the pages kept so far in one deep research run."""
+
+    def __init__(self):
+        self._kept = []  # (fingerprint, page, section)
+        self._kept_keys = set()
+        self.dropped = 0
+        self.shared = 0
+
+    def find_duplicate(self, fingerprint: int):
+        """The kept (page, section) the fingerprint matches, else None."""
+        for kept, page, section in self._kept:
+            if distance(fingerprint, kept) <= MAX_DISTANCE:
+                return page, section
+        return None
+
+    def filter(self, pages: list, section: str) -> list:
+        """
+        Remove the near-duplicates among a section's scraped pages (dicts with
+        'content', 'title' and 'url'). A copy of a page kept for another
+        section is replaced by that page. Pages without content are left
+        alone; the order of the pages is unchanged.
+        """
+        chosen = {}           # index -> page
+        section_keys = set()  # URL keys already in this section's result
+        for index in sorted(range(len(pages)), key=lambda i: _quality(pages[i]), reverse=True):
+            page = pages[index]
+            key = _url_key(page["url"])
+            if key in section_keys:
+                continue  # The same page under another spelling of its URL
+            fingerprint = simhash(page["content"]) if page.get("content") else None
+            if key in self._kept_keys or fingerprint is None:
+                # Shared with another section (not a copy), or too short to compare
+                chosen[index] = page
+                section_keys.add(key)
+                continue
+
+            duplicate = self.find_duplicate(fingerprint)
+            if duplicate is None:
+                self._kept.append((fingerprint, page, section))
+                self._kept_keys.add(key)
+                chosen[index] = page
+                section_keys.add(key)
+                continue
+
+            kept, kept_section = duplicate
+            kept_key = _url_key(kept["url"])
+            if kept_section != section and kept_key not in section_keys:
+                # Its summary is already paid for: the section keeps the source
+                print(f"[Dedup] {page['url']}: same text as {kept['url']} (section '{kept_section}'), using that page")
+                chosen[index] = kept
+                section_keys.add(kept_key)
+                self.shared += 1
+            else:
+                print(f"[Dedup] Skipping {page['url']}: same text as {kept['url']}")
+                self.dropped += 1
+
+        return [chosen[index] for index in sorted(chosen)]
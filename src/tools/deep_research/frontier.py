@@ -0,0 +1,83 @@
+"""
+Run-wide URL frontier for deep research.
+
+Sections search independently and often find the same pages. The frontier
+makes sure each page (by normalised URL) is fetched once and summarised
+once per run: the first section asking for a URL starts the work, later
+ones await the same task. The summary covers the whole outline; each
+section then keeps the facts that concern it (chunks.relevant_facts)
+without another LLM call.
+"""
+
+import asyncio
+
+from src.tools.web_search.cache import normalize_url
+
+
+def _key(url: str) -> str:
+    try:
+        return normalize_url(url)
+    except ValueError:
+        return url
+
+
+class UrlFrontier:
+    """Shared fetch and summary tasks of one deep research run (lives on the run's event loop)."""
+
+    def __init__(self, fetch_fn, summarize_fn):
+        """
+        fetch_fn(url) and summarize_fn(page) are coroutine functions; page is
+        the dict returned by fetch_fn, summarize_fn returns the summary text.
+        """
+        self._fetch_fn = fetch_fn
+        self._summarize_fn = summarize_fn
+        self._pages = {}      # key -> Task of the page dict
+        self._summaries = {}  # key -> Task of the summary
+        self.stats = {"page_requests": 0, "fetches": 0, "summary_requests": 0, "summaries": 0}
+
+    async def fetch(self, url: str) -> dict:
+        key = _key(url)
+        self.stats["page_requests"] += 1
+        if key not in self._pages:
+            self.stats["fetches"] += 1
+            self._pages[key] = asyncio.ensure_future(self._fetch_fn(url))
+        return await asyncio.shield(self._pages[key])
+
+    async def summarize(self, page: dict) -> str:
+        key = _key(page["url"])
+        self.stats["summary_requests"] += 1
+        if key not in self._summaries:
+            self.stats["summaries"] += 1
+            self._summaries[key] = asyncio.ensure_future(self._summarize_fn(page))
+        return await asyncio.shield(self._summaries[key])
+
+    def preload_summaries(self, summaries: dict):
+        """Summaries saved by an earlier attempt of the run (normalised URL -> text)."""
+        for key, summary in summaries.items():
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(summary)
+            self._summaries.setdefault(key, future)
+
+    def summaries(self) -> dict:
+        """The finished summaries (normalised URL -> text), for the run checkpoint."""
+        return {
+            key: task.result() for key, task in self._summaries.items()
+            if task.done() and not task.cancelled() and task.exception() is None
+        }
+
+    def cancel(self):
+        for task in list(self._pages.values()) + list(self._summaries.values()):
+            task.cancel()
+
+    def urls(self) -> list:
+        """The normalised URLs requested during the run."""
+        return list(self._pages)
+
+    def get_savings(self) -> dict:
+        """Fetches and LLM calls avoided by sharing, compared to one of each per section and page."""
+        return {
+            "fetches": self.stats["fetches"],
+            "fetches_saved": self.stats["page_requests"] - self.stats["fetches"],
+            "llm_calls": self.stats["summaries"],
+            "llm_calls_saved": self.stats["summary_requests"] - self.stats["summaries"],
+        }
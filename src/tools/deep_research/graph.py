@@ -6,6 +6,9 @@ import asyncio
 import time
 from typing import Dict, Any, List
 from src.tools.deep_research.state import AgentState
+from src.tools.deep_research.scheduler import FetchScheduler
+from src.tools.deep_research.dedup import ContentDeduplicator
+from src.core.tracing import Tracer
 
 class DeepResearchGraph:
     """
@@ -13,16 +16,24 @@ class DeepResearchGraph:
     """
     def __init__(self):
         self.cancelled = False
+        self.fetch_scheduler = None
+        self.deduplicator = None
+        self.frontier = None
     
     def cancel(self):
         """Cancels the graph execution."""
         self.cancelled = True
 
-    async def run(self, query: str, status_callback=None) -> AgentState:
+    async def run(self, query: str, status_callback=None, checkpoint=None, live_report=None) -> AgentState:
         """
         Runs the graph for a given query in parallel.
+
+        With a RunCheckpoint, progress is saved after every stage and work
+        already saved in it (by an interrupted attempt) is not done again.
+        With a LiveReport, each section is added to the live HTML report as
+        soon as it is written.
         """
-        from src.tools.deep_research.nodes import global_planner, section_researcher_node, synthesizer_node, image_researcher_node
+        from src.tools.deep_research.nodes import plan_outline, plan_section, section_researcher_node, synthesizer_node, image_researcher_node, new_frontier
         
         # Initial state
         state: AgentState = {
@@ -37,60 +48,104 @@ class DeepResearchGraph:
         }
         
         self.cancelled = False
+        # One per run: sections share the per-domain fetch queues and the page fingerprints
+        self.fetch_scheduler = FetchScheduler()
+        self.deduplicator = ContentDeduplicator()
         
-        # 1. Planning Phase
+        # 1. Planning Phase: the outline first, each section's sub-queries when the section starts
         if status_callback:
             status_callback("Planning research strategy (preparing sections)...", 5)
             
-        plan_update = await global_planner(state)
-        state.update(plan_update)
+        tracer = Tracer()
+        if checkpoint and checkpoint.outline:
+            outline = checkpoint.outline
+            print(f"[DeepResearch] Resuming {checkpoint.describe()} from {checkpoint.run_dir}")
+        else:
+            with tracer.span("deep_research.plan", "stage") as span:
+                outline = await plan_outline(state)
+                span.set(sections=len(outline))
+            if checkpoint and outline and not self.cancelled:
+                checkpoint.set_outline(outline)
+        state["outline"] = outline
+        state["section_plans"] = {}
+        self.frontier = new_frontier(self, query, outline)
+        if checkpoint:
+            self.frontier.preload_summaries(checkpoint.page_summaries)
         
         if self.cancelled:
             state["report"] = "Research cancelled by user."
             return state
 
-        outline = state.get("outline", [])
-        section_plans = state.get("section_plans", {})
-        
         if not outline:
             state["report"] = "Error: Failed to generate research outline."
             return state
 
-        # 2. Image Research Phase (Early to provide a pool for sections)
-        if status_callback:
-            status_callback("Searching for high-quality images to include...", 15)
-            
-        image_update = await image_researcher_node(state)
-        state["images"] = image_update.get("images", [])
-        image_pool = state["images"]
+        if live_report:
+            live_report.start(query, outline)
 
-        # 3. Parallel Research & Writing Phase
+        # 2. Image Research (in the background: sections only need their images when writing)
         if status_callback:
-            status_callback(f"Starting {len(outline)} research subagents...", 20)
+            status_callback(f"Planning {len(outline)} sections and searching for images...", 15)
 
+        async def find_images():
+            if checkpoint and checkpoint.images is not None:
+                state["images"] = checkpoint.images
+                return state["images"]
+            with tracer.span("deep_research.images", "stage") as span:
+                image_update = await image_researcher_node(state)
+                span.set(images=len(image_update.get("images", [])))
+            state["images"] = image_update.get("images", [])
+            if checkpoint and not self.cancelled:
+                checkpoint.set_images(state["images"])
+            return state["images"]
+
+        image_task = asyncio.ensure_future(find_images())
+
+        # 3. Parallel Planning, Research & Writing Phase
         # Track completed sections for progress bar
         completed_sections = 0
         total_sections = len(outline)
-        
-        # Calculate images per section (distribute pool uniquely)
-        images_per_section = max(1, len(image_pool) // total_sections) if total_sections > 0 else 0
 
-        async def run_subagent(section_index, section_title):
-            nonlocal completed_sections
-            sub_queries = section_plans.get(section_title, [])
-            
-            # Get a unique slice of images for this section
+        async def section_images(section_index):
+            image_pool = await image_task
+            # Calculate images per section (distribute pool uniquely)
+            images_per_section = max(1, len(image_pool) // total_sections) if total_sections > 0 else 0
             start_idx = section_index * images_per_section
             end_idx = start_idx + images_per_section
-            section_image_pool = image_pool[start_idx:end_idx] if image_pool else []
-            
-            # Sub-status update is tricky in parallel, so we use a shared counter
-            result = await section_researcher_node(query, section_title, sub_queries, self, image_pool=section_image_pool)
+            return image_pool[start_idx:end_idx] if image_pool else []
+
+        async def run_subagent(section_index, section_title):
+            nonlocal completed_sections
+
+            result = checkpoint.get_section(section_title) if checkpoint else None
+            if result is not None:
+                # Written by an earlier attempt of this run
+                state["section_plans"][section_title] = checkpoint.section_plans.get(section_title, [])
+            else:
+                # Sub-status update is tricky in parallel, so we use a shared counter
+                with tracer.span("deep_research.section", "stage", section=section_title):
+                    sub_queries = checkpoint.section_plans.get(section_title) if checkpoint else None
+                    if not sub_queries:
+                        with tracer.span("section.plan", "llm"):
+                            sub_queries = await plan_section(query, section_title)
+                        if checkpoint and sub_queries and not self.cancelled:
+                            checkpoint.set_section_plan(section_title, sub_queries)
+                    state["section_plans"][section_title] = sub_queries
+                    # Research starts as soon as this section is planned, without waiting for the others
+                    result = await section_researcher_node(query, section_title, sub_queries, self,
+                                                           image_pool=lambda: section_images(section_index))
+                # A section without notes (every search or fetch failed) is retried on resume
+                if checkpoint and result.get("notes") and not self.cancelled:
+                    checkpoint.set_section(result, self.frontier.summaries())
             
             completed_sections += 1
             if status_callback:
                 progress = 20 + int((completed_sections / total_sections) * 70)
                 status_callback(f"Completed {completed_sections}/{total_sections}: {section_title}", progress)
+
+            if live_report and result.get("content") and not self.cancelled:
+                with tracer.span("section.live_render", "render", section=section_title):
+                    await live_report.add_section(section_index, result["content"], await image_task)
             
             return result
 
@@ -98,7 +153,25 @@ class DeepResearchGraph:
         subagent_tasks = [run_subagent(i, section) for i, section in enumerate(outline)]
         
         # Wait for all research subagents
-        results = await asyncio.gather(*subagent_tasks)
+        try:
+            # A failing section does not cancel the others: they finish and are checkpointed
+            results = await asyncio.gather(*subagent_tasks, return_exceptions=bool(checkpoint))
+            errors = [res for res in results if isinstance(res, BaseException)]
+            if errors:
+                raise errors[0]
+            await image_task
+        except BaseException:
+            image_task.cancel()
+            self.frontier.cancel()
+            raise
+        print(f"[FetchScheduler] Run finished: {self.fetch_scheduler.get_stats()}")
+        savings = self.frontier.get_savings()
+        state["visited_urls"] = self.frontier.urls()
+        print(f"[UrlFrontier] {savings['fetches']} pages fetched ({savings['fetches_saved']} shared fetches saved), "
+              f"{savings['llm_calls']} summary calls ({savings['llm_calls_saved']} LLM calls saved)")
+        if self.deduplicator.dropped or self.deduplicator.shared:
+            print(f"[Dedup] {self.deduplicator.dropped} duplicate pages skipped, {self.deduplicator.shared} replaced "
+                  f"by the copy another section kept (one summary call each)")
         
         if self.cancelled:
             state["report"] = "Research cancelled by user."
@@ -123,7 +196,8 @@ class DeepResearchGraph:
         if status_callback:
             status_callback("Synthesizing final comprehensive report...", 95)
             
-        final_update = await synthesizer_node(state)
+        with tracer.span("deep_research.synthesize", "stage"):
+            final_update = await synthesizer_node(state)
         state.update(final_update)
         
         if status_callback:
@@ -0,0 +1,80 @@
+"""
+Live HTML report of a deep research run.
+
+As soon as the outline is known, index.html is written into the run
+directory with a placeholder per section, so the artifacts panel can show
+the report while the research runs. Each finished section replaces its
+placeholder, in outline order whatever the order of completion: the file
+is rewritten (for later loads) and on_section is called with the section's
+element id and HTML, so an open panel swaps in only that section.
+
+At the end save_report_artifact replaces the page with the final render
+(numbered citations, sources) and renders the PDF once.
+"""
+
+import asyncio
+import html
+import os
+
+from src.core.workers import WorkerPool
+from src.tools.deep_research.tool_utils import load_report_template, render_section_html
+
+
+def section_id(index: int) -> str:
+    return f"section-{index}"
+
+
+class LiveReport:
+    """The in-progress report of one run (written from the run's event loop)."""
+
+    def __init__(self, run_dir: str, on_start=None, on_section=None):
+        """
+        on_start(path) is called when the page is first written,
+        on_section(path, element_id, html) for every finished section.
+        """
+        self.path = os.path.join(run_dir, "index.html")
+        self._on_start = on_start
+        self._on_section = on_section
+        self._header = ""
+        self._sections = []
+
+    def start(self, query: str, outline: list):
+        self._header = query
+        self._sections = [
+            f'<section id="{section_id(i)}" class="live-section live-pending">'
+            f'<h2>{html.escape(title)}</h2><p class="live-status">Researching...</p></section>'
+            for i, title in enumerate(outline)
+        ]
+        self._write()
+        if self._on_start:
+            self._on_start(self.path)
+
+    async def add_section(self, index: int, section_md: str, images: list):
+        """Render a finished section into its place in the page."""
+        loop = asyncio.get_running_loop()
+        try:
+            body = await loop.run_in_executor(None, WorkerPool().run, render_section_html, section_md, images)
+        except Exception as e:
+            print(f"[LiveReport] Section rendering failed: {e}")
+            body = f"<pre>{html.escape(section_md)}</pre>"
+
+        element_id = section_id(index)
+        section_html = f'<section id="{element_id}" class="live-section">{body}</section>'
+        self._sections[index] = section_html
+        self._write()
+        if self._on_section:
+            self._on_section(self.path, element_id, section_html)
+
+    def _write(self):
+        page = load_report_template()
+        page = page.replace("{{title}}", html.escape(self._header))
+        page = page.replace("{{subtitle}}", "Research in progress")
+        page = page.replace("{{content}}", "\n".join(self._sections))
+        page = page.replace("{{sources}}", "")
+        try:
+            # Atomic, so the panel never loads half a page
+            with open(self.path + ".tmp", "w") as f:
+                f.write(page)
+            os.replace(self.path + ".tmp", self.path)
+        except OSError as e:
+            print(f"[LiveReport] Could not write {self.path}: {e}")
@@ -7,7 +7,10 @@ import gi
 gi.require_version('Notify', '0.7')
 from gi.repository import Notify, GLib, Gio
 from src.tools.deep_research.graph import DeepResearchGraph
+from src.tools.deep_research.live_report import LiveReport
+from src.tools.deep_research.checkpoint import RunCheckpoint, STATUS_RUNNING, STATUS_COMPLETED, STATUS_CANCELLED, STATUS_FAILED
 from src.core.config import get_artifacts_dir
+from src.core.tracing import Tracer
 
 class BackgroundResearchManager:
     _instance = None
@@ -17,6 +20,7 @@ class BackgroundResearchManager:
             cls._instance = super(BackgroundResearchManager, cls).__new__(cls)
             Notify.init("io.github.askscience.gaia")
             cls._instance.active_tasks = {} # chat_id -> {graph, notification, query}
+            cls._instance.failure_notifications = {} # chat_id -> notification with the Resume action
         return cls._instance
 
     def start_research(self, query: str, chat_id: str, project_id: str):
@@ -24,9 +28,41 @@ class BackgroundResearchManager:
         if chat_id in self.active_tasks:
             return "A deep research task is already running for this chat."
 
+        checkpoint = RunCheckpoint.create(project_id, query)
+        self._launch(query, chat_id, project_id, checkpoint, "Deep Research Started")
+        return f"Deep Research for '{query}' has started in the background. You'll be notified when the report is ready."
+
+    def resume_research(self, chat_id: str, project_id: str, query: str = None):
+        """
+        Resumes the newest unfinished research of the project (preferably the one on query):
+        the outline, plans, images and sections saved in its checkpoint are reused and only
+        the missing sections are researched. Starts a new research if there is nothing to resume.
+        """
+        if chat_id in self.active_tasks:
+            return "A deep research task is already running for this chat."
+
+        checkpoint = RunCheckpoint.find_resumable(project_id, query)
+        if checkpoint is None and query:
+            checkpoint = RunCheckpoint.find_resumable(project_id)
+        if checkpoint is None:
+            if not query:
+                return "There is no unfinished deep research to resume."
+            return "No unfinished deep research was found, so a new one was started. " + self.start_research(query, chat_id, project_id)
+
+        progress = checkpoint.describe()
+        checkpoint.finish(STATUS_RUNNING)
+        self._launch(checkpoint.query, chat_id, project_id, checkpoint, "Deep Research Resumed")
+        return f"Deep Research {progress} has been resumed in the background. You'll be notified when the report is ready."
+
+    def _launch(self, query: str, chat_id: str, project_id: str, checkpoint: RunCheckpoint, title: str):
+        old_failure = self.failure_notifications.pop(chat_id, None)
+        if old_failure:
+            try: old_failure.close()
+            except: pass
+
         graph = DeepResearchGraph()
         notification = Notify.Notification.new(
-            "Deep Research Started",
+            title,
             f"Topic: {query}",
             "system-search-symbolic" 
         )
@@ -48,25 +84,52 @@ class BackgroundResearchManager:
             "project_id": project_id,
             "last_show_time": time.time(),
             "loop": None,
-            "task": None
+            "task": None,
+            "checkpoint": checkpoint,
+            # The run stays open until the report (HTML/PDF) is rendered on the main loop
+            "trace": Tracer().start_run("deep_research", query=query, chat_id=chat_id,
+                                        resumed=checkpoint.outline is not None)
         }
 
         def status_callback(message, percentage=None):
             GLib.idle_add(self._update_notification, chat_id, message, percentage)
 
+        # The report is shown (and grows) in the artifacts panel while the sections are written
+        live_report = LiveReport(
+            checkpoint.run_dir,
+            on_start=lambda path: GLib.idle_add(self._show_live_report, chat_id, path),
+            on_section=lambda path, element_id, html: GLib.idle_add(self._update_live_report, path, element_id, html)
+        )
+
         def run_in_thread():
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
             self.active_tasks[chat_id]["loop"] = loop
             
-            # Create a task for graph.run
-            task = loop.create_task(graph.run(query, status_callback=status_callback))
+            # Create a task for graph.run (it inherits the active trace run)
+            with self.active_tasks[chat_id]["trace"].activate():
+                task = loop.create_task(graph.run(query, status_callback=status_callback, checkpoint=checkpoint, live_report=live_report))
             self.active_tasks[chat_id]["task"] = task
             
             try:
-                final_state = loop.run_until_complete(task)
-                loop.close()
-                GLib.idle_add(self._on_research_finished, chat_id, final_state)
+                try:
+                    final_state = loop.run_until_complete(task)
+                finally:
+                    # Also on cancellation and failure: the session and the loop belong to this run
+                    from src.core.network.http_client import close_aiohttp_session
+                    try:
+                        loop.run_until_complete(close_aiohttp_session())
+                    except Exception as e:
+                        print(f"[DeepResearch] Closing the HTTP session failed: {e}")
+                    loop.close()
+                if graph.cancelled or final_state.get("report") == "Research cancelled by user.":
+                    # Nothing to render; the run directory keeps the live report for a resume
+                    print(f"Research task for {chat_id} was cancelled.")
+                    GLib.idle_add(self._on_research_finished, chat_id, {"report": "Research cancelled by user."})
+                    return
+                # Render the HTML/PDF report here, off the GTK main loop
+                artifact_data = self._render_report(chat_id, final_state)
+                GLib.idle_add(self._on_research_finished, chat_id, final_state, artifact_data)
             except asyncio.CancelledError:
                 print(f"Research task for {chat_id} was cancelled.")
                 # We still want to call finished to clean up, but with a cancelled state
@@ -82,8 +145,6 @@ class BackgroundResearchManager:
         
         # Show initial notification to the user
         notification.show()
-        
-        return f"Deep Research for '{query}' has started in the background. You'll be notified when the report is ready."
 
     def stop_research(self, chat_id):
         """Stops a running research task."""
@@ -127,33 +188,80 @@ class BackgroundResearchManager:
         self.stop_research(chat_id)
         notification.close()
 
-    def _on_research_finished(self, chat_id, final_state):
+    def _on_resume_clicked(self, notification, action_name, ids):
+        chat_id, project_id = ids
+        notification.close()
+        self.failure_notifications.pop(chat_id, None)
+        print(f"[DeepResearch] {self.resume_research(chat_id, project_id)}")
+
+    def _render_report(self, chat_id, final_state):
+        """Generate the report artifact (runs in the research thread)."""
+        from src.tools.deep_research.tool_utils import save_report_artifact
+
+        task = self.active_tasks[chat_id]
+        report_md = final_state.get("report", "Error: No report generated.")
+
+        def on_html(path):
+            # The final page replaces the live one right away; the PDF follows
+            GLib.idle_add(self._reload_live_report, path)
+            GLib.idle_add(self._update_notification, chat_id, "Rendering the PDF...", 100)
+
+        with task["trace"].activate():
+            return save_report_artifact(
+                report_md, 
+                task["query"], 
+                task["project_id"], 
+                final_state.get("notes", []),
+                images=final_state.get("images", []),
+                artifact_dir=task["checkpoint"].run_dir,
+                on_html=on_html
+            )
+
+    def _get_window(self):
+        app = Gio.Application.get_default()
+        win = app.get_active_window() if app else None
+        return win if win and hasattr(win, "artifacts_panel") else None
+
+    def _show_live_report(self, chat_id, path):
+        """Open the live report in the artifacts panel, if its chat is the one on screen."""
+        win = self._get_window()
+        if win and hasattr(win, "get_active_chat_page"):
+            page = win.get_active_chat_page()
+            if page and page.chat_data.get("id") == chat_id:
+                win.artifacts_panel.load_artifact(path, "html")
+                win.show_artifacts()
+        return False
+
+    def _update_live_report(self, path, element_id, html):
+        win = self._get_window()
+        if win:
+            win.artifacts_panel.update_section(path, element_id, html)
+        return False
+
+    def _reload_live_report(self, path):
+        win = self._get_window()
+        if win:
+            win.artifacts_panel.reload_if_showing(path)
+        return False
+
+    def _on_research_finished(self, chat_id, final_state, artifact_data=None):
         if chat_id not in self.active_tasks:
             return
             
         task = self.active_tasks[chat_id]
         query = task["query"]
-        project_id = task["project_id"]
         
         # If cancelled, show cancellation notification
         if final_state.get("report") == "Research cancelled by user.":
             n = Notify.Notification.new("Research Cancelled", f"Task for '{query}' was stopped.", "process-stop-symbolic")
             n.show()
+            task["trace"].finish(outcome="cancelled")
+            task["checkpoint"].finish(STATUS_CANCELLED)
             del self.active_tasks[chat_id]
             return
 
-        # Success!
-        # Generate the HTML file (we need to duplicate some logic from tool.py unfortunately, or factor it out)
-        from src.tools.deep_research.tool_utils import save_report_artifact
-        
-        report_md = final_state.get("report", "Error: No report generated.")
-        artifact_data = save_report_artifact(
-            report_md, 
-            query, 
-            project_id, 
-            final_state.get("notes", []),
-            images=final_state.get("images", [])
-        )
+        task["trace"].finish(outcome="completed")
+        task["checkpoint"].finish(STATUS_COMPLETED, report=(artifact_data or {}).get("path"))
         
         # Cleanup
         task["notification"].close()
@@ -188,13 +296,12 @@ class BackgroundResearchManager:
 
             # 2. Open the artifact in the UI
             app = Gio.Application.get_default()
-            if not app: return
-            
-            # 2. Open the artifact in the UI
-            app = Gio.Application.get_default()
-            if not app: return
-            
-            win = app.get_active_window()
+            win = app.get_active_window() if app else None
+            if not (win and hasattr(win, "chat_pages") and chat_id in win.chat_pages):
+                # The chat's tab is closed: save the artifact into the stored chat
+                from src.core.chat_storage import ChatStorage
+                storage = getattr(win, "storage", None) or ChatStorage()
+                storage.update_last_message_metadata(chat_id, {'artifacts': [artifact_data]})
             if win:
                 # Update Artifacts Panel
                 if hasattr(win, "artifacts_panel"):
@@ -225,8 +332,18 @@ class BackgroundResearchManager:
             return
             
         task = self.active_tasks[chat_id]
-        n = Notify.Notification.new("Research Failed", f"Task for '{task['query']}' failed: {error_msg}", "dialog-error-symbolic")
+        task["checkpoint"].finish(STATUS_FAILED, error=error_msg)
+        n = Notify.Notification.new("Research Failed", f"Task for '{task['query']}' failed: {error_msg}\nFinished sections are saved.", "dialog-error-symbolic")
+        n.add_action(
+            "resume",
+            "Resume Research",
+            self._on_resume_clicked,
+            (chat_id, task["project_id"])
+        )
+        # Keep a reference so the action callback stays alive
+        self.failure_notifications[chat_id] = n
         n.show()
+        task["trace"].finish(outcome="failed", error=error_msg)
         
         task["notification"].close()
         del self.active_tasks[chat_id]
@@ -7,10 +7,13 @@ import json
 from typing import List, Dict, Any
 from src.tools.deep_research.state import AgentState, ResearchNote
 from src.tools.deep_research.tools import async_search, async_scrape, async_search_unsplash, async_search_pexels
-from src.tools.deep_research.config import MAX_LOOPS, MAX_SEARCH_RESULTS, OUTLINE_STEPS, SEARCH_BREADTH, UNSPLASH_KEY, PEXELS_KEY, MAX_CONCURRENT_LLM_CALLS, MAX_CONCURRENT_SEARCHES
+from src.tools.deep_research.config import MAX_LOOPS, MAX_SEARCH_RESULTS, OUTLINE_STEPS, SEARCH_BREADTH, UNSPLASH_KEY, PEXELS_KEY, MAX_CONCURRENT_LLM_CALLS, MAX_CONCURRENT_SEARCHES, EXTRACT_TOKEN_BUDGET
+from src.tools.deep_research.chunks import select_chunks, relevant_facts
+from src.tools.deep_research.frontier import UrlFrontier
 from src.core.ai_client import AIClient
 from src.core.prompt_manager import PromptManager
 from src.core.concurrency.manager import ConcurrencyManager
+from src.core.tracing import Tracer, bind_context
 
 ai_client = AIClient()
 prompt_manager = PromptManager()
@@ -26,17 +29,23 @@ async def async_generate_response(messages):
     """
     async with concurrency_manager.get_async_semaphore():
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, ai_client.generate_response, messages)
+        return await loop.run_in_executor(None, bind_context(ai_client.generate_response, messages))
 
-async def global_planner(state: AgentState) -> Dict[str, Any]:
+def _parse_json_list(content: str):
+    """The JSON list in an LLM answer (optionally in a ```json block), None if there is none."""
+    try:
+        if "```json" in content:
+            content = content.split("```json")[1].split("```")[0]
+        parsed = json.loads(content)
+    except (ValueError, IndexError):
+        return None
+    return parsed if isinstance(parsed, list) else None
+
+async def plan_outline(state: AgentState) -> List[str]:
     """
-    Generates a full research outline and initial sub-queries for EVERY section upfront.
+    Generates the research outline (the section titles).
     """
     query = state["query"]
-    if state["graph"].cancelled: return {}
-    
-    print(f"--- Global Planning: {query} ---")
-
     print(f"--- Global Planning: {query} ---")
 
     outline_prompt = prompt_manager.get(
@@ -46,45 +55,64 @@ async def global_planner(state: AgentState) -> Dict[str, Any]:
     )
     
     outline_resp = await async_generate_response([{"role": "user", "content": outline_prompt}])
-    content = outline_resp["message"]["content"]
-    try:
-        if "```json" in content:
-            content = content.split("```json")[1].split("```")[0]
-        outline = json.loads(content)
-    except:
+    outline = _parse_json_list(outline_resp["message"]["content"])
+    if outline is None:
         outline = prompt_manager.get("deep_research.fallbacks.outline", query=query)
         if isinstance(outline, str): outline = [outline] # Safety check
+    return outline
 
-    # Now generate sub-queries for EACH section in parallel
-    section_plans = {}
-    for section in outline:
-        sub_query_prompt = prompt_manager.get(
-            "deep_research.sub_queries",
-            search_breadth=SEARCH_BREADTH(),
-            section=section,
-            query=query
-        )
-        response = await async_generate_response([{"role": "user", "content": sub_query_prompt}])
-        content = response["message"]["content"]
-        try:
-            if "```json" in content:
-                content = content.split("```json")[1].split("```")[0]
-            sub_queries = json.loads(content)
-        except:
-            sub_queries = prompt_manager.get("deep_research.fallbacks.sub_queries", section=section, query=query)
-            if isinstance(sub_queries, str): sub_queries = [sub_queries]
-        section_plans[section] = sub_queries
+async def plan_section(query: str, section: str) -> List[str]:
+    """
+    Generates the search sub-queries for one section.
+    Sections are planned concurrently; the global LLM limiter bounds the calls in flight.
+    """
+    sub_query_prompt = prompt_manager.get(
+        "deep_research.sub_queries",
+        search_breadth=SEARCH_BREADTH(),
+        section=section,
+        query=query
+    )
+    response = await async_generate_response([{"role": "user", "content": sub_query_prompt}])
+    sub_queries = _parse_json_list(response["message"]["content"])
+    if sub_queries is None:
+        sub_queries = prompt_manager.get("deep_research.fallbacks.sub_queries", section=section, query=query)
+        if isinstance(sub_queries, str): sub_queries = [sub_queries]
+    return sub_queries
 
-    return {
-        "outline": outline,
-        "section_plans": section_plans,
-        "next_steps_reasoning": f"Generated outline with {len(outline)} sections. Ready for parallel research."
-    }
+async def summarize_page(page: Dict[str, Any], query: str, outline: List[str]) -> str:
+    """
+    Summarises a scraped page once for the whole run: the facts useful to any
+    section, one per line. Sections pick their lines with relevant_facts().
+    """
+    # The paragraphs matching the research, wherever they are on the page
+    with Tracer().span("page.chunks", "cpu", chars=len(page["content"])):
+        content = select_chunks(page["content"], query, " ".join(outline), EXTRACT_TOKEN_BUDGET())
+    
+    summary_prompt = prompt_manager.get(
+        "deep_research.page_summary",
+        query=query,
+        sections="; ".join(outline),
+        url=page['url'],
+        content=content
+    )
+    
+    with Tracer().span("page.summary", "llm", url=page["url"]):
+        summary_resp = await async_generate_response([{"role": "user", "content": summary_prompt}])
+    return summary_resp["message"]["content"]
+
+def new_frontier(graph: Any, query: str, outline: List[str]) -> UrlFrontier:
+    """The URL frontier for a run: fetches through the run's scheduler, summaries for its outline."""
+    scheduler = getattr(graph, "fetch_scheduler", None)
+    return UrlFrontier(
+        lambda url: async_scrape(url, scheduler),
+        lambda page: summarize_page(page, query, outline)
+    )
 
 async def section_researcher_node(query: str, section_title: str, sub_queries: List[str], graph: Any, image_pool: List[Dict[str, Any]] = None) -> Dict[str, Any]:
     """
     A standalone researcher + writer node for a specific section.
     Designed to be run as a subagent in parallel.
+    image_pool may be a coroutine function (the image search still running): it is only awaited before writing.
     """
     if graph.cancelled: return {"notes": [], "content": "", "section": section_title}
     print(f"--- Subagent Researching Section: {section_title} ---")
@@ -103,8 +131,10 @@ async def section_researcher_node(query: str, section_title: str, sub_queries: L
         async with search_sem:
             return await async_search(q, max_results=search_depth)
 
+    tracer = Tracer()
     search_tasks = [run_search(q) for q in sub_queries]
-    all_search_results = await asyncio.gather(*search_tasks)
+    with tracer.span("section.search", "search", queries=len(sub_queries)):
+        all_search_results = await asyncio.gather(*search_tasks)
     
     urls_to_scrape = []
     for results in all_search_results:
@@ -113,9 +143,19 @@ async def section_researcher_node(query: str, section_title: str, sub_queries: L
             if url and url not in urls_to_scrape:
                 urls_to_scrape.append(url)
     
-    # Scrape top URLs to keep it fast but deep
-    scrape_tasks = [async_scrape(url) for url in urls_to_scrape[:5]]
-    scrape_results = await asyncio.gather(*scrape_tasks)
+    # Scrape top URLs to keep it fast but deep (pages another section already fetched are shared)
+    frontier = getattr(graph, "frontier", None) or new_frontier(graph, query, [section_title])
+    scrape_tasks = [frontier.fetch(url) for url in urls_to_scrape[:5]]
+    with tracer.span("section.scrape", "scrape", urls=len(scrape_tasks)):
+        scrape_results = await asyncio.gather(*scrape_tasks)
+    
+    # Near-duplicate pages (mirrors, syndicated copies) would each cost a summary call
+    deduplicator = getattr(graph, "deduplicator", None)
+    if deduplicator:
+        with tracer.span("section.dedup", "cpu", pages=len(scrape_results)) as span:
+            before = len(scrape_results)
+            scrape_results = deduplicator.filter(list(scrape_results), section_title)
+            span.set(dropped=before - len(scrape_results))
     
     section_notes = []
     
@@ -123,27 +163,22 @@ async def section_researcher_node(query: str, section_title: str, sub_queries: L
     async def process_extraction(res):
         if not res["content"]: return None
         
-        extract_prompt = prompt_manager.get(
-            "deep_research.extract",
-            section_title=section_title,
-            query=query,
-            url=res['url'],
-            content=res['content'][:3000]
-        )
-        
-        extract_resp = await async_generate_response([{"role": "user", "content": extract_prompt}])
-        extracted_info = extract_resp["message"]["content"]
+        # One summary per page for the whole run, then the facts that concern this section
+        summary = await frontier.summarize(res)
+        facts = relevant_facts(summary, section_title, query)
+        if not facts: return None
         
         return ResearchNote(
             title=res.get("title", "Untitled"),
             url=res["url"],
-            content=extracted_info,
+            content=facts,
             relevance=f"Source for {section_title}"
         )
 
     # Launch extraction tasks in parallel
     extraction_tasks = [process_extraction(res) for res in scrape_results]
-    extraction_results = await asyncio.gather(*extraction_tasks)
+    with tracer.span("section.extract", "llm", pages=len(extraction_tasks)):
+        extraction_results = await asyncio.gather(*extraction_tasks)
     
     for note in extraction_results:
         if graph.cancelled: break
@@ -161,6 +196,8 @@ async def section_researcher_node(query: str, section_title: str, sub_queries: L
     
     writer_prompt = prompt_manager.get("deep_research.write_section", section_title=section_title, query=query)
     
+    if callable(image_pool):
+        image_pool = await image_pool()
     if image_pool:
         writer_prompt += prompt_manager.get("deep_research.write_section_images")
         image_format = prompt_manager.get("deep_research.writer_image_format", description="{description}", url="{url}")
@@ -173,7 +210,8 @@ async def section_researcher_node(query: str, section_title: str, sub_queries: L
     for i, note in enumerate(section_notes, 1):
         writer_prompt += note_format.format(title=note.title, content=note.content, url=note.url)
         
-    writer_resp = await async_generate_response([{"role": "user", "content": writer_prompt}])
+    with tracer.span("section.write", "llm", notes=len(section_notes)):
+        writer_resp = await async_generate_response([{"role": "user", "content": writer_prompt}])
     content = writer_resp["message"]["content"]
     
     # Strip potential title if AI included it despite instructions
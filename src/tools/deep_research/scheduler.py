@@ -0,0 +1,139 @@
+"""
+Per-domain politeness scheduler for deep research page fetches.
+
+All sections of a research run scrape through one FetchScheduler, so two
+sections citing the same site no longer hit it at the same moment. Each
+domain gets its own queue:
+
+- at most `dr_domain_concurrency` fetches to a domain run at once,
+- consecutive fetches to a domain start `dr_domain_spacing` seconds apart,
+- a 429 or 503 answer pauses the domain (Retry-After, else an exponential
+  backoff) and the page is tried again after the pause,
+- a domain that just timed out is skipped for `dr_host_timeout_ttl`
+  seconds instead of making every later page wait for the same timeout.
+
+Different domains do not wait for each other. The scheduler lives on the
+run's event loop and is not thread-safe.
+"""
+
+import asyncio
+import email.utils
+import time
+from urllib.parse import urlparse
+
+from src.core.config import ConfigManager
+from src.core.tracing import bind_context
+
+DEFAULT_DOMAIN_CONCURRENCY = 2
+DEFAULT_DOMAIN_SPACING = 1.0    # Seconds between fetch starts on one domain
+DEFAULT_HOST_TIMEOUT_TTL = 120  # Seconds a timed out domain is skipped
+BACKOFF_BASE = 2.0
+BACKOFF_MAX = 60.0
+MAX_ATTEMPTS = 3
+THROTTLE_ERRORS = ("http_429", "http_503")
+
+
+def domain_of(url: str) -> str:
+    host = (urlparse(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+def parse_retry_after(value):
+    """Seconds to wait from a Retry-After header (delta seconds or an HTTP date), None if absent."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, email.utils.parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _Domain:
+    def __init__(self, concurrency: int):
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.next_start = 0.0      # Earliest start of the next fetch (loop time)
+        self.throttled = 0         # Consecutive 429/503 answers
+        self.skip_until = 0.0      # Negative cache after a timeout
+
+
+class FetchScheduler:
+    """Queues page fetches per domain for one deep research run."""
+
+    def __init__(self):
+        config = ConfigManager()
+        self.concurrency = max(1, int(config.get("dr_domain_concurrency", DEFAULT_DOMAIN_CONCURRENCY)))
+        self.spacing = float(config.get("dr_domain_spacing", DEFAULT_DOMAIN_SPACING))
+        self.timeout_ttl = float(config.get("dr_host_timeout_ttl", DEFAULT_HOST_TIMEOUT_TTL))
+        self._domains = {}
+        self.stats = {"fetched": 0, "throttled": 0, "timeouts": 0, "skipped": 0, "waited": 0.0}
+
+    def _domain(self, name: str) -> _Domain:
+        if name not in self._domains:
+            self._domains[name] = _Domain(self.concurrency)
+        return self._domains[name]
+
+    def _skipped(self, name: str, domain: _Domain) -> bool:
+        if asyncio.get_running_loop().time() < domain.skip_until:
+            self.stats["skipped"] += 1
+            print(f"[FetchScheduler] Skipping {name}: timed out recently")
+            return True
+        return False
+
+    async def fetch(self, url: str, fetch_fn):
+        """
+        Run the blocking fetch_fn() (a scrape_url call returning a result dict)
+        in the default executor once the URL's domain allows it.
+        Returns the result dict, or None when the domain is being skipped.
+        """
+        loop = asyncio.get_running_loop()
+        name = domain_of(url)
+        domain = self._domain(name)
+        result = None
+
+        for attempt in range(MAX_ATTEMPTS):
+            if self._skipped(name, domain):
+                return None
+            async with domain.semaphore:
+                if self._skipped(name, domain):
+                    return None
+                # Reserve the next start slot before sleeping so queued fetches line up behind it
+                now = loop.time()
+                start = max(now, domain.next_start)
+                domain.next_start = start + self.spacing
+                if start > now:
+                    self.stats["waited"] += start - now
+                    await asyncio.sleep(start - now)
+
+                result = await loop.run_in_executor(None, bind_context(fetch_fn))
+                self.stats["fetched"] += 1
+
+            error = (result or {}).get("error")
+            if error == "timeout":
+                self.stats["timeouts"] += 1
+                domain.skip_until = loop.time() + self.timeout_ttl
+                print(f"[FetchScheduler] {name} timed out: skipping it for {self.timeout_ttl:.0f}s")
+                return result
+            if error not in THROTTLE_ERRORS:
+                domain.throttled = 0
+                return result
+
+            # Throttled: pause the whole domain, then try this page again
+            self.stats["throttled"] += 1
+            domain.throttled += 1
+            delay = parse_retry_after(result.get("retry_after"))
+            if delay is None:
+                delay = BACKOFF_BASE ** domain.throttled
+            delay = min(delay, BACKOFF_MAX)
+            domain.next_start = max(domain.next_start, loop.time() + delay)
+            print(f"[FetchScheduler] {name} answered {error[5:]}: backing off {delay:.1f}s "
+                  f"(attempt {attempt + 1}/{MAX_ATTEMPTS})")
+        return result
+
+    def get_stats(self) -> dict:
+        stats = dict(self.stats)
+        stats["domains"] = len(self._domains)
+        stats["waited"] = round(stats["waited"], 2)
+        return stats
@@ -26,12 +26,16 @@ class DeepResearchTool(BaseTool):
                 "query": {
                     "type": "string",
                     "description": "The complex research query or topic"
+                },
+                "resume": {
+                    "type": "boolean",
+                    "description": "Set to true to continue an unfinished deep research (interrupted, failed or stopped) on this query instead of starting over. Sections already researched are kept."
                 }
             },
             "required": ["query"]
         }
 
-    def execute(self, query: str, status_callback=None, **kwargs):
+    def execute(self, query: str, resume: bool = False, status_callback=None, **kwargs):
         """
         Execute the Deep Research Agent in the background.
         """
@@ -43,7 +47,10 @@ class DeepResearchTool(BaseTool):
             
             # Start research in background and return immediate feedback
             # Note: We use project_id as chat_id for now as it identifies the current workspace/chat
-            result_msg = manager.start_research(query, project_id, project_id)
+            if resume:
+                result_msg = manager.resume_research(project_id, project_id, query)
+            else:
+                result_msg = manager.start_research(query, project_id, project_id)
             
             # Formulate the response for the AI
             # We want the agent to tell the user that it's working in background
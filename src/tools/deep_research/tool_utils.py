@@ -5,6 +5,8 @@ import asyncio
 import time
 from urllib.parse import urlparse
 from src.core.config import get_artifacts_dir
+from src.core.tracing import Tracer
+from src.core.workers import WorkerPool
 
 def inject_image_attributions(html_content: str, image_pool: list) -> str:
     """
@@ -48,29 +50,12 @@ def inject_image_attributions(html_content: str, image_pool: list) -> str:
         print(f"Error injecting attributions: {e}")
         return html_content
 
-def save_report_artifact(report_md: str, query: str, project_id: str, notes: list, images: list = None):
+def render_report_body(report_md: str, query: str, images: list):
     """
-    Common utility to generate and save the research report HTML.
-    Returns artifact metadata.
+    Convert the report markdown to the HTML body: title extraction, citation
+    numbering, references section and image attributions.
+    Runs in a worker process (CPU-bound). Returns (display_title, html_body).
     """
-    if images is None:
-        images = []
-    # 1. Format sources for HTML
-    sources_html = ""
-    for note in notes:
-        url = note.url
-        title = note.title or "Untitled Source"
-        domain = urlparse(url).netloc.replace("www.", "")
-        
-        sources_html += f"""
-        <a href="{url}" class="source-item" target="_blank">
-            <div class="source-domain">{domain}</div>
-            <h4 class="source-title">{title}</h4>
-            <div class="source-url">{url}</div>
-        </a>
-        """
-    
-    # 2. Extract title and convert markdown to HTML
     try:
         import markdown
         
@@ -135,13 +120,70 @@ def save_report_artifact(report_md: str, query: str, project_id: str, notes: lis
         display_title = query
         report_html_body = report_md.replace("\n", "<br>") # Fallback
 
-    # 3. Load template
+    return display_title, report_html_body
+
+def render_section_html(section_md: str, images: list) -> str:
+    """
+    Convert one written section to HTML for the live report (citations stay
+    inline links until the final render numbers them). Runs in a worker process.
+    """
+    try:
+        import markdown
+        section_html = markdown.markdown(section_md, extensions=['fenced_code', 'tables'])
+        return inject_image_attributions(section_html, images)
+    except ImportError:
+        return section_md.replace("\n", "<br>")
+
+def load_report_template() -> str:
     template_path = os.path.join(os.path.dirname(__file__), "report_template.html")
     if not os.path.exists(template_path):
         template_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "report_template.html")
 
     with open(template_path, "r") as f:
-        template = f.read()
+        return f.read()
+
+def render_pdf(html: str, pdf_path: str):
+    """Render the report HTML to PDF with WeasyPrint. Runs in a worker process."""
+    import weasyprint
+    # Our template has <style> which WeasyPrint parses, no extra stylesheets needed
+    weasyprint.HTML(string=html).write_pdf(pdf_path)
+
+def save_report_artifact(report_md: str, query: str, project_id: str, notes: list, images: list = None, artifact_dir: str = None, on_html=None):
+    """
+    Common utility to generate and save the research report HTML.
+    artifact_dir is the run's directory (next to its checkpoint); a new one is created if not given.
+    on_html(path) is called once the HTML is written, before the (slower) PDF.
+    Returns artifact metadata.
+    """
+    if images is None:
+        images = []
+    # 1. Format sources for HTML
+    sources_html = ""
+    for note in notes:
+        url = note.url
+        title = note.title or "Untitled Source"
+        domain = urlparse(url).netloc.replace("www.", "")
+        
+        sources_html += f"""
+        <a href="{url}" class="source-item" target="_blank">
+            <div class="source-domain">{domain}</div>
+            <h4 class="source-title">{title}</h4>
+            <div class="source-url">{url}</div>
+        </a>
+        """
+    
+    # 2. Extract title and convert markdown to HTML (in a worker process)
+    pool = WorkerPool()
+    with Tracer().span("report.markdown", "render", chars=len(report_md)):
+        try:
+            display_title, report_html_body = pool.run(render_report_body, report_md, query, images)
+        except Exception as e:
+            print(f"[DeepResearch] Report rendering failed: {e}")
+            display_title = query
+            report_html_body = report_md.replace("\n", "<br>") # Fallback
+
+    # 3. Load template
+    template = load_report_template()
     
     final_html = template.replace("{{title}}", display_title)
     final_html = final_html.replace("{{subtitle}}", f"Research report on {query}")
@@ -149,11 +191,12 @@ def save_report_artifact(report_md: str, query: str, project_id: str, notes: lis
     final_html = final_html.replace("{{sources}}", sources_html)
     
     # 4. Save artifact
-    timestamp = int(time.time())
-    research_folder = f"research_{timestamp}"
-    
-    base_artifacts = get_artifacts_dir()
-    artifact_dir = os.path.join(base_artifacts, project_id, "deepresearch", research_folder)
+    if not artifact_dir:
+        timestamp = int(time.time())
+        research_folder = f"research_{timestamp}"
+        
+        base_artifacts = get_artifacts_dir()
+        artifact_dir = os.path.join(base_artifacts, project_id, "deepresearch", research_folder)
     os.makedirs(artifact_dir, exist_ok=True)
     
     report_filename = "index.html"
@@ -161,6 +204,8 @@ def save_report_artifact(report_md: str, query: str, project_id: str, notes: lis
     
     with open(report_path, "w") as f:
         f.write(final_html)
+    if on_html:
+        on_html(report_path)
 
     # 4b. Generate PDF
     pdf_filename = "report.pdf"
@@ -168,11 +213,8 @@ def save_report_artifact(report_md: str, query: str, project_id: str, notes: lis
     pdf_generated = False
     
     try:
-        import weasyprint
-        # Convert HTML to PDF
-        # We use empty list for stylesheets to force it to use inline styles from our template? 
-        # Actually our template has <style> which WeasyPrint parses.
-        weasyprint.HTML(string=final_html).write_pdf(pdf_path)
+        with Tracer().span("report.pdf", "render", html_chars=len(final_html)):
+            pool.run(render_pdf, final_html, pdf_path)
         pdf_generated = True
         print(f"[DeepResearch] PDF generated at {pdf_path}")
     except Exception as e:
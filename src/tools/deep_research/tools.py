@@ -3,11 +3,13 @@ Async tools for web search and scraping, wrapping existing logic.
 """
 
 import asyncio
-import aiohttp
+import functools
 from typing import List, Dict, Optional
 from src.tools.web_search.search import search
 from src.tools.web_search.scraper import scrape_url
 from src.tools.deep_research.config import SEARCH_TIMEOUT, SCRAPE_TIMEOUT, MAX_SCRAPE_LENGTH
+from src.core.tracing import bind_context
+from src.core.network.http_client import get_aiohttp_session
 
 async def async_search(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     """
@@ -27,26 +29,35 @@ async def async_search(query: str, max_results: int = 3) -> List[Dict[str, str]]
             # Add a small random delay to further spread out requests
             import random
             await asyncio.sleep(random.uniform(0.5, 1.5))
-            return await loop.run_in_executor(None, search, query, max_results)
+            return await loop.run_in_executor(None, bind_context(search, query, max_results))
         except Exception as e:
             print(f"Search error (likely rate limit): {e}")
             return []
 
-async def async_scrape(url: str) -> Dict[str, Optional[str]]:
+async def async_scrape(url: str, scheduler=None) -> Dict[str, Optional[str]]:
     """
     Async scraping using the centralized web_search scraper.
+    With a FetchScheduler the fetch waits for its turn on the URL's domain.
     """
     loop = asyncio.get_event_loop()
     
     # Run sync scraper in executor
     try:
-        scraped_data = await loop.run_in_executor(
-            None, 
-            scrape_url, 
-            url, 
-            MAX_SCRAPE_LENGTH(), 
-            SCRAPE_TIMEOUT
-        )
+        if scheduler:
+            scraped_data = await scheduler.fetch(
+                url,
+                functools.partial(scrape_url, url, MAX_SCRAPE_LENGTH(), SCRAPE_TIMEOUT)
+            ) or {}
+        else:
+            scraped_data = await loop.run_in_executor(
+                None, 
+                bind_context(
+                    scrape_url, 
+                    url, 
+                    MAX_SCRAPE_LENGTH(), 
+                    SCRAPE_TIMEOUT
+                )
+            )
         
         # Map to expected format
         return {
@@ -74,20 +85,21 @@ async def async_search_unsplash(query: str, access_key: str, max_results: int =
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, params=params, timeout=SEARCH_TIMEOUT) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for item in data.get("results", []):
-                        user = item.get("user", {})
-                        images.append({
-                            "url": item.get("urls", {}).get("regular"),
-                            "thumb": item.get("urls", {}).get("small"),
-                            "description": item.get("description") or item.get("alt_description") or query,
-                            "attribution_name": f"Unsplash/{user.get('username') or user.get('name')}",
-                            "attribution_url": user.get("links", {}).get("html"),
-                            "source": "Unsplash"
-                        })
+        import aiohttp
+        session = get_aiohttp_session()
+        async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=SEARCH_TIMEOUT)) as response:
+            if response.status == 200:
+                data = await response.json()
+                for item in data.get("results", []):
+                    user = item.get("user", {})
+                    images.append({
+                        "url": item.get("urls", {}).get("regular"),
+                        "thumb": item.get("urls", {}).get("small"),
+                        "description": item.get("description") or item.get("alt_description") or query,
+                        "attribution_name": f"Unsplash/{user.get('username') or user.get('name')}",
+                        "attribution_url": user.get("links", {}).get("html"),
+                        "source": "Unsplash"
+                    })
     except Exception as e:
         print(f"Unsplash API error: {e}")
     
@@ -109,19 +121,20 @@ async def async_search_pexels(query: str, api_key: str, max_results: int = 5) ->
     }
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, headers=headers, params=params, timeout=SEARCH_TIMEOUT) as response:
-                if response.status == 200:
-                    data = await response.json()
-                    for item in data.get("photos", []):
-                        images.append({
-                            "url": item.get("src", {}).get("large"),
-                            "thumb": item.get("src", {}).get("medium"),
-                            "description": item.get("alt") or query,
-                            "attribution_name": f"Pexels/{item.get('photographer')}",
-                            "attribution_url": item.get("photographer_url"),
-                            "source": "Pexels"
-                        })
+        import aiohttp
+        session = get_aiohttp_session()
+        async with session.get(url, headers=headers, params=params, timeout=aiohttp.ClientTimeout(total=SEARCH_TIMEOUT)) as response:
+            if response.status == 200:
+                data = await response.json()
+                for item in data.get("photos", []):
+                    images.append({
+                        "url": item.get("src", {}).get("large"),
+                        "thumb": item.get("src", {}).get("medium"),
+                        "description": item.get("alt") or query,
+                        "attribution_name": f"Pexels/{item.get('photographer')}",
+                        "attribution_url": item.get("photographer_url"),
+                        "source": "Pexels"
+                    })
     except Exception as e:
         print(f"Pexels API error: {e}")
     
@@ -0,0 +1,176 @@
+"""
+Shared execution environment for tools.
+
+Sync tools run on a bounded thread pool and tools that implement `aexecute`
+run on one long-lived background event loop, so no tool has to create its own
+loop. The agent loop waits on the result while polling a cancel event, which
+lets Stop and per-tool timeouts interrupt a hung tool instead of blocking the
+chat forever. A thread still running an abandoned tool cannot be stopped, so
+the pool it belongs to is retired and later calls get a fresh one.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+import time
+
+from src.core.config import ConfigManager
+from src.core.tracing import bind_context
+
+DEFAULT_WORKERS = 8
+POLL_INTERVAL = 0.1  # Seconds between cancellation checks
+
+
+class ToolTimeoutError(Exception):
+    """The tool did not finish within its timeout."""
+
+
+class ToolCancelledError(Exception):
+    """The tool call was cancelled by the user (Stop)."""
+
+
+class ToolExecutor:
+    """
+    Singleton owning the tool thread pool, the shared tool event loop and
+    per-tool latency statistics.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ToolExecutor, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self._pool = self._new_pool()
+        self._pool_lock = threading.Lock()
+        self._loop = None
+        self._loop_lock = threading.Lock()
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    def _new_pool(self):
+        return concurrent.futures.ThreadPoolExecutor(
+            max_workers=int(ConfigManager().get("tool_executor_workers", DEFAULT_WORKERS)),
+            thread_name_prefix="gaia-tool"
+        )
+
+    def _retire_pool(self, pool):
+        """
+        Replace a pool that lost a worker to an abandoned tool. Its other
+        threads finish what they run and exit; new calls go to the new pool.
+        """
+        with self._pool_lock:
+            if self._pool is not pool:
+                return  # Already replaced
+            self._pool = self._new_pool()
+        pool.shutdown(wait=False)
+        print("[ToolExecutor] An abandoned tool is still running, started a fresh worker pool")
+
+    # --- Event loop ---
+
+    def get_loop(self) -> asyncio.AbstractEventLoop:
+        """The shared tool event loop, started on first use in a daemon thread."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                ready = threading.Event()
+
+                def run():
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(ready.set)
+                    loop.run_forever()
+
+                threading.Thread(target=run, name="gaia-tool-loop", daemon=True).start()
+                ready.wait()
+                self._loop = loop
+            return self._loop
+
+    def submit_coroutine(self, coro) -> concurrent.futures.Future:
+        """Schedule a coroutine on the shared loop. Cancelling the future cancels the task."""
+        return asyncio.run_coroutine_threadsafe(coro, self.get_loop())
+
+    def run_coroutine(self, coro, timeout: float = None, cancel_event: threading.Event = None):
+        """Blocking helper for sync code: run a coroutine on the shared loop and wait for it."""
+        return self.wait(self.submit_coroutine(coro), timeout=timeout, cancel_event=cancel_event)
+
+    # --- Waiting ---
+
+    def wait(self, future, timeout: float = None, cancel_event: threading.Event = None):
+        """
+        Wait for a future, polling cancel_event. Raises ToolTimeoutError or
+        ToolCancelledError and cancels the future (a running thread cannot be
+        stopped; it is abandoned and the tool is expected to check its cancel_event).
+        """
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            remaining = POLL_INTERVAL
+            if deadline is not None:
+                remaining = min(remaining, deadline - time.monotonic())
+            try:
+                return future.result(timeout=max(0.0, remaining))
+            except concurrent.futures.TimeoutError:
+                pass
+
+            if cancel_event is not None and cancel_event.is_set():
+                future.cancel()
+                raise ToolCancelledError()
+            if deadline is not None and time.monotonic() >= deadline:
+                future.cancel()
+                raise ToolTimeoutError()
+
+    # --- Tools ---
+
+    def run_tool(self, tool, kwargs: dict, timeout: float = None, cancel_event: threading.Event = None):
+        """Run a tool (async if it implements aexecute) and wait for its result."""
+        if has_async_execute(tool):
+            future = self.submit_coroutine(tool.aexecute(**kwargs))
+            return self.wait(future, timeout=timeout, cancel_event=cancel_event)
+
+        with self._pool_lock:
+            pool = self._pool
+        # Keep the caller's context so the tool's spans join the current trace run
+        future = pool.submit(bind_context(tool.execute, **kwargs))
+        try:
+            return self.wait(future, timeout=timeout, cancel_event=cancel_event)
+        except (ToolTimeoutError, ToolCancelledError):
+            if not future.done():
+                # Running, not just queued (cancelled) or finished: its thread is gone for good
+                self._retire_pool(pool)
+            raise
+
+    # --- Statistics ---
+
+    def record(self, tool_name: str, seconds: float, outcome: str = "ok"):
+        """Record one call. outcome is 'ok', 'error', 'timeout' or 'cancelled'."""
+        with self._stats_lock:
+            stats = self._stats.setdefault(tool_name, {
+                "calls": 0, "ok": 0, "error": 0, "timeout": 0, "cancelled": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0
+            })
+            ms = seconds * 1000.0
+            stats["calls"] += 1
+            stats[outcome] = stats.get(outcome, 0) + 1
+            stats["total_ms"] += ms
+            stats["max_ms"] = max(stats["max_ms"], ms)
+            stats["last_ms"] = ms
+
+    def get_stats(self) -> dict:
+        """tool name -> call counts and latency figures (with avg_ms)."""
+        with self._stats_lock:
+            report = {}
+            for name, stats in self._stats.items():
+                entry = dict(stats)
+                entry["avg_ms"] = entry["total_ms"] / entry["calls"] if entry["calls"] else 0.0
+                report[name] = entry
+            return report
+
+
+def has_async_execute(tool) -> bool:
+    """True if the tool overrides BaseTool.aexecute."""
+    from src.tools.base import BaseTool
+    method = getattr(type(tool), "aexecute", None)
+    return method is not None and method is not BaseTool.aexecute
@@ -1,6 +1,5 @@
 import asyncio
 import os
-import requests
 import json
 import subprocess
 from src.tools.base import BaseTool
@@ -8,6 +7,8 @@ from src.core.prompt_manager import PromptManager
 from src.core.config import ConfigManager
 
 class GnomeSearchBackgroundTool(BaseTool):
+    timeout = 60
+
     @property
     def name(self):
         return "gnome_search_background"
@@ -30,16 +31,23 @@ class GnomeSearchBackgroundTool(BaseTool):
         }
     
     def execute(self, query: str = "mountains", status_callback=None, **kwargs):
+        from src.tools.executor import ToolExecutor
+        return ToolExecutor().run_coroutine(
+            self.aexecute(query=query, status_callback=status_callback, **kwargs),
+            timeout=self.timeout
+        )
+
+    async def aexecute(self, query: str = "mountains", status_callback=None, **kwargs):
         pm = PromptManager()
         if status_callback:
             status_callback(pm.get("gnome_search_background.status_searching", query=query))
+
+        config = ConfigManager()
+        unsplash_key = config.get("unsplash_access_key", "")
+        pexels_key = config.get("pexels_api_key", "")
             
         async def fetch_images():
             from src.tools.deep_research.tools import async_search_unsplash, async_search_pexels
-            config = ConfigManager()
-            
-            unsplash_key = config.get("unsplash_access_key", "")
-            pexels_key = config.get("pexels_api_key", "")
             
             tasks = []
             if unsplash_key:
@@ -57,10 +65,7 @@ class GnomeSearchBackgroundTool(BaseTool):
             return all_imgs[:4] # Return top 4 mixed
 
         try:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            images = loop.run_until_complete(fetch_images())
-            loop.close()
+            images = await fetch_images()
             
             if not images:
                 print(f"[GnomeSearchBackground] No images found. Unsplash Key: {'Set' if unsplash_key else 'Missing'}, Pexels Key: {'Set' if pexels_key else 'Missing'}")
@@ -118,11 +123,9 @@ class GnomeSetBackgroundTool(BaseTool):
             # 1. Download image
             status_callback(pm.get("gnome_set_background.status_downloading")) if status_callback else None
             
-            # Use a session with headers to mimic a browser, avoiding some 403/404s
-            session = requests.Session()
-            session.headers.update({'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'})
-            
-            response = session.get(url, timeout=10)
+            # The shared session sends a browser User-Agent, avoiding some 403/404s
+            from src.core.network.http_client import get_session
+            response = get_session().get(url, timeout=10)
             if response.status_code != 200:
                  print(f"[GnomeSetBackground] Failed to download {url}. Status: {response.status_code}")
                  return pm.get("gnome_set_background.error_download", code=response.status_code)
@@ -1,6 +1,14 @@
 import os
-from pypdf import PdfReader
-import docx
+
+# PDF and DOCX parsing is CPU-bound and runs in a worker process
+WORKER_EXTENSIONS = ('.pdf', '.docx')
+WORKER_TIMEOUT = 120
+
+
+def read_document(file_path: str, max_chars: int) -> str:
+    """Worker process entry point (must be a module-level function)."""
+    return DocumentReader().read_local(file_path, max_chars)
+
 
 class DocumentReader:
     def read(self, file_path: str, max_chars: int = 20000) -> str:
@@ -9,6 +17,23 @@ class DocumentReader:
             raise FileNotFoundError(f"File not found: {file_path}")
             
         ext = os.path.splitext(file_path)[1].lower()
+        if ext not in WORKER_EXTENSIONS:
+            return self.read_local(file_path, max_chars)
+
+        import concurrent.futures
+        from src.core.workers import WorkerPool
+        try:
+            return WorkerPool().run(read_document, file_path, max_chars, timeout=WORKER_TIMEOUT)
+        except concurrent.futures.TimeoutError:
+            raise RuntimeError(f"Timed out reading file {file_path}")
+        except RuntimeError:
+            raise  # Read errors and worker crashes already carry a message
+        except Exception as e:
+            raise RuntimeError(f"Error reading file {file_path}: {str(e)}")
+
+    def read_local(self, file_path: str, max_chars: int = 20000) -> str:
+        """Read the file in the current process."""
+        ext = os.path.splitext(file_path)[1].lower()
         
         try:
             if ext == '.pdf':
@@ -21,6 +46,7 @@ class DocumentReader:
             raise RuntimeError(f"Error reading file {file_path}: {str(e)}")
 
     def _read_pdf(self, path: str, max_chars: int) -> str:
+        from pypdf import PdfReader
         reader = PdfReader(path)
         text = ""
         for page in reader.pages:
@@ -30,6 +56,7 @@ class DocumentReader:
         return text[:max_chars]
 
     def _read_docx(self, path: str, max_chars: int) -> str:
+        import docx
         doc = docx.Document(path)
         text = []
         current_len = 0
@@ -7,6 +7,7 @@ class GnomeDocumentTool(BaseTool):
     """
     Tool to find, read, and query local documents (PDF, DOCX, TXT).
     """
+    timeout = 300  # Large documents are read and summarized by the model
     
     @property
     def name(self):
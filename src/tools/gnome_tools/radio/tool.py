@@ -1,10 +1,10 @@
-import requests
 import asyncio
 import random
 import json
 import subprocess
 from src.tools.base import BaseTool
 from src.core.prompt_manager import PromptManager
+from src.core.network.http_client import get_session
 
 class GnomeRadioTool(BaseTool):
     @property
@@ -54,7 +54,7 @@ class GnomeRadioTool(BaseTool):
     def _get_api_server(self):
         # Try to get a working server from the main load balancer
         try:
-            resp = requests.get("http://all.api.radio-browser.info/json/servers", timeout=5)
+            resp = get_session().get("http://all.api.radio-browser.info/json/servers", timeout=5)
             servers = [s['name'] for s in resp.json()]
             if servers:
                 return "https://" + random.choice(servers)
@@ -80,13 +80,13 @@ class GnomeRadioTool(BaseTool):
                 'reverse': 'true'
             }
             
-            resp = requests.get(api_url, params=params, timeout=5)
+            resp = get_session().get(api_url, params=params, timeout=5)
             stations = resp.json()
             
             if not stations:
                 # Try tag match if name fail
                 params = {'tag': query, 'limit': 8, 'hidebroken': 'true', 'order': 'clickcount', 'reverse': 'true'}
-                resp = requests.get(api_url, params=params, timeout=5)
+                resp = get_session().get(api_url, params=params, timeout=5)
                 stations = resp.json()
 
             if not stations:
@@ -1,50 +1,46 @@
-import os
-import importlib.util
 import inspect
-from src.tools.base import BaseTool
+import threading
+import time
 from src.core.config import ConfigManager
+from src.core.tracing import Tracer
+from src.tools.registry import ToolRegistry, LazyTool
+from src.tools.executor import ToolExecutor, ToolTimeoutError, ToolCancelledError, has_async_execute
 
 class ToolManager:
     def __init__(self):
+        self.registry = ToolRegistry()
         self.tools = {}
-        self.tools_dir = os.path.dirname(os.path.abspath(__file__))
+        self.tools_dir = self.registry.tools_dir
         self.config = ConfigManager()
+        self.executor = ToolExecutor()
 
     def load_tools(self):
-        self.tools = {}
-        # Scan subdirectories for tools
-        # Structure: src/tools/<tool_name>/tool.py
-        for item in os.listdir(self.tools_dir):
-            item_path = os.path.join(self.tools_dir, item)
-            if os.path.isdir(item_path):
-                tool_file = os.path.join(item_path, "tool.py")
-                if os.path.exists(tool_file):
-                    self._load_tool_from_file(tool_file)
-
-    def _load_tool_from_file(self, path):
-        try:
-            spec = importlib.util.spec_from_file_location("dynamic_tool", path)
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        """Refresh the shared registry (cheap when nothing changed) and expose its tools."""
+        self.registry.refresh()
+        self.tools = self.registry.snapshot()
 
-            for name, obj in inspect.getmembers(module):
-                if inspect.isclass(obj) and issubclass(obj, BaseTool) and obj is not BaseTool:
-                    tool_instance = obj()
-                    self.tools[tool_instance.name] = tool_instance
-                    print(f"Loaded tool: {tool_instance.name}")
-        except Exception as e:
-            print(f"Error loading tool from {path}: {e}")
+    @property
+    def discovery_time_ms(self) -> float:
+        """How long the last tool discovery took."""
+        return self.registry.last_discovery_ms
 
     def get_ollama_tools_definitions(self):
-        enabled_map = self.config.get("enabled_tools", {})
-        active_tools = []
-        for name, tool in self.tools.items():
-            # Default to True if not in map
-            if enabled_map.get(name, True):
-                active_tools.append(tool.to_ollama_format())
-        return active_tools
+        return self.registry.get_schemas()
+
+    def get_latency_stats(self) -> dict:
+        """Per-tool call counts and latencies since startup."""
+        return self.executor.get_stats()
 
-    def execute_tool(self, tool_name, status_callback=None, **kwargs):
+    def get_timeout(self, tool) -> float:
+        overrides = self.config.get("tool_timeouts", {})
+        return overrides.get(tool.name, getattr(tool, "timeout", None))
+
+    def execute_tool(self, tool_name, status_callback=None, cancel_event=None, **kwargs):
+        """
+        Run a tool on the shared executor. Returns the tool result, or a
+        message for the model if the tool timed out or was cancelled through
+        cancel_event (e.g. ChatPage._cancel_event).
+        """
         # check if enabled
         enabled_map = self.config.get("enabled_tools", {})
         if not enabled_map.get(tool_name, True):
@@ -52,7 +48,12 @@ class ToolManager:
 
         if tool_name in self.tools:
             tool = self.tools[tool_name]
-            sig = inspect.signature(tool.execute)
+            if isinstance(tool, LazyTool):
+                try:
+                    tool = tool.resolve()
+                except Exception as e:
+                    return f"Error loading tool {tool_name}: {e}"
+            sig = inspect.signature(tool.aexecute if has_async_execute(tool) else tool.execute)
             
             # Prepare status callback wrapper
             from src.core.status.manager import StatusManager
@@ -69,6 +70,32 @@ class ToolManager:
             # Pass our wrapper if the tool accepts 'status_callback'
             if "status_callback" in sig.parameters:
                 kwargs["status_callback"] = report_status
-                
-            return tool.execute(**kwargs)
+
+            # Tools that accept 'cancel_event' can stop cooperatively on Stop or timeout
+            tool_cancel = threading.Event()
+            if "cancel_event" in sig.parameters:
+                kwargs["cancel_event"] = tool_cancel
+
+            timeout = self.get_timeout(tool)
+            outcome = "ok"
+            start = time.monotonic()
+            with Tracer().span(f"tool.{tool_name}", "tool") as span:
+                try:
+                    return self.executor.run_tool(tool, kwargs, timeout=timeout, cancel_event=cancel_event)
+                except ToolTimeoutError:
+                    outcome = "timeout"
+                    tool_cancel.set()
+                    return f"Tool '{tool_name}' timed out after {timeout} seconds."
+                except ToolCancelledError:
+                    outcome = "cancelled"
+                    tool_cancel.set()
+                    return f"Tool '{tool_name}' was cancelled by the user."
+                except Exception:
+                    outcome = "error"
+                    raise
+                finally:
+                    elapsed = time.monotonic() - start
+                    span.set(outcome=outcome)
+                    self.executor.record(tool_name, elapsed, outcome)
+                    print(f"[ToolManager] {tool_name} finished in {elapsed * 1000:.0f} ms ({outcome})")
         return f"Tool {tool_name} not found."
@@ -0,0 +1,241 @@
+import os
+import json
+import time
+import threading
+import importlib.util
+import inspect
+from src.tools.base import BaseTool
+from src.core.config import ConfigManager
+
+MANIFEST_VERSION = 1
+
+
+def get_tool_manifest_path():
+    """Manifest of tool schemas in ~/.cache/gaia, so tool modules are not imported at startup."""
+    cache_dir = os.path.expanduser("~/.cache/gaia")
+    os.makedirs(cache_dir, exist_ok=True)
+    return os.path.join(cache_dir, "tool_manifest.json")
+
+
+def _tool_dir_signature(path):
+    """Cheap change detector for a tool package: newest .py mtime and file count."""
+    newest = 0
+    count = 0
+    for root, dirs, files in os.walk(path):
+        dirs[:] = [d for d in dirs if d != "__pycache__"]
+        for f in files:
+            if f.endswith(".py"):
+                count += 1
+                newest = max(newest, os.stat(os.path.join(root, f)).st_mtime_ns)
+    return f"{newest}:{count}"
+
+
+def _import_tool_module(path):
+    # One module name per tool package, so cached modules never shadow each other
+    module_name = "gaia_tool_" + os.path.basename(os.path.dirname(path))
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class LazyTool(BaseTool):
+    """
+    Stand-in built from the tool manifest. Exposes the schema without
+    importing the tool module; the real tool is imported on first execution.
+    """
+    def __init__(self, spec: dict, path: str, registry=None):
+        self._spec = spec
+        self._path = path
+        self._registry = registry
+        self._tool = None
+
+    @property
+    def name(self) -> str:
+        return self._spec["name"]
+
+    @property
+    def description(self) -> str:
+        return self._spec["description"]
+
+    @property
+    def parameters(self) -> dict:
+        return self._spec["parameters"]
+
+    def resolve(self) -> BaseTool:
+        if self._tool is None:
+            module = self._registry.import_module(self._path) if self._registry else _import_tool_module(self._path)
+            cls = getattr(module, self._spec["class"])
+            self._tool = cls()
+            print(f"Imported tool: {self.name}")
+        return self._tool
+
+    def execute(self, **kwargs):
+        return self.resolve().execute(**kwargs)
+
+
+class ToolRegistry:
+    """
+    Process-wide registry of tools.
+    Each tool package is imported at most once and its instances and
+    to_ollama_format() schemas are cached. A package is only reloaded when
+    one of its .py files changes; the schema list is rebuilt when that
+    happens or when the enabled_tools config changes.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ToolRegistry, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.tools_dir = os.path.dirname(os.path.abspath(__file__))
+        self.config = ConfigManager()
+        self._refresh_lock = threading.RLock()
+        self.tools = {}          # tool name -> BaseTool (or LazyTool)
+        self._packages = {}      # package dir name -> (signature, [tool names])
+        self._modules = {}       # tool.py path -> imported module
+        self._enabled_snapshot = None
+        self._schemas = None
+        self.last_discovery_ms = 0.0
+        self.imports = 0         # Number of tool module imports so far
+
+    def refresh(self):
+        """Re-scan the tools folder, reloading only what changed. Returns the discovery time in ms."""
+        start = time.perf_counter()
+        with self._refresh_lock:
+            manifest = self._read_manifest()
+            manifest_changed = False
+            tools_changed = False
+            seen = set()
+
+            # Scan subdirectories for tools
+            # Structure: src/tools/<tool_name>/tool.py
+            for item in sorted(os.listdir(self.tools_dir)):
+                item_path = os.path.join(self.tools_dir, item)
+                tool_file = os.path.join(item_path, "tool.py")
+                if not os.path.isdir(item_path) or not os.path.exists(tool_file):
+                    continue
+                seen.add(item)
+
+                signature = _tool_dir_signature(item_path)
+                known = self._packages.get(item)
+                if known and known[0] == signature:
+                    continue
+
+                # New or changed package: drop its old tools and module first
+                if known:
+                    for name in known[1]:
+                        self.tools.pop(name, None)
+                self._modules.pop(tool_file, None)
+                tools_changed = True
+
+                entry = manifest.get(item)
+                if entry and entry.get("signature") == signature:
+                    # Unchanged since the manifest was written: no import needed
+                    loaded = {spec["name"]: LazyTool(spec, tool_file, self) for spec in entry["specs"]}
+                else:
+                    loaded, specs = self._load_tool_from_file(tool_file)
+                    if specs is None:
+                        # Import failed: leave it out so it is retried next time
+                        self._packages.pop(item, None)
+                        continue
+                    manifest[item] = {"signature": signature, "specs": specs}
+                    manifest_changed = True
+
+                self.tools.update(loaded)
+                self._packages[item] = (signature, list(loaded.keys()))
+
+            for item in list(self._packages.keys()):
+                if item not in seen:
+                    for name in self._packages.pop(item)[1]:
+                        self.tools.pop(name, None)
+                    manifest.pop(item, None)
+                    tools_changed = manifest_changed = True
+
+            if manifest_changed:
+                self._write_manifest(manifest)
+
+            enabled_map = dict(self.config.get("enabled_tools", {}))
+            if tools_changed or self._schemas is None or enabled_map != self._enabled_snapshot:
+                self._enabled_snapshot = enabled_map
+                self._schemas = [
+                    tool.to_ollama_format()
+                    for name, tool in self.tools.items()
+                    # Default to True if not in map
+                    if enabled_map.get(name, True)
+                ]
+
+        self.last_discovery_ms = (time.perf_counter() - start) * 1000.0
+        if tools_changed:
+            print(f"[ToolRegistry] Discovered {len(self.tools)} tools in {self.last_discovery_ms:.1f} ms "
+                  f"({self.imports} module imports so far)")
+        return self.last_discovery_ms
+
+    def get_schemas(self):
+        """Cached to_ollama_format() schemas of the enabled tools."""
+        with self._refresh_lock:
+            if self._schemas is None:
+                self.refresh()
+            return list(self._schemas)
+
+    def snapshot(self) -> dict:
+        """Copy of the tools dict, safe to iterate while another thread refreshes."""
+        with self._refresh_lock:
+            return dict(self.tools)
+
+    def import_module(self, path):
+        """Import a tool.py once; packages exporting several tools share the module."""
+        with self._refresh_lock:
+            module = self._modules.get(path)
+            if module is None:
+                module = _import_tool_module(path)
+                self._modules[path] = module
+                self.imports += 1
+            return module
+
+    def _read_manifest(self):
+        try:
+            with open(get_tool_manifest_path(), "r") as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                return data.get("tools", {})
+        except (OSError, ValueError):
+            pass
+        return {}
+
+    def _write_manifest(self, manifest):
+        try:
+            path = get_tool_manifest_path()
+            with open(path + ".tmp", "w") as f:
+                json.dump({"version": MANIFEST_VERSION, "tools": manifest}, f)
+            os.replace(path + ".tmp", path)
+        except OSError as e:
+            print(f"Error writing tool manifest: {e}")
+
+    def _load_tool_from_file(self, path):
+        """Import a tool module now. Returns (tools by name, manifest specs), specs is None on failure."""
+        tools = {}
+        specs = []
+        try:
+            module = self.import_module(path)
+
+            for name, obj in inspect.getmembers(module):
+                if inspect.isclass(obj) and issubclass(obj, BaseTool) and obj is not BaseTool and obj is not LazyTool:
+                    tool_instance = obj()
+                    tools[tool_instance.name] = tool_instance
+                    specs.append({
+                        "name": tool_instance.name,
+                        "class": name,
+                        "description": tool_instance.description,
+                        "parameters": tool_instance.parameters
+                    })
+                    print(f"Loaded tool: {tool_instance.name}")
+        except Exception as e:
+            print(f"Error loading tool from {path}: {e}")
+            return {}, None
+        return tools, specs
@@ -0,0 +1,241 @@
+"""
+Query-aware tool selection.
+
+Small local models slow down noticeably when every enabled tool schema is
+sent on every turn. The ToolSelector scores the enabled tools against the
+user message (plus a little recent context) with BM25 over each tool's
+name, description, parameter descriptions and localized keywords, and only
+the top-k schemas are sent. A `request_tools` pseudo-tool lets the model
+ask for anything the ranking missed.
+"""
+
+import json
+import math
+import re
+import threading
+import unicodedata
+from collections import Counter
+
+from src.core.config import ConfigManager
+from src.core.prompt_manager import PromptManager
+
+REQUEST_TOOLS_NAME = "request_tools"
+DEFAULT_TOP_K = 4
+CONTEXT_WEIGHT = 0.5  # Recent messages count half as much as the current one
+STEM_LENGTH = 6       # Crude, language-agnostic stemming by prefix
+MIN_RELATIVE_SCORE = 0.25  # Drop weak matches scoring under a quarter of the best one
+
+
+def tokenize(text: str) -> list:
+    """Lowercase, strip accents, split on non-alphanumerics (also splits snake_case names)."""
+    text = unicodedata.normalize("NFKD", (text or "").lower())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return [word[:STEM_LENGTH] for word in re.findall(r"[a-z0-9]+", text) if len(word) > 1]
+
+
+def estimate_tokens(value) -> int:
+    """Rough prompt token estimate (about 4 characters per token)."""
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False)
+    return len(value) // 4
+
+
+def _schema_name(schema: dict) -> str:
+    return schema.get("function", {}).get("name", "")
+
+
+def _schema_text(schema: dict) -> str:
+    """Searchable text of a tool schema: name, description and parameter descriptions."""
+    function = schema.get("function", {})
+    parts = [function.get("name", ""), function.get("description", "")]
+    properties = (function.get("parameters") or {}).get("properties", {})
+    for param, spec in properties.items():
+        parts.append(param)
+        if isinstance(spec, dict):
+            parts.append(str(spec.get("description", "")))
+            parts.extend(str(v) for v in spec.get("enum", []))
+    return " ".join(parts)
+
+
+class BM25Index:
+    """Okapi BM25 over a handful of short documents (one per tool)."""
+    K1 = 1.5
+    B = 0.75
+
+    def __init__(self, documents: dict):
+        self.term_freqs = {name: Counter(tokens) for name, tokens in documents.items()}
+        self.lengths = {name: len(tokens) for name, tokens in documents.items()}
+        self.avg_length = (sum(self.lengths.values()) / len(documents)) if documents else 0.0
+
+        doc_freq = Counter()
+        for freqs in self.term_freqs.values():
+            doc_freq.update(freqs.keys())
+        n = len(documents)
+        self.idf = {
+            term: math.log(1 + (n - df + 0.5) / (df + 0.5))
+            for term, df in doc_freq.items()
+        }
+
+    def score(self, query_weights: dict) -> dict:
+        """query_weights: term -> weight. Returns name -> score for documents with a match."""
+        scores = {}
+        for name, freqs in self.term_freqs.items():
+            norm = self.K1 * (1 - self.B + self.B * self.lengths[name] / (self.avg_length or 1))
+            total = 0.0
+            for term, weight in query_weights.items():
+                tf = freqs.get(term)
+                if tf:
+                    total += weight * self.idf[term] * tf * (self.K1 + 1) / (tf + norm)
+            if total > 0:
+                scores[name] = total
+        return scores
+
+
+class ToolSelection:
+    """The tools offered for one request. `tools` is the list passed to the model."""
+
+    def __init__(self, selector, all_schemas: list, selected: list, active: bool):
+        self.selector = selector
+        self.all_schemas = all_schemas
+        self.active = active
+        self.names = [_schema_name(s) for s in selected]
+        self.tools = list(selected)
+        if active and len(selected) < len(all_schemas):
+            self.tools.append(selector.request_tools_schema())
+
+    @property
+    def guideline_tools(self):
+        """Tool names whose guidelines belong in the system prompt (None means all)."""
+        return set(self.names) if self.active else None
+
+    def expand(self, need: str) -> str:
+        """Handle a `request_tools` call: add the best matching tools that were left out."""
+        prompt_manager = PromptManager()
+        remaining = [s for s in self.all_schemas if _schema_name(s) not in self.names]
+        ranked = self.selector.rank(remaining, need, corpus=self.all_schemas)
+        if not ranked and not tokenize(need):
+            ranked = remaining  # No usable description: offer everything
+        added = ranked[:self.selector.top_k]
+        if not added:
+            return prompt_manager.get("tool_selection.none_added")
+
+        # Keep `request_tools` last, drop it once nothing is left to request
+        insert_at = len(self.names)
+        self.tools[insert_at:insert_at] = added
+        self.names.extend(_schema_name(s) for s in added)
+        if len(self.names) >= len(self.all_schemas):
+            # In place: the agent loop holds on to this list for the whole turn
+            self.tools[:] = [t for t in self.tools if _schema_name(t) != REQUEST_TOOLS_NAME]
+
+        added_names = ", ".join(_schema_name(s) for s in added)
+        print(f"[ToolSelection] Model requested more tools, added: {added_names}")
+        return prompt_manager.get("tool_selection.added", tools=added_names)
+
+    def report(self, full_system_prompt: str, system_prompt: str) -> int:
+        """Log and return the estimated prompt tokens saved against sending every tool."""
+        full = estimate_tokens(self.all_schemas) + estimate_tokens(full_system_prompt)
+        sent = estimate_tokens(self.tools) + estimate_tokens(system_prompt)
+        saved = max(0, full - sent)
+        if self.active:
+            print(f"[ToolSelection] Sent {len(self.names)}/{len(self.all_schemas)} tools "
+                  f"({', '.join(self.names) or 'none'}), saved ~{saved} prompt tokens "
+                  f"({sent} instead of {full})")
+        return saved
+
+
+class ToolSelector:
+    """Singleton holding the BM25 index of the enabled tools, rebuilt when the schemas change."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ToolSelector, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = ConfigManager()
+        self._index = None
+        self._signature = None
+        self._index_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.get("tool_selection_enabled", True))
+
+    @property
+    def top_k(self) -> int:
+        return max(1, int(self.config.get("tool_selection_top_k", DEFAULT_TOP_K)))
+
+    def request_tools_schema(self) -> dict:
+        prompt_manager = PromptManager()
+        return {
+            'type': 'function',
+            'function': {
+                'name': REQUEST_TOOLS_NAME,
+                'description': prompt_manager.get("tool_selection.request_tools_description"),
+                'parameters': {
+                    "type": "object",
+                    "properties": {
+                        "need": {
+                            "type": "string",
+                            "description": prompt_manager.get("tool_selection.request_tools_need")
+                        }
+                    },
+                    "required": ["need"]
+                }
+            }
+        }
+
+    def _get_index(self, schemas: list) -> BM25Index:
+        prompt_manager = PromptManager()
+        signature = (prompt_manager.language, tuple(_schema_text(s) for s in schemas))
+        with self._index_lock:
+            if signature != self._signature:
+                keywords = prompt_manager.get("tool_selection.keywords")
+                if not isinstance(keywords, dict):
+                    keywords = {}
+                documents = {}
+                for schema in schemas:
+                    name = _schema_name(schema)
+                    documents[name] = tokenize(_schema_text(schema) + " " + keywords.get(name, ""))
+                self._index = BM25Index(documents)
+                self._signature = signature
+            return self._index
+
+    def rank(self, schemas: list, query: str, context: str = "", corpus: list = None) -> list:
+        """
+        Schemas matching the query, best first. Tools without any match are left out.
+        `corpus` is the full tool set when ranking a subset, so IDF stays stable.
+        """
+        weights = Counter()
+        for token in tokenize(context):
+            weights[token] += CONTEXT_WEIGHT
+        for token in tokenize(query):
+            weights[token] += 1.0
+        if not weights:
+            return []
+
+        scores = self._get_index(corpus or schemas).score(weights)
+        if scores:
+            cutoff = max(scores.values()) * MIN_RELATIVE_SCORE
+            scores = {name: score for name, score in scores.items() if score >= cutoff}
+        ranked = [s for s in schemas if _schema_name(s) in scores]
+        ranked.sort(key=lambda s: scores[_schema_name(s)], reverse=True)
+        return ranked
+
+    def select(self, schemas: list, query: str, context: str = "", pinned=()) -> ToolSelection:
+        """
+        Pick the tools to send for a request.
+        Pinned tools (e.g. used earlier in the chat) are always included, on top of the top-k.
+        """
+        if not self.enabled or len(schemas) <= self.top_k:
+            return ToolSelection(self, schemas, schemas, active=False)
+
+        pinned = set(pinned)
+        selected = [s for s in schemas if _schema_name(s) in pinned]
+        ranked = [s for s in self.rank(schemas, query, context) if _schema_name(s) not in pinned]
+        selected.extend(ranked[:self.top_k])
+        return ToolSelection(self, schemas, selected, active=True)
@@ -2,6 +2,7 @@ import asyncio
 from typing import Dict, Any, List
 from src.tools.web_builder.state import AgentState
 from src.tools.web_builder.nodes import builder_planner, file_writer_node
+from src.core.tracing import Tracer
 
 class WebBuilderGraph:
     def __init__(self):
@@ -29,7 +30,9 @@ class WebBuilderGraph:
         if status_callback:
             status_callback("Planning project structure...", 10)
             
-        plan_update = await builder_planner(state)
+        with Tracer().span("web_builder.plan", "stage") as span:
+            plan_update = await builder_planner(state)
+            span.set(files=len(plan_update.get("files_plan", [])))
         if "error" in plan_update:
             state["error"] = plan_update["error"]
             return state
@@ -97,7 +100,9 @@ class WebBuilderGraph:
             # However, the node 'file_writer_node' calls 'async_generate_response' which uses the semaphore.
             # So rate limiting is still active, but we only use 1 slot at a time here.
             try:
-                res = await file_writer_node(filename, instruction, dependencies, state)
+                with Tracer().span("web_builder.file", "stage", filename=filename) as span:
+                    res = await file_writer_node(filename, instruction, dependencies, state)
+                    span.set(success=bool(res.get("success")))
                 results.append(res)
                 
                 if res.get("success"):
@@ -8,6 +8,7 @@ from gi.repository import Notify, GLib, Gio
 from src.tools.web_builder.graph import WebBuilderGraph
 from src.core.config import get_artifacts_dir
 from src.core.status.manager import StatusManager
+from src.core.tracing import Tracer
 
 class BackgroundWebBuilderManager:
     _instance = None
@@ -19,26 +20,25 @@ class BackgroundWebBuilderManager:
             cls._instance.active_tasks = {} # project_id -> {graph, notification, description, ...}
         return cls._instance
 
-    def create_plan(self, description: str, project_id: str):
+    def create_plan(self, description: str, project_id: str, cancel_event=None):
         """
-        Creates a plan synchronously (from the caller's perspective) but runs async internally.
-        Stores the plan in pending state.
+        Creates a plan synchronously (from the caller's perspective) but runs async internally
+        on the shared tool event loop. Stores the plan in pending state.
         """
+        from src.tools.executor import ToolExecutor, ToolCancelledError
         graph = WebBuilderGraph()
         
-        # Run planning synchronously (this blocks the tool thread, not UI)
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
         # Status update
         StatusManager().emit_status(project_id, "Web Builder: Planning architecture...")
         
+        # Run planning on the shared loop (this blocks the tool thread, not UI)
         try:
-            state = loop.run_until_complete(graph.plan(description, project_id))
+            state = ToolExecutor().run_coroutine(graph.plan(description, project_id), cancel_event=cancel_event)
+        except ToolCancelledError:
+            graph.cancel()
+            return {"error": "Planning was cancelled."}
         except Exception as e:
-            loop.close()
             return {"error": str(e)}
-        loop.close()
         
         if state.get("error"):
             return {"error": state["error"]}
@@ -89,19 +89,20 @@ class BackgroundWebBuilderManager:
             asyncio.set_event_loop(loop)
             task_info["loop"] = loop
             
-            task = loop.create_task(graph.execute_from_plan(state, status_callback=status_callback))
-            task_info["task"] = task
-            
-            try:
-                final_state = loop.run_until_complete(task)
-                loop.close()
-                GLib.idle_add(self._on_build_finished, project_id, final_state)
-            except asyncio.CancelledError:
-                GLib.idle_add(self._on_build_finished, project_id, {"error": "Build cancelled by user."})
-            except Exception as e:
-                import traceback
-                traceback.print_exc()
-                GLib.idle_add(self._on_build_failed, project_id, str(e))
+            with Tracer().run("web_builder", project_id=project_id, files=len(state.get("files_plan", []))):
+                task = loop.create_task(graph.execute_from_plan(state, status_callback=status_callback))
+                task_info["task"] = task
+                
+                try:
+                    final_state = loop.run_until_complete(task)
+                    loop.close()
+                    GLib.idle_add(self._on_build_finished, project_id, final_state)
+                except asyncio.CancelledError:
+                    GLib.idle_add(self._on_build_finished, project_id, {"error": "Build cancelled by user."})
+                except Exception as e:
+                    import traceback
+                    traceback.print_exc()
+                    GLib.idle_add(self._on_build_failed, project_id, str(e))
 
         thread = threading.Thread(target=run_in_thread, daemon=True)
         thread.start()
@@ -196,9 +197,12 @@ class BackgroundWebBuilderManager:
     def _trigger_ui_update(self, project_id, artifacts):
         try:
             app = Gio.Application.get_default()
-            if not app: return
-            
-            win = app.get_active_window()
+            win = app.get_active_window() if app else None
+            if not (win and hasattr(win, "chat_pages") and project_id in win.chat_pages):
+                # The chat's tab is closed: save the artifacts into the stored chat
+                from src.core.chat_storage import ChatStorage
+                storage = getattr(win, "storage", None) or ChatStorage()
+                storage.update_last_message_metadata(project_id, {'artifacts': artifacts})
             if win:
                 if hasattr(win, "chat_pages") and project_id in win.chat_pages:
                     chat_page = win.chat_pages[project_id]
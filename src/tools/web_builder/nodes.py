@@ -7,6 +7,7 @@ from src.tools.web_builder.state import AgentState, FilePlan
 from src.core.ai_client import AIClient
 from src.core.prompt_manager import PromptManager
 from src.core.config import get_artifacts_dir
+from src.core.tracing import bind_context
 
 ai_client = AIClient()
 prompt_manager = PromptManager()
@@ -25,7 +26,7 @@ async def async_generate_response(messages, status_callback=None):
     async with concurrency_manager.get_async_semaphore():
         # Do not overwrite status here to "Generating content..." as it hides the specific file task
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, ai_client.generate_response, messages)
+        return await loop.run_in_executor(None, bind_context(ai_client.generate_response, messages))
 
 
 async def builder_planner(state: AgentState) -> Dict[str, Any]:
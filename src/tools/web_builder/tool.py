@@ -6,6 +6,8 @@ from src.core.prompt_manager import PromptManager
 from src.tools.web_builder.manager import BackgroundWebBuilderManager
 
 class WebBuilderTool(BaseTool):
+    timeout = 600  # Planning waits for a full LLM generation
+
     @property
     def name(self) -> str:
         return "web_builder"
@@ -49,7 +51,7 @@ class WebBuilderTool(BaseTool):
             "required": ["project_id"]
         }
 
-    def execute(self, files: list = None, description: str = None, project_id: str = None, action: str = None, status_callback=None, **kwargs):
+    def execute(self, files: list = None, description: str = None, project_id: str = None, action: str = None, status_callback=None, cancel_event=None, **kwargs):
         prompt_manager = PromptManager()
         
         if project_id is None:
@@ -63,7 +65,7 @@ class WebBuilderTool(BaseTool):
             # Fallback: If no pending plan but we have a description, create and run immediately
             if "No pending plan" in str(result) and description:
                 print(f"[WebBuilder] No pending plan found, but description provided. Creating and executing immediately.")
-                plan_res = manager.create_plan(description, project_id)
+                plan_res = manager.create_plan(description, project_id, cancel_event=cancel_event)
                 if isinstance(plan_res, dict) and "error" in plan_res:
                      return f" {result} And failed to create new plan: {plan_res['error']}"
                 
@@ -85,7 +87,7 @@ class WebBuilderTool(BaseTool):
                 elif status == "running":
                     return "Web Builder is already running for this project. Do NOT generate a new plan. Wait for it to finish."
             
-            result = manager.create_plan(description, project_id)
+            result = manager.create_plan(description, project_id, cancel_event=cancel_event)
             
             if isinstance(result, dict) and "error" in result:
                 return f"Error creating plan: {result['error']}"
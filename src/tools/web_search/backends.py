@@ -0,0 +1,381 @@
+"""
+Pluggable search backends.
+
+Every backend implements SearchBackend and is registered with
+register_backend(). SearchRouter runs the available ones in one of three
+modes (config `search_mode`):
+
+    race      backends start in priority order, each one `search_hedge_delay`
+              seconds after the previous (or right away when it fails); the
+              first non-empty answer wins and the rest are abandoned
+    merge     all backends run together; results are interleaved and
+              deduplicated by URL
+    fallback  one after the other until one answers (the old behaviour)
+
+Each backend has a circuit breaker. After repeated failures, or at once when
+it reports a rate limit, the backend is skipped for a cooldown period
+instead of failing every query; one trial request then decides whether it
+is healthy again.
+"""
+
+import concurrent.futures
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List
+
+from src.core.config import ConfigManager
+from src.core.tracing import Tracer, bind_context
+
+MODE_RACE = "race"
+MODE_MERGE = "merge"
+MODE_FALLBACK = "fallback"
+
+DEFAULT_MODE = MODE_RACE
+DEFAULT_HEDGE_DELAY = 1.0     # Seconds before the next backend joins a race
+DEFAULT_SEARCH_TIMEOUT = 12   # Overall budget for one routed search
+MAX_WORKERS = 6
+
+UNAVAILABLE = "All search backends are unavailable (cooling down after errors)"
+
+
+class RateLimitedError(Exception):
+    """The backend refused the request because of rate limiting."""
+
+
+def is_rate_limit(error: Exception) -> bool:
+    """HTTP 429 or a library-specific rate limit exception."""
+    if isinstance(error, RateLimitedError) or "ratelimit" in type(error).__name__.lower():
+        return True
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) == 429
+
+
+class CircuitBreaker:
+    """
+    closed: requests pass. open: requests are skipped until the cooldown ends.
+    half-open: one trial request is let through; success closes the breaker,
+    failure opens it again.
+    """
+    FAILURE_THRESHOLD = 3
+    COOLDOWN = 60.0
+    RATE_LIMIT_COOLDOWN = 300.0
+
+    def __init__(self, name: str):
+        self.name = name
+        self.failures = 0
+        self.open_until = 0.0
+        self.trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self.open_until == 0.0:
+                return "closed"
+            return "open" if time.monotonic() < self.open_until else "half-open"
+
+    def ready(self) -> bool:
+        """Whether allow() would let a request through, without claiming the half-open trial."""
+        with self._lock:
+            if self.open_until == 0.0:
+                return True
+            return time.monotonic() >= self.open_until and not self.trial_running
+
+    def allow(self) -> bool:
+        """Claim a request; in half-open state only one (the trial) is let through."""
+        with self._lock:
+            if self.open_until == 0.0:
+                return True
+            if time.monotonic() < self.open_until or self.trial_running:
+                return False
+            self.trial_running = True  # Half-open: this request is the trial
+            return True
+
+    def release(self):
+        """Give back a claimed request that never ran (cancelled or skipped)."""
+        with self._lock:
+            self.trial_running = False
+
+    def record_success(self):
+        with self._lock:
+            self.failures = 0
+            self.open_until = 0.0
+            self.trial_running = False
+
+    def record_failure(self, rate_limited: bool = False):
+        with self._lock:
+            self.failures += 1
+            was_trial = self.trial_running
+            self.trial_running = False
+            if rate_limited or was_trial or self.failures >= self.FAILURE_THRESHOLD:
+                cooldown = self.RATE_LIMIT_COOLDOWN if rate_limited else self.COOLDOWN
+                self.open_until = time.monotonic() + cooldown
+                reason = "rate limited" if rate_limited else f"{self.failures} failures"
+                print(f"[SearchRouter] {self.name} disabled for {cooldown:.0f}s ({reason})")
+
+
+class SearchBackend(ABC):
+    """Base class for search backends. Lower priority values are tried first."""
+    name = ""
+    priority = 100
+
+    def available(self) -> bool:
+        """Whether the backend is configured (API key present, library installed...)."""
+        return True
+
+    @abstractmethod
+    def search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        """Return results with 'title', 'url' and 'snippet'. Raise on failure."""
+        pass
+
+
+class BraveBackend(SearchBackend):
+    name = "brave"
+    priority = 10
+
+    def available(self) -> bool:
+        return bool(ConfigManager().get("brave_search_api_key"))
+
+    def search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        from src.tools.web_search.search import search_brave
+        return search_brave(query, ConfigManager().get("brave_search_api_key"), max_results)
+
+
+class DuckDuckGoBackend(SearchBackend):
+    name = "ddg"
+    priority = 20
+
+    def search(self, query: str, max_results: int) -> List[Dict[str, str]]:
+        from src.tools.web_search.search import ddg_text
+        return ddg_text(query, max_results)
+
+
+_backends = []
+_backends_lock = threading.Lock()
+
+
+def register_backend(backend: SearchBackend):
+    """Add a backend (replacing one with the same name)."""
+    with _backends_lock:
+        _backends[:] = [b for b in _backends if b.name != backend.name]
+        _backends.append(backend)
+        _backends.sort(key=lambda b: b.priority)
+
+
+def get_backends() -> List[SearchBackend]:
+    """Registered backends that are configured, best first."""
+    with _backends_lock:
+        backends = list(_backends)
+    return [b for b in backends if b.available()]
+
+
+register_backend(BraveBackend())
+register_backend(DuckDuckGoBackend())
+
+
+class SearchRouter:
+    """Singleton running searches across backends with per-backend circuit breakers."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(SearchRouter, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = ConfigManager()
+        self._pool = concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="gaia-search")
+        self._breakers = {}
+        self._breakers_lock = threading.Lock()
+
+    @property
+    def mode(self) -> str:
+        mode = self.config.get("search_mode", DEFAULT_MODE)
+        return mode if mode in (MODE_RACE, MODE_MERGE, MODE_FALLBACK) else DEFAULT_MODE
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        with self._breakers_lock:
+            if name not in self._breakers:
+                self._breakers[name] = CircuitBreaker(name)
+            return self._breakers[name]
+
+    def get_health(self) -> dict:
+        """backend name -> circuit breaker state ('closed', 'open' or 'half-open')."""
+        with self._breakers_lock:
+            breakers = dict(self._breakers)
+        return {name: breaker.state for name, breaker in breakers.items()}
+
+    def label(self) -> str:
+        """Name of the configured backend set (e.g. 'brave+ddg'), used as the search cache key."""
+        return "+".join(b.name for b in get_backends())
+
+    # --- Running ---
+
+    def _call(self, backend: SearchBackend, query: str, max_results: int):
+        """Run one backend and feed its breaker. Returns the result list or raises."""
+        breaker = self.breaker(backend.name)
+        with Tracer().span("search.backend", "search", backend=backend.name) as span:
+            try:
+                results = backend.search(query, max_results)
+            except Exception as e:
+                breaker.record_failure(rate_limited=is_rate_limit(e))
+                span.set(outcome="rate_limited" if is_rate_limit(e) else "error")
+                raise
+            breaker.record_success()
+            span.set(outcome="ok", results=len(results))
+            return results
+
+    def _submit(self, backend, query, max_results):
+        """Claim the backend's breaker and start it in the pool; None if the breaker refuses."""
+        if not self.breaker(backend.name).allow():
+            return None
+        return self._pool.submit(bind_context(self._call, backend, query, max_results))
+
+    def _cancel(self, future, backend):
+        """Cancel a submitted call; if it had not started, its breaker claim is given back."""
+        if future.cancel():
+            self.breaker(backend.name).release()
+
+    def search(self, query: str, max_results: int):
+        """
+        Search with the configured mode. Returns (results, served_by); raises
+        the last backend error if no backend produced results.
+        """
+        # Breakers are only claimed when a backend actually runs (see _submit)
+        backends = [b for b in get_backends() if self.breaker(b.name).ready()]
+        if not backends:
+            raise RuntimeError(UNAVAILABLE)
+
+        mode = self.mode
+        if mode == MODE_MERGE and len(backends) > 1:
+            return self._merge(backends, query, max_results)
+        if mode == MODE_FALLBACK or len(backends) == 1:
+            return self._fallback(backends, query, max_results)
+        return self._race(backends, query, max_results)
+
+    def _fallback(self, backends, query, max_results):
+        last_error = None
+        tried = False
+        for backend in backends:
+            if not self.breaker(backend.name).allow():
+                continue
+            tried = True
+            try:
+                results = self._call(backend, query, max_results)
+            except Exception as e:
+                print(f"[SearchRouter] {backend.name} failed: {e}")
+                last_error = e
+                continue
+            if results:
+                return results, backend.name
+        if last_error:
+            raise last_error
+        if not tried:
+            raise RuntimeError(UNAVAILABLE)
+        return [], backends[0].name
+
+    def _race(self, backends, query, max_results):
+        deadline = time.monotonic() + float(self.config.get("search_timeout", DEFAULT_SEARCH_TIMEOUT))
+        hedge_delay = float(self.config.get("search_hedge_delay", DEFAULT_HEDGE_DELAY))
+        waiting = list(backends)
+        running = {}
+        last_error = None
+        empty_from = None
+        started = False
+
+        while waiting or running:
+            if waiting:
+                backend = waiting.pop(0)
+                future = self._submit(backend, query, max_results)
+                if future is None:
+                    continue  # Its trial was taken by a concurrent search
+                running[future] = backend
+                started = True
+            # Wait for an answer, but let the next backend join after the hedge delay
+            now = time.monotonic()
+            if now >= deadline:
+                break
+            timeout = min(hedge_delay, deadline - now) if waiting else deadline - now
+            done, _ = concurrent.futures.wait(running, timeout=timeout, return_when=concurrent.futures.FIRST_COMPLETED)
+
+            for future in done:
+                backend = running.pop(future)
+                try:
+                    results = future.result()
+                except Exception as e:
+                    print(f"[SearchRouter] {backend.name} failed: {e}")
+                    last_error = e
+                    continue
+                if results:
+                    for other, other_backend in running.items():
+                        self._cancel(other, other_backend)  # Not started: dropped. Running: finishes in the background
+                    if running:
+                        print(f"[SearchRouter] {backend.name} won the race against "
+                              f"{', '.join(b.name for b in running.values())}")
+                    return results, backend.name
+                empty_from = backend.name
+
+        for future, backend in running.items():
+            self._cancel(future, backend)
+        if empty_from:
+            return [], empty_from
+        if last_error:
+            raise last_error
+        if not started:
+            raise RuntimeError(UNAVAILABLE)
+        raise TimeoutError("Search timed out")
+
+    def _merge(self, backends, query, max_results):
+        from src.tools.web_search.cache import normalize_url
+
+        timeout = float(self.config.get("search_timeout", DEFAULT_SEARCH_TIMEOUT))
+        futures = {}
+        for backend in backends:
+            future = self._submit(backend, query, max_results)
+            if future is not None:
+                futures[future] = backend
+        if not futures:
+            raise RuntimeError(UNAVAILABLE)
+        done, pending = concurrent.futures.wait(futures, timeout=timeout)
+        for future in pending:
+            self._cancel(future, futures[future])
+
+        lists, served_by, last_error = [], [], None
+        for future, backend in futures.items():
+            if future not in done:
+                continue
+            try:
+                results = future.result()
+            except Exception as e:
+                print(f"[SearchRouter] {backend.name} failed: {e}")
+                last_error = e
+                continue
+            if results:
+                lists.append(results)
+                served_by.append(backend.name)
+
+        if not lists:
+            if last_error:
+                raise last_error
+            return [], "+".join(b.name for b in futures.values())
+
+        # Interleave by rank (best result of each backend first), skipping duplicate URLs
+        merged, seen = [], set()
+        for rank in range(max(len(results) for results in lists)):
+            for results in lists:
+                if rank >= len(results):
+                    continue
+                result = results[rank]
+                try:
+                    key = normalize_url(result.get("url", ""))
+                except ValueError:
+                    key = result.get("url", "")
+                if key in seen:
+                    continue
+                seen.add(key)
+                merged.append(result)
+        return merged[:max_results], "+".join(served_by)
@@ -0,0 +1,287 @@
+"""
+Persistent cache of scraped pages.
+
+Popular pages (Wikipedia, documentation sites) come up again and again in
+web searches and deep research. Each extracted page is stored as a small
+JSON file in ~/.cache/gaia/scrape, keyed by the normalised URL, together
+with its ETag / Last-Modified headers:
+
+- a fresh entry is returned without touching the network or the extractor,
+- a stale entry is revalidated with If-None-Match / If-Modified-Since and
+  reused on 304 Not Modified,
+- entries are evicted least recently used first once the cache is over its
+  size budget, and never served after the maximum age.
+
+Config keys:
+    scrape_cache_enabled      turn the cache off entirely
+    scrape_cache_max_mb       size budget on disk
+    scrape_cache_max_age_days entries older than this are dropped
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+from src.core.config import ConfigManager
+
+DEFAULT_MAX_MB = 100
+DEFAULT_MAX_AGE_DAYS = 7
+DEFAULT_TTL = 6 * 3600  # Freshness when the server sends no Cache-Control max-age
+
+# Query parameters that never change the page content
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "mc_cid", "mc_eid", "ref_src")
+
+RESULT_KEYS = ("content", "image_url", "favicon_url", "og_title", "og_description")
+
+
+def get_scrape_cache_dir():
+    """Get the scraped page cache directory in ~/.cache/gaia/scrape."""
+    cache_dir = os.path.expanduser("~/.cache/gaia/scrape")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL for cache lookups: lowercase scheme and host,
+    no default port, fragment or tracking parameters, sorted query.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and not ((scheme == "http" and parts.port == 80) or (scheme == "https" and parts.port == 443)):
+        host = f"{host}:{parts.port}"
+
+    query = [
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith(TRACKING_PARAMS)
+    ]
+    path = parts.path or "/"
+    if len(path) > 1 and path.endswith("/"):
+        path = path[:-1]
+    return urlunsplit((scheme, host, path, urlencode(sorted(query)), ""))
+
+
+def _cache_directives(headers) -> list:
+    return [part.strip() for part in (headers.get("Cache-Control", "") or "").lower().split(",")]
+
+
+def _no_store(headers) -> bool:
+    """The server forbids keeping a copy at all."""
+    return "no-store" in _cache_directives(headers)
+
+
+def _parse_max_age(headers) -> int:
+    """Freshness in seconds; no-cache means stored but revalidated on every use."""
+    for part in _cache_directives(headers):
+        if part == "no-cache":
+            return 0
+        if part.startswith("max-age="):
+            try:
+                return max(int(part.split("=", 1)[1]), 0)
+            except ValueError:
+                break
+    return DEFAULT_TTL
+
+
+class ScrapeCache:
+    """Singleton on-disk cache of extracted pages."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ScrapeCache, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = ConfigManager()
+        self.cache_dir = get_scrape_cache_dir()
+        self._state_lock = threading.Lock()
+        self._disk_usage = None
+        self._stats = {"hits": 0, "revalidated": 0, "misses": 0, "stale_served": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.get("scrape_cache_enabled", True))
+
+    @property
+    def max_bytes(self) -> int:
+        return int(self.config.get("scrape_cache_max_mb", DEFAULT_MAX_MB)) * 1024 * 1024
+
+    @property
+    def max_age(self) -> float:
+        return float(self.config.get("scrape_cache_max_age_days", DEFAULT_MAX_AGE_DAYS)) * 86400
+
+    def _path_for(self, url: str) -> str:
+        digest = hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest + ".json")
+
+    # --- Lookup ---
+
+    def get(self, url: str, max_length: int, settings: dict):
+        """
+        The cached entry for url, or None. Entries extracted with other
+        scrape settings, with a shorter length limit or past the maximum
+        age are ignored.
+        """
+        path = self._path_for(url)
+        try:
+            with open(path, "r") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if (entry.get("settings") != settings or entry.get("max_length", 0) < max_length or
+                time.time() - entry.get("created_at", 0) > self.max_age):
+            return None
+        return entry
+
+    def is_fresh(self, entry: dict) -> bool:
+        return time.time() - entry.get("fetched_at", 0) < entry.get("ttl", DEFAULT_TTL)
+
+    def conditional_headers(self, entry: dict) -> dict:
+        """Request headers revalidating a stale entry."""
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def to_result(self, entry: dict, max_length: int, outcome: str) -> dict:
+        """Build a scrape result from an entry. outcome: 'hits', 'revalidated' or 'stale_served'."""
+        self._record(outcome)
+        self._touch(self._path_for(entry["url"]))
+        result = {key: entry.get(key) for key in RESULT_KEYS}
+        if result["content"] and len(result["content"]) > max_length:
+            result["content"] = result["content"][:max_length] + "..."
+        return result
+
+    # --- Updates ---
+
+    def put(self, url: str, result: dict, response_headers, max_length: int, settings: dict):
+        """Store a fresh extraction. Pages without content or sent with no-store are not cached."""
+        self._record("misses")
+        if _no_store(response_headers):
+            self._remove(normalize_url(url))  # A copy stored before the server changed its mind
+            return
+        if not result.get("content"):
+            return
+        now = time.time()
+        entry = {key: result.get(key) for key in RESULT_KEYS}
+        entry.update({
+            "url": normalize_url(url),
+            "etag": response_headers.get("ETag"),
+            "last_modified": response_headers.get("Last-Modified"),
+            "ttl": _parse_max_age(response_headers),
+            "fetched_at": now,
+            "created_at": now,
+            "max_length": max_length,
+            "settings": settings,
+        })
+        self._write(entry)
+
+    def refresh(self, entry: dict, response_headers):
+        """The server answered 304: the entry is fresh again (or dropped if it now says no-store)."""
+        if _no_store(response_headers):
+            self._remove(entry["url"])
+            return
+        entry["fetched_at"] = time.time()
+        entry["ttl"] = _parse_max_age(response_headers) if response_headers.get("Cache-Control") else entry.get("ttl", DEFAULT_TTL)
+        entry["etag"] = response_headers.get("ETag") or entry.get("etag")
+        entry["last_modified"] = response_headers.get("Last-Modified") or entry.get("last_modified")
+        self._write(entry)
+
+    def _remove(self, normalized_url: str):
+        path = self._path_for(normalized_url)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+        except OSError:
+            return
+        self._account_disk(-size)
+
+    def _write(self, entry: dict):
+        path = self._path_for(entry["url"])
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        tmp_path = f"{path}.{threading.get_ident()}.part"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[ScrapeCache] Failed to write cache entry: {e}")
+            return
+        self._account_disk(os.path.getsize(path) - old_size)
+
+    # --- Statistics ---
+
+    def _record(self, outcome: str):
+        with self._state_lock:
+            self._stats[outcome] += 1
+
+    def get_stats(self) -> dict:
+        """Counts of hits, revalidated (304), misses and stale entries served while offline."""
+        with self._state_lock:
+            return dict(self._stats)
+
+    # --- Disk budget ---
+
+    def _touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _account_disk(self, delta):
+        with self._state_lock:
+            if self._disk_usage is None:
+                self._disk_usage = self._scan_disk_usage()
+            else:
+                self._disk_usage += delta
+            over = self._disk_usage > self.max_bytes
+        if over:
+            self._evict()
+
+    def _scan_disk_usage(self):
+        total = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    total += entry.stat().st_size
+        return total
+
+    def _evict(self):
+        """Delete expired entries, then least recently used ones until the cache is at 80% of its budget."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".json"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.8)
+        expired_before = time.time() - self.max_age
+        removed = 0
+        for mtime, size, path in entries:
+            if total <= target and mtime >= expired_before:
+                break
+            try:
+                os.remove(path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        with self._state_lock:
+            self._disk_usage = total
+        print(f"[ScrapeCache] Evicted {removed} cached pages ({total // 1024} KiB left)")
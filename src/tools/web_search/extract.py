@@ -0,0 +1,346 @@
+"""
+HTML extraction for the web scraper.
+Pure CPU work, run in a worker process through WorkerPool so it does not
+hold the UI's GIL.
+
+Each page is parsed once into an lxml tree. The same tree is read for the
+OpenGraph/favicon metadata, handed to trafilatura (which copies it instead
+of parsing the bytes again) and, when trafilatura finds nothing, cleaned up
+for the fallback text extraction.
+"""
+
+import functools
+from urllib.parse import urljoin
+
+# Elements to remove from pages
+REMOVE_TAGS = [
+    "script", "style", "nav", "header", "footer",
+    "aside", "form", "iframe", "noscript", "meta",
+    "link", "button", "input", "select", "textarea",
+    "svg", "canvas", "video", "audio"
+]
+
+# Class / id fragments of elements to remove (ads, navigation, etc.)
+REMOVE_CLASS_PARTS = [
+    "nav", "menu", "sidebar", "footer", "header", "ad-",
+    "advertisement", "cookie", "popup", "modal", "banner", "social",
+    "share", "comment", "related"
+]
+REMOVE_ID_PARTS = [
+    "nav", "menu", "sidebar", "footer", "header", "ad",
+    "cookie", "popup", "modal"
+]
+
+# XPath expressions to try for finding main content (most specific first)
+MAIN_CONTENT_XPATHS = [
+    "//article", "//main", "//*[@role='main']",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article-body ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article-content ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' post-content ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' entry-content ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' content ')]",
+    "//*[@id='content']",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' post ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' article ')]",
+    "//*[contains(concat(' ', normalize-space(@class), ' '), ' story ')]",
+]
+
+TEXT_TAGS = ("p", "h1", "h2", "h3", "h4", "h5", "h6", "li")
+
+# Favicon <link> patterns, best first: (rel, type)
+ICON_PATTERNS = [
+    ("apple-touch-icon", None),
+    ("apple-touch-icon-precomposed", None),
+    ("icon", "image/png"),
+    ("shortcut icon", None),
+    ("icon", None),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def _xpaths():
+    """Compiled XPath expressions (compiled once per process)."""
+    from lxml import etree
+    removals = [f"//{tag}" for tag in REMOVE_TAGS]
+    removals += [f"//*[contains(@class, '{part}')]" for part in REMOVE_CLASS_PARTS]
+    removals += [f"//*[contains(@id, '{part}')]" for part in REMOVE_ID_PARTS]
+    return {
+        "remove": etree.XPath(" | ".join(removals)),
+        "main": [etree.XPath(xpath) for xpath in MAIN_CONTENT_XPATHS],
+        "meta": etree.XPath("//meta"),
+        "link": etree.XPath("//link[@rel]"),
+        "title": etree.XPath("//title"),
+    }
+
+
+_traf_config = None
+_traf_config_key = None
+
+
+def _get_trafilatura_config(scrape_settings: dict):
+    """The trafilatura config for these settings, rebuilt only when they change."""
+    global _traf_config, _traf_config_key
+    key = tuple(sorted((k, str(v)) for k, v in (scrape_settings or {}).items()))
+    if _traf_config is None or key != _traf_config_key:
+        from trafilatura.settings import use_config
+        # Use default Trafilatura config as base to ensure all required keys exist
+        traf_config = use_config()
+
+        # Set defaults or user-provided values
+        # Note: ConfigParser keys are case-insensitive
+        traf_config.set("DEFAULT", "min_extracted_size", str(scrape_settings.get("min_extracted_size", 250)))
+        traf_config.set("DEFAULT", "min_output_size", str(scrape_settings.get("min_output_size", 1)))
+        traf_config.set("DEFAULT", "min_extracted_comm_size", str(scrape_settings.get("min_extracted_comm_size", 1)))
+        traf_config.set("DEFAULT", "min_output_comm_size", str(scrape_settings.get("min_output_comm_size", 1)))
+        traf_config.set("DEFAULT", "extraction_timeout", str(scrape_settings.get("extraction_timeout", 0)))
+        _traf_config, _traf_config_key = traf_config, key
+    return _traf_config
+
+
+def parse_html(content):
+    """
+    Parse a page (bytes, or str when the fetch already decoded it) into an
+    lxml tree, None if it is not HTML. Uses trafilatura's loader when
+    available for its encoding detection and repair of broken markup.
+    """
+    try:
+        from trafilatura.utils import load_html
+        return load_html(content)
+    except ImportError:
+        pass
+
+    import lxml.html
+    try:
+        try:
+            return lxml.html.document_fromstring(content)
+        except ValueError:
+            if not isinstance(content, str):
+                raise
+            # str with an XML encoding declaration
+            return lxml.html.document_fromstring(content.encode("utf-8"))
+    except Exception:
+        return None
+
+
+def extract_html(content, url: str, max_length: int, scrape_settings: dict) -> dict:
+    """
+    Extract clean text content and metadata from a downloaded page.
+
+    Args:
+        content: Response body, bytes or already decoded str
+        url: Page URL (used to resolve relative favicon links)
+        max_length: Maximum content length to return
+        scrape_settings: The 'scrape_settings' config dict (trafilatura thresholds)
+
+    Returns:
+        Dict with 'content', 'image_url', 'favicon_url', 'og_title', and 'og_description',
+        plus 'extractor' ('trafilatura' or 'fallback') when content was found
+    """
+    result = {
+        "content": None,
+        "image_url": None,
+        "favicon_url": None,
+        "og_title": None,
+        "og_description": None
+    }
+
+    tree = parse_html(content)
+    if tree is None:
+        return result
+
+    # 1-4. Metadata (read-only pass over the tree)
+    result.update(_extract_metadata(tree, url))
+
+    # Try trafilatura first for high-quality extraction (it works on a copy of the tree)
+    try:
+        import trafilatura
+        try:
+            trafilatura_content = trafilatura.extract(
+                tree,
+                include_comments=False,
+                config=_get_trafilatura_config(scrape_settings or {})
+            )
+            if trafilatura_content:
+                if len(trafilatura_content) > max_length:
+                    trafilatura_content = trafilatura_content[:max_length] + "..."
+                result["content"] = trafilatura_content
+                result["extractor"] = "trafilatura"
+        except Exception as e:
+            print(f"Trafilatura extraction failed: {e}")
+    except ImportError:
+        pass
+
+    # 5. Clean and extract content (only if trafilatura didn't work)
+    if not result["content"]:
+        _remove_unwanted_elements(tree)
+        main_content = _find_main_content(tree)
+        text = _extract_text(main_content)
+
+        if len(text) > max_length:
+            text = text[:max_length] + "..."
+
+        result["content"] = text.strip() if text.strip() else None
+        if result["content"]:
+            result["extractor"] = "fallback"
+
+    return result
+
+
+def extract_pdf(content: bytes, url: str, max_length: int, max_pages: int) -> dict:
+    """
+    Extract the text of the first max_pages pages of a PDF search result.
+    Stops as soon as max_length characters are collected.
+    """
+    import io
+    from pypdf import PdfReader
+
+    result = {
+        "content": None,
+        "image_url": None,
+        "favicon_url": None,
+        "og_title": None,
+        "og_description": None
+    }
+
+    reader = PdfReader(io.BytesIO(content))
+    try:
+        title = reader.metadata.title if reader.metadata else None
+        if title:
+            result["og_title"] = str(title)
+    except Exception:
+        pass
+
+    text = ""
+    for page in reader.pages[:max_pages]:
+        page_text = page.extract_text() or ""
+        if page_text.strip():
+            text += page_text.strip() + "\n\n"
+        if len(text) > max_length:
+            break
+
+    text = text.strip()
+    if len(text) > max_length:
+        text = text[:max_length] + "..."
+    result["content"] = text or None
+    if result["content"]:
+        result["extractor"] = "pdf"
+    return result
+
+
+def _extract_metadata(tree, url: str) -> dict:
+    """OpenGraph title/description/image and the favicon URL."""
+    xpaths = _xpaths()
+    by_property, by_name, by_itemprop = {}, {}, {}
+    for meta in xpaths["meta"](tree):
+        content = meta.get("content")
+        if content is None:
+            continue
+        for attr, index in (("property", by_property), ("name", by_name), ("itemprop", by_itemprop)):
+            key = meta.get(attr)
+            if key:
+                index.setdefault(key, content)
+
+    metadata = {}
+
+    # 1. OpenGraph Title, falling back to the standard title
+    metadata["og_title"] = by_property.get("og:title") or by_name.get("og:title")
+    if not metadata["og_title"]:
+        titles = xpaths["title"](tree)
+        if titles and titles[0].text:
+            metadata["og_title"] = titles[0].text
+
+    # 2. OpenGraph Description
+    metadata["og_description"] = (by_property.get("og:description") or by_name.get("description") or
+                                  by_name.get("og:description"))
+
+    # 3. OpenGraph or Featured Image
+    metadata["image_url"] = (by_property.get("og:image") or by_name.get("og:image") or
+                             by_itemprop.get("image"))
+
+    # 4. Favicon (try multiple common patterns)
+    links = [
+        (" ".join(link.get("rel", "").lower().split()), (link.get("type") or "").lower(), link.get("href"))
+        for link in xpaths["link"](tree)
+    ]
+    metadata["favicon_url"] = None
+    for rel, icon_type in ICON_PATTERNS:
+        icon_url = next(
+            (href for link_rel, link_type, href in links
+             if _rel_matches(link_rel, rel) and (icon_type is None or link_type == icon_type)),
+            None
+        )
+        if icon_url:
+            if not icon_url.startswith('http'):
+                icon_url = urljoin(url, icon_url)
+            metadata["favicon_url"] = icon_url
+            break
+
+    # Plain str values: lxml "smart strings" drag their whole tree along when pickled
+    return {key: str(value) if value is not None else None for key, value in metadata.items()}
+
+
+def _rel_matches(link_rel: str, rel: str) -> bool:
+    """rel="shortcut icon" matches "icon" as well as the full value."""
+    return link_rel == rel or (" " not in rel and rel in link_rel.split())
+
+
+def _remove_unwanted_elements(tree) -> None:
+    """Remove unwanted tags and elements from the tree (keeping the text that follows them)."""
+    for element in _xpaths()["remove"](tree):
+        if element.getparent() is not None:
+            element.drop_tree()
+
+
+def _find_main_content(tree):
+    """Find the main content area of the page."""
+    for xpath in _xpaths()["main"]:
+        found = xpath(tree)
+        if found:
+            return found[0]
+
+    # Fallback to body
+    body = tree.find("body")
+    return body if body is not None else tree
+
+
+def _element_text(element, separator: str) -> str:
+    return separator.join(part.strip() for part in element.itertext() if part.strip())
+
+
+def _extract_text(element) -> str:
+    """Extract clean text from an lxml element."""
+    if element is None:
+        return ""
+
+    # Collect text from meaningful elements
+    paragraphs = []
+
+    for tag in element.iter(*TEXT_TAGS):
+        text = _element_text(tag, " ")
+        # Filter short fragments (likely navigation/buttons)
+        if text and len(text) > 30:
+            paragraphs.append(text)
+
+    if paragraphs:
+        # Remove duplicates while preserving order
+        seen = set()
+        unique = []
+        for p in paragraphs:
+            if p not in seen:
+                seen.add(p)
+                unique.append(p)
+        return "\n\n".join(unique)
+
+    # Fallback: get all text
+    text = _element_text(element, "\n")
+    lines = [line.strip() for line in text.split("\n") if line.strip() and len(line.strip()) > 30]
+
+    # Remove duplicates
+    seen = set()
+    unique = []
+    for line in lines:
+        if line not in seen:
+            seen.add(line)
+            unique.append(line)
+
+    return "\n\n".join(unique)
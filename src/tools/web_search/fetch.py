@@ -0,0 +1,194 @@
+"""
+Bounded streaming fetch for the scraper.
+
+Search results often point at large PDFs, videos or huge HTML pages. The
+body is streamed instead of downloaded in one go:
+
+- the Content-Type header and the first bytes decide what the page is;
+  images, audio, video and archives are dropped before their body is read,
+- reading stops at a byte cap (the HTML read so far is still parsed; a PDF
+  over its cap is skipped, since a cut PDF cannot be read),
+- the charset comes from the header, a BOM or an early <meta> tag and the
+  body is decoded incrementally while it arrives. Without any of these the
+  raw bytes are passed on and the extractor detects the encoding.
+
+Config keys:
+    scrape_max_bytes      cap for HTML and text pages
+    scrape_max_pdf_bytes  cap for PDF documents
+"""
+
+import codecs
+import re
+
+from src.core.config import ConfigManager
+from src.core.network.http_client import get_session
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+DEFAULT_MAX_PDF_BYTES = 10 * 1024 * 1024
+CHUNK_SIZE = 16 * 1024
+PRESCAN_BYTES = 4096  # Where a <meta charset> is looked for
+
+KIND_HTML = "html"
+KIND_TEXT = "text"
+KIND_PDF = "pdf"
+
+HTML_TYPES = ("text/html", "application/xhtml+xml")
+TEXT_TYPES = ("text/plain",)
+PDF_TYPES = ("application/pdf", "application/x-pdf")
+# Types that can hide a PDF or an HTML page: decided by the first bytes
+SNIFF_TYPES = ("", "application/octet-stream", "binary/octet-stream", "application/download")
+
+# Signatures of binary formats that are never worth downloading
+BINARY_SIGNATURES = (
+    b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"PK\x03\x04", b"\x1f\x8b", b"ID3", b"OggS",
+    b"RIFF", b"fLaC", b"\x1a\x45\xdf\xa3", b"Rar!", b"7z\xbc\xaf", b"\x00\x00\x01\xba",
+)
+
+BOMS = (
+    (codecs.BOM_UTF8, "utf-8"),
+    (codecs.BOM_UTF16_LE, "utf-16-le"),
+    (codecs.BOM_UTF16_BE, "utf-16-be"),
+)
+
+_HEADER_CHARSET = re.compile(r"charset\s*=\s*[\"']?([\w.:-]+)", re.IGNORECASE)
+_META_CHARSET = re.compile(rb"<meta[^>]+charset\s*=\s*[\"']?\s*([\w.:-]+)", re.IGNORECASE)
+
+
+class Page:
+    """A fetched response. `content` is str when the charset was known, else bytes."""
+
+    def __init__(self, status_code, headers, kind=None, content=None, truncated=False):
+        self.status_code = status_code
+        self.headers = headers
+        self.kind = kind
+        self.content = content
+        self.truncated = truncated
+
+    @property
+    def size(self) -> int:
+        return len(self.content) if self.content is not None else 0
+
+
+def _media_type(content_type: str) -> str:
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+def _lookup_codec(name):
+    try:
+        return codecs.lookup(name.decode("ascii") if isinstance(name, bytes) else name).name
+    except (LookupError, UnicodeDecodeError):
+        return None
+
+
+def classify(content_type: str, head: bytes = b""):
+    """
+    KIND_HTML, KIND_TEXT, KIND_PDF or None (not worth reading) from the
+    Content-Type and, when that is vague, the first bytes of the body.
+    """
+    media_type = _media_type(content_type)
+    sniffed = head.lstrip()[:512].lower()
+
+    if head.startswith(b"%PDF-") or media_type in PDF_TYPES:
+        return KIND_PDF if head.startswith(b"%PDF-") or not head else None
+    if head.startswith(BINARY_SIGNATURES) or b"\x00" in head[:512]:
+        return None
+    if media_type in HTML_TYPES:
+        return KIND_HTML
+    if media_type in TEXT_TYPES:
+        return KIND_HTML if sniffed.startswith((b"<!doctype html", b"<html")) else KIND_TEXT
+    if media_type in SNIFF_TYPES or media_type.endswith("+xml") or media_type in ("text/xml", "application/xml"):
+        if sniffed.startswith((b"<!doctype", b"<html", b"<?xml", b"<head", b"<body", b"<!--")):
+            return KIND_HTML
+        return KIND_TEXT if media_type == "" and head else None
+    return None
+
+
+def detect_charset(content_type: str, head: bytes):
+    """Charset from the Content-Type header, a BOM or a <meta> in the first bytes (None if unknown)."""
+    match = _HEADER_CHARSET.search(content_type or "")
+    if match:
+        codec = _lookup_codec(match.group(1))
+        if codec:
+            return codec
+    for bom, codec in BOMS:
+        if head.startswith(bom):
+            return codec
+    match = _META_CHARSET.search(head[:PRESCAN_BYTES])
+    if match:
+        return _lookup_codec(match.group(1))
+    return None
+
+
+def fetch_page(url: str, headers: dict = None, timeout: int = 10) -> Page:
+    """
+    Stream a page within the configured limits. Raises for network and HTTP
+    errors (status >= 400) like requests does; a Page with kind None means
+    the response was not worth reading.
+    """
+    config = ConfigManager()
+    max_bytes = int(config.get("scrape_max_bytes", DEFAULT_MAX_BYTES))
+    max_pdf_bytes = int(config.get("scrape_max_pdf_bytes", DEFAULT_MAX_PDF_BYTES))
+
+    with get_session().get(url, headers=headers or {}, timeout=timeout, stream=True) as response:
+        page = Page(response.status_code, response.headers)
+        if response.status_code == 304:
+            return page
+        response.raise_for_status()
+
+        content_type = response.headers.get("Content-Type", "")
+        declared = response.headers.get("Content-Length")
+        declared = int(declared) if declared and declared.isdigit() else None
+
+        chunks = response.iter_content(chunk_size=CHUNK_SIZE)
+        head = b""
+        # Read at least enough for the sniffing and the <meta charset> prescan
+        for chunk in chunks:
+            head += chunk
+            if len(head) >= PRESCAN_BYTES:
+                break
+
+        page.kind = classify(content_type, head)
+        if page.kind is None:
+            print(f"[Scraper] Skipping {url}: unsupported content ({_media_type(content_type) or 'unknown type'})")
+            return page
+
+        limit = max_pdf_bytes if page.kind == KIND_PDF else max_bytes
+        if page.kind == KIND_PDF and declared and declared > limit:
+            print(f"[Scraper] Skipping {url}: PDF of {declared // 1024} KiB is over the limit")
+            page.kind = None
+            return page
+
+        charset = None if page.kind == KIND_PDF else detect_charset(content_type, head)
+        decoder = codecs.getincrementaldecoder(charset)(errors="replace") if charset else None
+        parts = []
+        size = 0
+
+        def add(data):
+            nonlocal size
+            size += len(data)
+            parts.append(decoder.decode(data) if decoder else data)
+
+        add(head[:limit])
+        if len(head) > limit:
+            page.truncated = True
+        else:
+            for chunk in chunks:
+                if size + len(chunk) > limit:
+                    add(chunk[:limit - size])
+                    page.truncated = True
+                    break
+                add(chunk)
+
+        if page.truncated and page.kind == KIND_PDF:
+            print(f"[Scraper] Skipping {url}: PDF is over the {limit // 1024} KiB limit")
+            page.kind = None
+            return page
+
+        if decoder:
+            parts.append(decoder.decode(b"", final=True))
+            page.content = "".join(parts)
+        else:
+            page.content = b"".join(parts)
+        if page.truncated:
+            print(f"[Scraper] Stopped reading {url} after {limit // 1024} KiB")
+        return page
@@ -3,44 +3,53 @@ Web content scraper module.
 Extracts clean, readable content from web pages.
 """
 
-import requests
-from bs4 import BeautifulSoup
+import concurrent.futures
+import threading
 from typing import Optional
+import requests
+from src.core.config import ConfigManager
+from src.core.tracing import Tracer, bind_context
+from src.core.workers import WorkerPool
+from src.tools.web_search.extract import extract_html, extract_pdf
+from src.tools.web_search.fetch import fetch_page, KIND_PDF, KIND_TEXT
+from src.tools.web_search.cache import ScrapeCache
+
+# Upper bound for one page's extraction in a worker process (seconds)
+EXTRACTION_TIMEOUT = 30
+
+# Pages of a PDF result that are read (config: scrape_pdf_max_pages)
+DEFAULT_PDF_MAX_PAGES = 10
+
+# Concurrent page fetches for scrape_urls (config: scrape_workers)
+DEFAULT_SCRAPE_WORKERS = 4
+
+_scrape_pool = None
+_scrape_pool_lock = threading.Lock()
+
+
+def _empty_result() -> dict:
+    return {
+        "content": None, 
+        "image_url": None, 
+        "favicon_url": None,
+        "og_title": None,
+        "og_description": None
+    }
+
 
-# Common user agent for requests
-USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-
-# Elements to remove from pages
-REMOVE_TAGS = [
-    "script", "style", "nav", "header", "footer",
-    "aside", "form", "iframe", "noscript", "meta",
-    "link", "button", "input", "select", "textarea",
-    "svg", "canvas", "video", "audio"
-]
-
-# CSS selectors for elements to remove (ads, navigation, etc.)
-REMOVE_SELECTORS = [
-    "[class*='nav']", "[class*='menu']", "[class*='sidebar']",
-    "[class*='footer']", "[class*='header']", "[class*='ad-']",
-    "[class*='advertisement']", "[class*='cookie']", "[class*='popup']",
-    "[class*='modal']", "[class*='banner']", "[class*='social']",
-    "[class*='share']", "[class*='comment']", "[class*='related']",
-    "[id*='nav']", "[id*='menu']", "[id*='sidebar']",
-    "[id*='footer']", "[id*='header']", "[id*='ad']",
-    "[id*='cookie']", "[id*='popup']", "[id*='modal']"
-]
-
-
-# Selectors to try for finding main content
-MAIN_CONTENT_SELECTORS = [
-    "article", "main", "[role='main']", 
-    ".article-body", ".article-content", ".post-content",
-    ".entry-content", ".content", "#content", 
-    ".post", ".article", ".story"
-]
-
-
-def scrape_url(url: str, max_length: int = 3000, timeout: int = 10) -> dict:
+def _get_scrape_pool() -> concurrent.futures.ThreadPoolExecutor:
+    global _scrape_pool
+    with _scrape_pool_lock:
+        if _scrape_pool is None:
+            workers = int(ConfigManager().get("scrape_workers", DEFAULT_SCRAPE_WORKERS))
+            _scrape_pool = concurrent.futures.ThreadPoolExecutor(
+                max_workers=max(1, workers),
+                thread_name_prefix="gaia-scrape"
+            )
+        return _scrape_pool
+
+
+def scrape_url(url: str, max_length: int = 3000, timeout: int = 10, use_cache: bool = True) -> dict:
     """
     Scrape and extract clean text content and metadata from a URL.
     
@@ -48,186 +57,122 @@ def scrape_url(url: str, max_length: int = 3000, timeout: int = 10) -> dict:
         url: URL to scrape
         max_length: Maximum content length to return
         timeout: Request timeout in seconds
+        use_cache: Set to False to bypass the scrape cache (always fetch and extract)
     
     Returns:
-        Dict with 'content', 'image_url', 'favicon_url', 'og_title', and 'og_description'
+        Dict with 'content', 'image_url', 'favicon_url', 'og_title', and 'og_description'.
+        When the page could not be fetched it also has 'error' ('timeout',
+        'http_<status>' or 'error') and 'retry_after' (the Retry-After header, if any).
     """
-    result = {
-        "content": None, 
-        "image_url": None, 
-        "favicon_url": None,
-        "og_title": None,
-        "og_description": None
-    }
-    try:
-        response = requests.get(
-            url,
-            headers={"User-Agent": USER_AGENT},
-            timeout=timeout
-        )
-        response.raise_for_status()
-        
-        # Try trafilatura first for high-quality extraction
-        try:
-            try:
-                import trafilatura
-                from trafilatura.settings import use_config
-                from src.core.config import ConfigManager
-                
-                # Load settings from app config (JSON-based)
-                app_config = ConfigManager()
-                scrape_settings = app_config.get("scrape_settings", {})
-                
-                # Use default Trafilatura config as base to ensure all required keys exist
-                traf_config = use_config()
-                
-                # Set defaults or user-provided values
-                # Note: ConfigParser keys are case-insensitive
-                traf_config.set("DEFAULT", "min_extracted_size", str(scrape_settings.get("min_extracted_size", 250)))
-                traf_config.set("DEFAULT", "min_output_size", str(scrape_settings.get("min_output_size", 1)))
-                traf_config.set("DEFAULT", "min_extracted_comm_size", str(scrape_settings.get("min_extracted_comm_size", 1)))
-                traf_config.set("DEFAULT", "min_output_comm_size", str(scrape_settings.get("min_output_comm_size", 1)))
-                traf_config.set("DEFAULT", "extraction_timeout", str(scrape_settings.get("extraction_timeout", 0)))
-
-                # valid_result=True ensures we don't get empty strings if uncertain
-                trafilatura_content = trafilatura.extract(
-                    response.content, 
-                    include_comments=False,
-                    config=traf_config
-                )
-                if trafilatura_content:
-                    if len(trafilatura_content) > max_length:
-                        trafilatura_content = trafilatura_content[:max_length] + "..."
-                    result["content"] = trafilatura_content
-            except Exception as e:
-                print(f"Trafilatura extraction failed: {e}")
-        except ImportError:
-            pass
-
-        soup = BeautifulSoup(response.content, "lxml")
-        
-        # 1. Extract OpenGraph Title
-        og_title = (soup.find("meta", property="og:title") or 
-                   soup.find("meta", attrs={"name": "og:title"}))
-        if og_title:
-            result["og_title"] = og_title.get("content")
-        
-        # Fallback to standard title
-        if not result["og_title"] and soup.title:
-            result["og_title"] = soup.title.string
-
-        # 2. Extract OpenGraph Description
-        og_desc = (soup.find("meta", property="og:description") or 
-                  soup.find("meta", attrs={"name": "description"}) or
-                  soup.find("meta", attrs={"name": "og:description"}))
-        if og_desc:
-            result["og_description"] = og_desc.get("content")
-        
-        # 3. Extract OpenGraph or Featured Image
-        og_image = (soup.find("meta", property="og:image") or 
-                   soup.find("meta", attrs={"name": "og:image"}) or
-                   soup.find("meta", itemprop="image"))
-        if og_image:
-            result["image_url"] = og_image.get("content")
-        
-        # 4. Extract Favicon (try multiple common patterns)
-        icon_patterns = [
-            {"rel": "apple-touch-icon"},
-            {"rel": "apple-touch-icon-precomposed"},
-            {"rel": "icon", "type": "image/png"},
-            {"rel": "shortcut icon"},
-            {"rel": "icon"}
-        ]
-        
-        for pattern in icon_patterns:
-            icon_link = soup.find("link", attrs=pattern)
-            if icon_link:
-                icon_url = icon_link.get("href")
-                if icon_url:
-                    if not icon_url.startswith('http'):
-                        from urllib.parse import urljoin
-                        icon_url = urljoin(url, icon_url)
-                    result["favicon_url"] = icon_url
-                    break
-
-        # 5. Clean and extract content (only if trafilatura didn't work)
-        if not result["content"]:
-            _remove_unwanted_elements(soup)
-            main_content = _find_main_content(soup)
-            text = _extract_text(main_content)
-            
-            if len(text) > max_length:
-                text = text[:max_length] + "..."
-            
-            result["content"] = text.strip() if text.strip() else None
-            
+    with Tracer().span("scrape_url", "scrape", url=url) as span:
+        result = _scrape_url(url, max_length, timeout, use_cache, span)
+        span.set(chars=len(result.get("content") or ""))
         return result
-        
+
+
+def scrape_urls(urls: list, deadline: float, max_length: int = 3000, timeout: int = 10, use_cache: bool = True) -> list:
+    """
+    Scrape several URLs concurrently on a bounded pool.
+
+    Args:
+        urls: URLs to scrape
+        deadline: Overall time budget in seconds for all of them
+        max_length: Maximum content length per page
+        timeout: Request timeout per page in seconds
+        use_cache: Set to False to bypass the scrape cache
+
+    Returns:
+        One result dict per URL, in the same order. Pages that did not finish
+        before the deadline get an empty result (the caller falls back to the snippet).
+    """
+    pool = _get_scrape_pool()
+    futures = [pool.submit(bind_context(scrape_url, url, max_length, timeout, use_cache)) for url in urls]
+    done, pending = concurrent.futures.wait(futures, timeout=deadline)
+
+    for future in pending:
+        future.cancel()  # Not started yet: free the slot. Running ones finish in the background
+    if pending:
+        print(f"[Scraper] {len(pending)} of {len(urls)} pages missed the {deadline}s deadline")
+
+    results = []
+    for future in futures:
+        if future in done and future.exception() is None:
+            results.append(future.result())
+        else:
+            results.append(_empty_result())
+    return results
+
+
+def _scrape_url(url: str, max_length: int, timeout: int, use_cache: bool, span) -> dict:
+    result = _empty_result()
+    scrape_settings = ConfigManager().get("scrape_settings", {})
+
+    cache = ScrapeCache()
+    use_cache = use_cache and cache.enabled
+    entry = cache.get(url, max_length, scrape_settings) if use_cache else None
+    if entry and cache.is_fresh(entry):
+        span.set(cache="hit")
+        return cache.to_result(entry, max_length, "hits")
+
+    try:
+        page = fetch_page(url, headers=cache.conditional_headers(entry), timeout=timeout)
+        if page.status_code == 304 and entry:
+            cache.refresh(entry, page.headers)
+            span.set(cache="revalidated")
+            return cache.to_result(entry, max_length, "revalidated")
     except Exception as e:
+        if entry:
+            # Offline or flaky: a stale copy is better than nothing
+            span.set(cache="stale")
+            return cache.to_result(entry, max_length, "stale_served")
+        result["error"], result["retry_after"] = _describe_error(e)
+        span.set(error=result["error"])
         return result
 
+    span.set(kind=page.kind, bytes=page.size, truncated=page.truncated)
+    if page.kind is None or not page.content:
+        return result
 
-def _remove_unwanted_elements(soup: BeautifulSoup) -> None:
-    """Remove unwanted tags and elements from the soup."""
-    # Remove by tag name
-    for tag in REMOVE_TAGS:
-        for element in soup.find_all(tag):
-            element.decompose()
-    
-    # Remove by CSS selector
-    for selector in REMOVE_SELECTORS:
+    if page.kind == KIND_TEXT:
+        text = page.content if isinstance(page.content, str) else page.content.decode("utf-8", errors="replace")
+        text = text.strip()
+        result["content"] = (text[:max_length] + "..." if len(text) > max_length else text) or None
+        result["extractor"] = "text"
+    else:
+        # Parsing is CPU-bound: run it in a worker process, off the UI's GIL
+        if page.kind == KIND_PDF:
+            job = (extract_pdf, page.content, url, max_length,
+                   int(ConfigManager().get("scrape_pdf_max_pages", DEFAULT_PDF_MAX_PAGES)))
+        else:
+            job = (extract_html, page.content, url, max_length, scrape_settings)
         try:
-            for element in soup.select(selector):
-                element.decompose()
-        except Exception:
-            pass  # Some selectors may fail, that's ok
-
-
-def _find_main_content(soup: BeautifulSoup):
-    """Find the main content area of the page."""
-    for selector in MAIN_CONTENT_SELECTORS:
-        content = soup.select_one(selector)
-        if content:
-            return content
-    
-    # Fallback to body
-    return soup.body if soup.body else soup
-
-
-def _extract_text(element) -> str:
-    """Extract clean text from a BeautifulSoup element."""
-    if not element:
-        return ""
-    
-    # Collect text from meaningful elements
-    paragraphs = []
-    
-    for tag in element.find_all(["p", "h1", "h2", "h3", "h4", "h5", "h6", "li"]):
-        text = tag.get_text(separator=" ", strip=True)
-        # Filter short fragments (likely navigation/buttons)
-        if text and len(text) > 30:
-            paragraphs.append(text)
-    
-    if paragraphs:
-        # Remove duplicates while preserving order
-        seen = set()
-        unique = []
-        for p in paragraphs:
-            if p not in seen:
-                seen.add(p)
-                unique.append(p)
-        return "\n\n".join(unique)
-    
-    # Fallback: get all text
-    text = element.get_text(separator="\n", strip=True)
-    lines = [line.strip() for line in text.split("\n") if line.strip() and len(line.strip()) > 30]
-    
-    # Remove duplicates
-    seen = set()
-    unique = []
-    for line in lines:
-        if line not in seen:
-            seen.add(line)
-            unique.append(line)
-    
-    return "\n\n".join(unique)
+            with Tracer().span("scrape.extract", "cpu", kind=page.kind, bytes=page.size):
+                result = WorkerPool().run(*job, timeout=EXTRACTION_TIMEOUT)
+        except Exception as e:
+            print(f"Extraction failed for {url}: {e}")
+            return result
+
+    span.set(extractor=result.get("extractor"))
+    if use_cache:
+        span.set(cache="miss")
+        cache.put(url, result, page.headers, max_length, scrape_settings)
+
+    if result["favicon_url"]:
+        # Warm the per-domain favicon cache so source cards render offline
+        try:
+            from src.core.favicons import FaviconStore
+            FaviconStore().remember(url, result["favicon_url"])
+        except Exception as e:
+            print(f"Favicon cache update failed: {e}")
+
+    return result
+
+
+def _describe_error(error: Exception):
+    """(kind, Retry-After header) of a failed fetch, for callers that pace their requests."""
+    if isinstance(error, (requests.exceptions.Timeout, TimeoutError)):
+        return "timeout", None
+    response = getattr(error, "response", None)
+    if isinstance(error, requests.exceptions.HTTPError) and response is not None:
+        return f"http_{response.status_code}", response.headers.get("Retry-After")
+    return "error", None
@@ -1,16 +1,17 @@
 """
-DuckDuckGo search module.
+Web search module (Brave Search and DuckDuckGo).
 Handles web search queries and returns structured results.
 """
 
 import os
 import sys
 import certifi
-from ddgs import DDGS
 from typing import List, Dict, Optional
 import traceback
-import requests
-from src.core.config import ConfigManager
+from src.core.network.http_client import get_session
+from src.core.tracing import Tracer
+from src.tools.web_search.backends import SearchRouter
+from src.tools.web_search.search_cache import SearchCache
 
 # Force SSL cert file for frozen apps (curl_cffi/requests needs this)
 os.environ["SSL_CERT_FILE"] = certifi.where()
@@ -32,7 +33,7 @@ def search_brave(query: str, api_key: str, max_results: int = 3) -> List[Dict[st
     }
     
     try:
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = get_session().get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
         data = response.json()
         
@@ -52,24 +53,32 @@ def search_brave(query: str, api_key: str, max_results: int = 3) -> List[Dict[st
         raise e  # Re-raise to trigger fallback
 
 
+def ddg_text(query: str, max_results: int = 3) -> List[Dict[str, str]]:
+    """
+    Search DuckDuckGo. Raises on failure (used by the search router).
+    """
+    max_results = max(1, min(max_results, 10))
+    from ddgs import DDGS
+    with DDGS() as ddgs:
+        raw_results = list(ddgs.text(query, max_results=max_results))
+
+    results = []
+    for r in raw_results:
+        results.append({
+            "title": r.get("title", ""),
+            "url": r.get("href", ""),
+            "snippet": r.get("body", "")
+        })
+
+    return results
+
+
 def search_ddg(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     """
     Search DuckDuckGo (fallback).
     """
-    max_results = max(1, min(max_results, 10))
     try:
-        with DDGS() as ddgs:
-            raw_results = list(ddgs.text(query, max_results=max_results))
-        
-        results = []
-        for r in raw_results:
-            results.append({
-                "title": r.get("title", ""),
-                "url": r.get("href", ""),
-                "snippet": r.get("body", "")
-            })
-        
-        return results
+        return ddg_text(query, max_results)
     except Exception as e:
          # Capture full traceback for debugging frozen app
         tb = traceback.format_exc()
@@ -78,7 +87,9 @@ def search_ddg(query: str, max_results: int = 3) -> List[Dict[str, str]]:
 
 def search(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     """
-    Search for a query, prioritizing Brave Search if configured, else DuckDuckGo.
+    Search for a query across the configured backends (Brave if it has an API
+    key, DuckDuckGo), raced or merged according to the 'search_mode' setting.
+    Results are cached for a few minutes and identical concurrent searches share one request.
     
     Args:
         query: Search query string
@@ -87,20 +98,33 @@ def search(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     Returns:
         List of results with 'title', 'url', and 'snippet' keys
     """
-    config = ConfigManager()
-    brave_key = config.get("brave_search_api_key")
+    router = SearchRouter()
+    backend = router.label()
+    cache = SearchCache()
     
-    if brave_key:
-        try:
-            print(f"[DEBUG] Attempting Brave Search for: {query}")
-            return search_brave(query, brave_key, max_results)
-        except Exception as e:
-            print(f"[DEBUG] Brave Search failed: {e}")
-            # Fallback to DDG
-            pass
-            
-    print(f"[DEBUG] Falling back to DuckDuckGo for: {query}")
-    return search_ddg(query, max_results)
+    with Tracer().span("search", "search", query=query, backend=backend, mode=router.mode) as span:
+        results, outcome = cache.get_or_search(
+            query, backend, max_results,
+            lambda: _search_backends(query, max_results, span)
+        )
+        hit_rate = cache.hit_rate(backend)
+        span.set(cache=outcome, results=len(results), cache_hit_rate=round(hit_rate, 3))
+        if outcome != "miss":
+            print(f"[SearchCache] {outcome} for '{query}' ({backend}, hit rate {hit_rate:.0%})")
+        return results
+
+
+def _search_backends(query: str, max_results: int, span):
+    """Run the search uncached. Returns (results, cacheable)."""
+    try:
+        results, served_by = SearchRouter().search(query, max_results)
+    except Exception as e:
+        # Errors come back as a single "Error" result and must not be cached
+        tb = traceback.format_exc()
+        span.set(served_by="none")
+        return [{"title": "Error", "url": "", "snippet": f"Search failed: {str(e)} | Type: {type(e).__name__} | Traceback: {tb}"}], False
+    span.set(served_by=served_by)
+    return results, bool(results)
 
 
 def search_news(query: str, max_results: int = 3) -> List[Dict[str, str]]:
@@ -117,6 +141,7 @@ def search_news(query: str, max_results: int = 3) -> List[Dict[str, str]]:
     max_results = max(1, min(max_results, 10))
     
     try:
+        from ddgs import DDGS
         with DDGS() as ddgs:
             raw_results = list(ddgs.news(query, max_results=max_results))
         
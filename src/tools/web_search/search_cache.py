@@ -0,0 +1,152 @@
+"""
+Short-lived cache of search results.
+
+Deep research sections issue overlapping sub-queries ("X history",
+"history of X") and chats repeat searches. Results are kept in memory for
+a few minutes, keyed by the normalised query, the backend and the result
+count, and identical searches running at the same time share one request.
+
+Config keys:
+    search_cache_enabled  turn the cache off
+    search_cache_ttl      seconds a result list stays valid
+"""
+
+import concurrent.futures
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+from src.core.config import ConfigManager
+
+DEFAULT_TTL = 900
+MAX_ENTRIES = 500
+
+# Words that do not change what a search engine returns (en, it, de, fr, es)
+STOPWORDS = {
+    "a", "an", "the", "of", "in", "on", "for", "to", "and", "or", "about", "what", "is", "are", "how",
+    "il", "lo", "la", "i", "gli", "le", "di", "del", "della", "dei", "delle", "e", "che", "un", "una", "per",
+    "der", "die", "das", "des", "dem", "den", "und", "von", "zu", "im", "ein", "eine",
+    "les", "de", "du", "et", "au", "aux", "une", "sur",
+    "el", "los", "las", "y", "en", "una", "por", "para",
+}
+
+# Queries using search syntax are only lowercased: word order and stopwords matter there
+_OPERATORS = re.compile(r"[\"+]|(^|\s)-\w|\b(site|filetype|intitle|inurl):", re.IGNORECASE)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Canonical form of a query: lowercase, accents kept, punctuation and
+    stopwords dropped, words sorted, so "history of X" equals "X history".
+    """
+    text = unicodedata.normalize("NFKC", query or "").lower().strip()
+    if _OPERATORS.search(text):
+        return " ".join(text.split())
+    words = re.findall(r"\w+", text)
+    meaningful = [word for word in words if word not in STOPWORDS] or words
+    return " ".join(sorted(set(meaningful)))
+
+
+class SearchCache:
+    """Singleton in-memory search result cache with in-flight request coalescing."""
+    _instance = None
+    _lock = threading.Lock()
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(SearchCache, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.config = ConfigManager()
+        self._entries = OrderedDict()  # key -> (expires_at, results)
+        self._in_flight = {}           # key -> Future
+        self._state_lock = threading.Lock()
+        self._stats = {}               # backend -> counters
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.config.get("search_cache_enabled", True))
+
+    @property
+    def ttl(self) -> float:
+        return float(self.config.get("search_cache_ttl", DEFAULT_TTL))
+
+    def get_or_search(self, query: str, backend: str, max_results: int, search_fn):
+        """
+        Return (results, outcome) for the query. outcome is 'hit', 'coalesced'
+        (waited for an identical running search) or 'miss' (search_fn ran).
+        search_fn() returns (results, cacheable).
+        """
+        if not self.enabled:
+            return search_fn()[0], "miss"
+
+        key = (normalize_query(query), backend, max_results)
+        with self._state_lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self._record(backend, "hits")
+                return list(entry[1]), "hit"
+
+            future = self._in_flight.get(key)
+            owner = future is None
+            if owner:
+                future = self._in_flight[key] = concurrent.futures.Future()
+            self._record(backend, "misses" if owner else "coalesced")
+
+        if not owner:
+            return list(future.result()), "coalesced"
+
+        try:
+            results, cacheable = search_fn()
+        except BaseException as e:
+            with self._state_lock:
+                self._in_flight.pop(key, None)
+            future.set_exception(e)
+            raise
+
+        with self._state_lock:
+            self._in_flight.pop(key, None)
+            if cacheable:
+                self._entries[key] = (time.monotonic() + self.ttl, list(results))
+                self._entries.move_to_end(key)
+                while len(self._entries) > MAX_ENTRIES:
+                    self._entries.popitem(last=False)
+        future.set_result(results)
+        return results, "miss"
+
+    def clear(self):
+        with self._state_lock:
+            self._entries.clear()
+
+    # --- Statistics ---
+
+    def _record(self, backend: str, outcome: str):
+        """Caller holds the state lock."""
+        stats = self._stats.setdefault(backend, {"hits": 0, "coalesced": 0, "misses": 0})
+        stats[outcome] += 1
+
+    def hit_rate(self, backend: str) -> float:
+        """Share of searches answered without a request of their own (hits and coalesced)."""
+        with self._state_lock:
+            stats = self._stats.get(backend)
+            if not stats:
+                return 0.0
+            total = stats["hits"] + stats["coalesced"] + stats["misses"]
+            return (stats["hits"] + stats["coalesced"]) / total if total else 0.0
+
+    def get_stats(self) -> dict:
+        """backend -> hits, coalesced, misses and hit_rate."""
+        with self._state_lock:
+            report = {}
+            for backend, stats in self._stats.items():
+                entry = dict(stats)
+                total = stats["hits"] + stats["coalesced"] + stats["misses"]
+                entry["hit_rate"] = (stats["hits"] + stats["coalesced"]) / total if total else 0.0
+                report[backend] = entry
+            return report
@@ -1,11 +1,17 @@
 import json
 from src.tools.base import BaseTool
 from src.tools.web_search.search import search
-from src.tools.web_search.scraper import scrape_url
+from src.tools.web_search.scraper import scrape_urls
+from src.core.config import ConfigManager
 from src.core.prompt_manager import PromptManager
 
+# Time budget for scraping all results; late pages fall back to their snippet
+DEFAULT_SCRAPE_DEADLINE = 15
+
 
 class WebSearchTool(BaseTool):
+    timeout = 180  # Search plus scraping of every result
+
     @property
     def name(self) -> str:
         return "web_search"
@@ -50,16 +56,16 @@ class WebSearchTool(BaseTool):
             if results[0].get("title") == "Error":
                 return prompt_manager.get("web_search.error_search", error=results[0].get('snippet'))
 
-            # 2. Scrape & Build context
+            # 2. Scrape all pages concurrently, then build the context in result order
+            results = [res for res in results if res.get("url")]
+            deadline = float(ConfigManager().get("web_search_scrape_deadline", DEFAULT_SCRAPE_DEADLINE))
+            scraped = scrape_urls([res["url"] for res in results], deadline=deadline)
+
             sources = []
             ai_context = prompt_manager.get("web_search.context_header", query=query)
             
-            for res in results:
-                url = res.get("url")
-                if not url:
-                    continue
-                
-                scrape_res = scrape_url(url)
+            for res, scrape_res in zip(results, scraped):
+                url = res["url"]
                 content = scrape_res.get("content")
                 
                 # Add to sources for UI (prefer OpenGraph data when available)
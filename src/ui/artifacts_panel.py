@@ -1,5 +1,6 @@
 import gi
 import os
+import json
 import shutil
 import zipfile
 import random
@@ -194,7 +195,7 @@ class ArtifactsPanel(Gtk.Box):
                     if entry.is_file():
                         f = entry.name
                         # Filter out internal files
-                        if f == "console.json":
+                        if f in ("console.json", "checkpoint.json"):
                             continue
                         # Filter useful files
                         if f.endswith(('.html', '.css', '.js', '.py', '.md', '.json', '.txt')):
@@ -437,6 +438,37 @@ class ArtifactsPanel(Gtk.Box):
                     self.web_view.load_uri(f"file://{full_path}")
                     self._last_load_time = time.time()
 
+    def _is_showing(self, path):
+        return WebKit and hasattr(self, 'web_view') and self.web_view.get_uri() == f"file://{path}"
+
+    def update_section(self, path, element_id, html):
+        """Replace one element of a live report in place, without reloading the page."""
+        if not self._is_showing(path):
+            return  # The file on disk is up to date for the next load
+
+        script = (
+            f"(function() {{ var el = document.getElementById({json.dumps(element_id)});"
+            f" if (!el) return false; el.outerHTML = {json.dumps(html)}; return true; }})()"
+        )
+
+        def on_done(web_view, result):
+            try:
+                replaced = web_view.evaluate_javascript_finish(result).to_boolean()
+            except GLib.Error as e:
+                print(f"[ArtifactsPanel] Live update failed: {e}")
+                replaced = False
+            if not replaced:
+                # Page still loading or older than the section: the file has it
+                web_view.reload_bypass_cache()
+
+        self.web_view.evaluate_javascript(script, -1, None, None, None, on_done)
+
+    def reload_if_showing(self, path):
+        """Reload the page if it is the one on screen (e.g. a live report's final render)."""
+        if self._is_showing(path):
+            self.web_view.reload_bypass_cache()
+            self._last_load_time = time.time()
+
     def load_artifact(self, path, language="text"):
         """Legacy compatibility or single file loading."""
         # For now, if we get a single file, treat parent as project?
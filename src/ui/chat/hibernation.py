@@ -0,0 +1,95 @@
+import gc
+import os
+import resource
+
+from gi.repository import GLib
+
+from src.core.config import ConfigManager
+
+DEFAULT_BUDGET_MB = 768
+CHECK_INTERVAL_SECONDS = 30
+
+
+def get_process_rss() -> int:
+    """Resident set size of this process in bytes (Linux /proc, falls back to peak RSS)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        # ru_maxrss is in KiB on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class MemoryBudgetManager:
+    """
+    Keeps the window under a resident memory budget by hibernating the
+    least-recently-viewed ChatPages. A hibernated page keeps only its chat
+    id and scroll position and is rebuilt from ChatStorage when selected.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.config = ConfigManager()
+        GLib.timeout_add_seconds(CHECK_INTERVAL_SECONDS, self._on_timer)
+
+    @property
+    def budget_bytes(self) -> int:
+        return int(self.config.get("memory_budget_mb", DEFAULT_BUDGET_MB)) * 1024 * 1024
+
+    def _on_timer(self):
+        self.enforce()
+        return True
+
+    def enforce(self):
+        """Hibernate pages, oldest view first, until the estimated RSS fits the budget."""
+        budget = self.budget_bytes
+        if budget <= 0:
+            return 0
+
+        rss = get_process_rss()
+        if rss <= budget:
+            return 0
+
+        selected = self.window.get_active_chat_page()
+        candidates = [
+            page for page in self.window.chat_pages.values()
+            if page is not selected and page.can_hibernate()
+        ]
+        candidates.sort(key=lambda page: getattr(page, "last_viewed", 0))
+
+        # RSS rarely shrinks right after freeing (allocator arenas), so we
+        # subtract each page's measured footprint instead of re-sampling.
+        estimated = rss
+        hibernated = 0
+        for page in candidates:
+            if estimated <= budget:
+                break
+            footprint = page.memory_estimate()
+            if page.hibernate():
+                estimated -= footprint
+                hibernated += 1
+
+        if hibernated:
+            gc.collect()
+            print(f"[MemoryBudget] RSS {rss // (1024 * 1024)} MB over budget "
+                  f"{budget // (1024 * 1024)} MB, hibernated {hibernated} chat page(s)")
+        return hibernated
+
+    def page_report(self) -> list:
+        """Per-page memory figures for the debug view."""
+        selected = self.window.get_active_chat_page()
+        now = GLib.get_monotonic_time()
+        report = []
+        for chat_id, page in self.window.chat_pages.items():
+            report.append({
+                "chat_id": chat_id,
+                "title": page.chat_data.get("title") or chat_id,
+                "hibernated": page.hibernated,
+                "selected": page is selected,
+                "rss_bytes": page.memory_estimate(),
+                "messages": len(page.history),
+                "idle_seconds": max(0, (now - getattr(page, "last_viewed", now)) // 1_000_000),
+            })
+        report.sort(key=lambda r: r["rss_bytes"], reverse=True)
+        return report
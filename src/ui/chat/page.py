@@ -16,8 +16,11 @@ from src.ui.components import SourceCard, ArtifactCard, ResearchCard, PlanConfir
 from src.ui.components.code_block import CodeBlock
 from src.ui.components.table_block import TableBlock
 from src.ui.components.wallpaper_grid import WallpaperGrid
+from src.ui.images import ImageLoader
 from src.core.ai_client import AIClient
+from src.core.tracing import Tracer
 from src.tools.manager import ToolManager
+from src.tools.selection import ToolSelector, REQUEST_TOOLS_NAME
 from src.core.tool_call_parser import ToolCallParser
 from src.core.tool_call_parser import ToolCallParser
 from src.core.prompt_manager import PromptManager
@@ -57,6 +60,14 @@ class ChatPage(Gtk.Box):
         # Generation State
         self._is_generating = False
         self._cancel_event = threading.Event()
+        self._closed = False
+        self._recent_tools = []  # Tools called recently, kept in the per-turn tool subset
+        
+        # Hibernation State (see MemoryBudgetManager)
+        self.hibernated = False
+        self._saved_scroll = None
+        self._rss_before_load = None
+        self._rss_footprint = 0
         
         # Chat Area
         # Chat Area
@@ -117,6 +128,8 @@ class ChatPage(Gtk.Box):
     def _load_history_batch(self):
         """Load existing messages from history in batches using threading."""
         if not hasattr(self, '_loading_thread') or not self._loading_thread.is_alive():
+            from src.ui.chat.hibernation import get_process_rss
+            self._rss_before_load = get_process_rss()
             self._loading_thread = threading.Thread(target=self._load_messages_in_thread, daemon=True)
             self._loading_thread.start()
     
@@ -166,7 +179,28 @@ class ChatPage(Gtk.Box):
             GLib.idle_add(self._add_batch_to_ui, batch_messages)
             time.sleep(0.003)
         
-        GLib.idle_add(self._scroll_to_bottom)
+        GLib.idle_add(self._on_history_loaded)
+    
+    def _on_history_loaded(self):
+        """All history batches are in the UI: measure the footprint and restore the scroll position."""
+        if self._rss_before_load is not None:
+            from src.ui.chat.hibernation import get_process_rss
+            self._rss_footprint = max(0, get_process_rss() - self._rss_before_load)
+            self._rss_before_load = None
+        
+        if self._saved_scroll is not None:
+            target = self._saved_scroll
+            self._saved_scroll = None
+            
+            def restore_scroll():
+                adj = self.scrolled.get_vadjustment()
+                if adj:
+                    adj.set_value(min(target, adj.get_upper() - adj.get_page_size()))
+                return False
+            GLib.idle_add(restore_scroll)
+        else:
+            self._scroll_to_bottom()
+        return False
     
     def _add_batch_to_ui(self, batch_messages):
         if not hasattr(self, 'chat_box') or not self.chat_box:
@@ -198,7 +232,97 @@ class ChatPage(Gtk.Box):
         if project_id == self.chat_data.get("id"):
             GLib.idle_add(self.show_spinner, message)
 
+    def teardown(self, save: bool = True):
+        """Release the page's state before its tab is closed. The chat itself stays on disk."""
+        if self._closed:
+            return
+        
+        # Stop any running generation, its results have nowhere to go
+        self._cancel_event.set()
+        
+        if save and not (self.lazy_loading or self.hibernated) and self.chat_data.get('_is_persisted', True):
+            try:
+                self.chat_data['history'] = self.history
+                self.storage.save_chat(self.chat_data)
+            except Exception as e:
+                print(f"[DEBUG] Error saving on teardown: {e}")
+        
+        self._closed = True
+        if self.status_handler_id:
+            self.status_manager.disconnect(self.status_handler_id)
+            self.status_handler_id = None
+        self._markdown_cache.clear()
+        self._markdown_cache_order.clear()
+        self._deferred_sources_artifacts.clear()
+        self.history = []
+        self.chat_data = {'id': self.chat_data['id'], 'title': self.chat_data.get('title')}
+
+    def memory_estimate(self) -> int:
+        """Approximate bytes held by this page (RSS growth measured while rendering its history)."""
+        if self.hibernated or self._closed:
+            return 0
+        # Fallback for pages whose history has not finished loading
+        text_bytes = sum(len(m.get('content') or '') for m in self.history)
+        return max(self._rss_footprint, text_bytes * 16)
+
+    def can_hibernate(self) -> bool:
+        loading = hasattr(self, '_loading_thread') and self._loading_thread.is_alive()
+        return not (self.hibernated or self._closed or self._is_generating or self.lazy_loading or loading)
+
+    def hibernate(self) -> bool:
+        """Free widgets, history and caches; keep only the chat id and scroll position."""
+        if not self.can_hibernate():
+            return False
+        
+        if self.chat_data.get('_is_persisted', True):
+            try:
+                self.chat_data['history'] = self.history
+                self.storage.save_chat(self.chat_data)
+            except Exception as e:
+                print(f"[DEBUG] Error saving before hibernation: {e}")
+                return False
+        
+        adj = self.scrolled.get_vadjustment()
+        self._saved_scroll = adj.get_value() if adj else None
+        
+        child = self.chat_box.get_first_child()
+        while child:
+            next_child = child.get_next_sibling()
+            self.chat_box.remove(child)
+            child = next_child
+        
+        self._markdown_cache.clear()
+        self._markdown_cache_order.clear()
+        self._deferred_sources_artifacts.clear()
+        self.history = []
+        self.chat_data = {
+            'id': self.chat_data['id'],
+            'title': self.chat_data.get('title'),
+            '_is_persisted': self.chat_data.get('_is_persisted', True)
+        }
+        self.loaded_messages = 0
+        self._rss_footprint = 0
+        self.hibernated = True
+        print(f"[ChatPage] Hibernated chat {self.chat_data['id']}")
+        return True
+
+    def rehydrate(self):
+        """Rebuild a hibernated page from ChatStorage."""
+        if not self.hibernated:
+            return
+        self.hibernated = False
+        
+        if self.chat_data.get('_is_persisted', True):
+            full_chat = self.storage.load_chat(self.chat_data['id'])
+            if full_chat:
+                self.chat_data = full_chat
+                self.history = full_chat.get('history', [])
+        GLib.idle_add(self._load_history_batch)
+
     def _on_unmap(self, widget):
+        if self._closed:
+            return False
+
         if self.status_handler_id:
             self.status_manager.disconnect(self.status_handler_id)
             self.status_handler_id = None
@@ -210,7 +334,11 @@ class ChatPage(Gtk.Box):
         # Ensure we save any pending changes when the page is unmapped (tab switch/close)
         # CRITICAL: Do NOT save if lazy loading is still active, as self.history will be empty/partial
         # and we would overwrite the actual file on disk with empty data.
-        if self.lazy_loading:
+        if self.lazy_loading or self.hibernated:
+            return
+
+        # Chats are only written once they have a first message
+        if not self.chat_data.get('_is_persisted', True):
             return
 
         if hasattr(self, 'history') and hasattr(self, 'storage'):
@@ -311,6 +439,12 @@ class ChatPage(Gtk.Box):
             self.storage.save_chat(self.chat_data)
         except Exception as e:
             print(f"[DEBUG] Error saving chat: {e}")
+        
+        # Keep the window's chat list in sync (title, ordering). add_message also runs
+        # in the voice worker thread: the sidebar's list store is only touched on the main loop
+        root = self.get_native()
+        if hasattr(root, 'on_chat_metadata_changed'):
+            GLib.idle_add(root.on_chat_metadata_changed, dict(self.chat_data))
             
         self._add_message_ui(role, text, metadata=metadata, save=False, parsed_text=parsed_text)
     
@@ -444,42 +578,8 @@ class ChatPage(Gtk.Box):
                 picture.set_content_fit(Gtk.ContentFit.COVER)
                 picture.set_can_shrink(True)
                 
-                # Check for cached file if it's a local path or we downloaded it
-                url = seg['url']
-                
-                # Helper to load image
-                def load_image(url, pic):
-                    try:
-                        import requests
-                        from gi.repository import GdkPixbuf, Gio
-                        
-                        # Handle local file:// URI
-                        if url.startswith("file://"):
-                            path = url.replace("file://", "")
-                            f = Gio.File.new_for_path(path)
-                            pic.set_file(f)
-                            return
-
-                        # Download with session to handle blocks
-                        session = requests.Session()
-                        session.headers.update({'User-Agent': 'Mozilla/5.0 GaiaBot/1.0'})
-                        resp = session.get(url, timeout=10, stream=True)
-                        
-                        if resp.status_code == 200:
-                            # Load data into Pixbuf? 
-                            # Or save to tmp? Saving to tmp is safer for Gtk.Picture
-                            import tempfile
-                            fd, path = tempfile.mkstemp(suffix=".jpg")
-                            with os.fdopen(fd, 'wb') as tmp:
-                                for chunk in resp.iter_content(chunk_size=1024):
-                                    tmp.write(chunk)
-                                    
-                            f = Gio.File.new_for_path(path)
-                            GLib.idle_add(pic.set_file, f)
-                    except Exception as e:
-                        print(f"Failed to load image {url}: {e}")
-
-                threading.Thread(target=load_image, args=(url, picture), daemon=True).start()
+                # Decoded at display width by the shared loader (cached on disk)
+                ImageLoader().load_into(picture, seg['url'], width=300)
                 
                 img_box.append(picture)
                 
@@ -602,6 +702,11 @@ class ChatPage(Gtk.Box):
         self._scroll_to_bottom()
 
     def update_last_message_metadata(self, metadata: dict):
+        if self.hibernated:
+            # No history in memory: patch the stored chat, the UI picks it up on rehydration
+            self.storage.update_last_message_metadata(self.chat_data['id'], metadata)
+            return
+
         if self.history and self.history[-1]['role'] == 'assistant':
             if 'metadata' not in self.history[-1]:
                 self.history[-1]['metadata'] = {}
@@ -709,6 +814,9 @@ class ChatPage(Gtk.Box):
         self._scroll_to_bottom()
 
     def add_artifacts_to_ui(self, artifacts: list):
+        if self.hibernated:
+            return
+
         # Handle Plan Artifacts
         plan_artifact = next((a for a in artifacts if a.get('type') == 'implementation_plan'), None)
         
@@ -782,6 +890,33 @@ class ChatPage(Gtk.Box):
             self.chat_box.append(msg_row)
             self._scroll_to_bottom()
 
+    def _select_tools(self, tm, user_text: str, enabled_map: dict, pinned=()):
+        """
+        Pick the tool subset for this request and build the matching system prompt.
+        Returns (ToolSelection, system_prompt).
+        """
+        all_tools = tm.get_ollama_tools_definitions()
+        recent_user = [
+            msg.get('content') or "" for msg in self.history[-6:]
+            if msg.get('role') == 'user'
+        ]
+        selection = ToolSelector().select(
+            all_tools,
+            user_text,
+            context="\n".join(recent_user[-3:]),
+            pinned=list(pinned) + self._recent_tools
+        )
+        system_prompt = self.prompt_manager.get_system_prompt(enabled_map, selected_tools=selection.guideline_tools)
+        if selection.active:
+            selection.report(self.prompt_manager.get_system_prompt(enabled_map), system_prompt)
+        return selection, system_prompt
+
+    def _remember_tool(self, name: str):
+        if name in self._recent_tools:
+            self._recent_tools.remove(name)
+        self._recent_tools.append(name)
+        del self._recent_tools[:-3]
+
     def run_ai_voice(self, user_text: str, callback):
         """
         Run AI for voice mode with tool support.
@@ -793,16 +928,20 @@ class ChatPage(Gtk.Box):
         
         # Run in thread
         def run():
+            with Tracer().run("voice_turn", chat_id=self.chat_data['id']):
+                run_turn()
+
+        def run_turn():
             client = AIClient()
             tm = ToolManager()
             tm.load_tools()
-            tools_def = tm.get_ollama_tools_definitions()
             
             # Inject voice_mode flag
             enabled_map = tm.config.get("enabled_tools", {}).copy()
             enabled_map["voice_mode"] = True
             
-            system_prompt = self.prompt_manager.get_system_prompt(enabled_map)
+            selection, system_prompt = self._select_tools(tm, user_text, enabled_map)
+            tools_def = selection.tools
             
             messages = [{'role': 'system', 'content': system_prompt}]
             messages.extend(self.history)
@@ -863,7 +1002,11 @@ class ChatPage(Gtk.Box):
                             if "project_id" in args: del args["project_id"]
                             
                             print(f"[Voice] Calling tool: {fname}")
-                            result = tm.execute_tool(fname, project_id=self.chat_data["id"], **args)
+                            if fname == REQUEST_TOOLS_NAME:
+                                result = selection.expand(args.get("need", ""))
+                            else:
+                                result = tm.execute_tool(fname, project_id=self.chat_data["id"], cancel_event=self._cancel_event, **args)
+                                self._remember_tool(fname)
                             
                             # Clean result (remove large base64 or internal tags if needed)
                             # For voice, we assume the AI handles the text result
@@ -916,15 +1059,26 @@ class ChatPage(Gtk.Box):
         return False
 
     def run_ai(self, user_text: str, is_hidden: bool = False):
+        """Run one agent turn (LLM calls and tools), traced as a single run."""
+        with Tracer().run("agent_turn", chat_id=self.chat_data['id'], hidden=is_hidden):
+            self._run_ai_turn(user_text, is_hidden)
+
+    def _run_ai_turn(self, user_text: str, is_hidden: bool):
         client = AIClient()
         tm = ToolManager()
         tm.load_tools()
-        tools_def = tm.get_ollama_tools_definitions()
         
-        # Dynamically build system prompt based on enabled tools
-        enabled_map = tm.config.get("enabled_tools", {})
+        # Updated check to match the new prompt string
+        is_plan_approval = "Plan approved" in user_text
         
-        system_prompt = self.prompt_manager.get_system_prompt(enabled_map)
+        # Dynamically build system prompt based on enabled tools,
+        # sending only the ones relevant to this request
+        enabled_map = tm.config.get("enabled_tools", {})
+        selection, system_prompt = self._select_tools(
+            tm, user_text, enabled_map,
+            pinned=["web_builder"] if is_plan_approval else ()
+        )
+        tools_def = selection.tools
 
         messages = [{
             'role': 'system', 
@@ -932,9 +1086,6 @@ class ChatPage(Gtk.Box):
         }]
         messages.extend(self.history)
         
-        # Updated check to match the new prompt string
-        is_plan_approval = "Plan approved" in user_text
-        
         if not is_hidden:
             messages.append({'role': 'user', 'content': user_text})
 
@@ -1029,6 +1180,8 @@ class ChatPage(Gtk.Box):
                 all_sources, all_artifacts = [], []
                 
                 for tool_call in pending_tool_calls:
+                    if self._cancel_event.is_set():
+                        break
                     try:
                         fname = tool_call['function']['name']
                         args = tool_call['function']['arguments']
@@ -1049,7 +1202,11 @@ class ChatPage(Gtk.Box):
                         if "project_id" in args:
                             del args["project_id"]
                         
-                        result = tm.execute_tool(fname, project_id=project_id, **args)
+                        if fname == REQUEST_TOOLS_NAME:
+                            result = selection.expand(args.get("need", ""))
+                        else:
+                            result = tm.execute_tool(fname, project_id=project_id, cancel_event=self._cancel_event, **args)
+                            self._remember_tool(fname)
                         
                         # Immediate UI Rendering for Wallpaper Grid
                         # This bypasses the AI summary latency
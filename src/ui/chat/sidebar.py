@@ -0,0 +1,125 @@
+import gi
+gi.require_version('Gtk', '4.0')
+from gi.repository import Gtk, Gio, GObject, Pango
+
+from src.core.language_manager import LanguageManager
+
+
+class ChatListItem(GObject.Object):
+    """Metadata-only model item for one saved chat."""
+    __gtype_name__ = "GaiaChatListItem"
+
+    chat_id = GObject.Property(type=str, default="")
+    title = GObject.Property(type=str, default="")
+    updated_at = GObject.Property(type=str, default="")
+
+    def __init__(self, chat: dict):
+        super().__init__()
+        self.chat_id = chat['id']
+        self.title = chat.get('title') or ""
+        self.updated_at = chat.get('updated_at', "")
+
+
+class ChatSidebar(Gtk.Box):
+    """
+    Virtualized list of all saved chats.
+    Only metadata is held here; rows are recycled by Gtk.ListView, so the
+    cost of the sidebar does not grow with the size of the archive.
+    """
+    __gsignals__ = {
+        "chat-activated": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+        "chat-delete-requested": (GObject.SignalFlags.RUN_FIRST, None, (str,)),
+    }
+
+    def __init__(self):
+        super().__init__(orientation=Gtk.Orientation.VERTICAL)
+        self.add_css_class("chat-sidebar")
+        self.lang_manager = LanguageManager()
+
+        header = Gtk.Label(label=self.lang_manager.get("window.chats"))
+        header.add_css_class("heading")
+        header.set_halign(Gtk.Align.START)
+        header.set_margin_top(12)
+        header.set_margin_bottom(6)
+        header.set_margin_start(12)
+        self.append(header)
+
+        self.model = Gio.ListStore(item_type=ChatListItem)
+        self.selection = Gtk.NoSelection(model=self.model)
+
+        factory = Gtk.SignalListItemFactory()
+        factory.connect("setup", self._on_setup_row)
+        factory.connect("bind", self._on_bind_row)
+
+        self.list_view = Gtk.ListView(model=self.selection, factory=factory)
+        self.list_view.set_single_click_activate(True)
+        self.list_view.add_css_class("navigation-sidebar")
+        self.list_view.connect("activate", self._on_activate)
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_vexpand(True)
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.set_child(self.list_view)
+        self.append(scrolled)
+
+    # --- Model ---
+
+    def set_chats(self, chats: list):
+        """Replace the whole list in one splice (chats are metadata dicts, newest first)."""
+        items = [ChatListItem(chat) for chat in chats]
+        self.model.splice(0, self.model.get_n_items(), items)
+
+    def upsert_chat(self, chat: dict):
+        """Insert or update a chat and move it to the top (most recently updated)."""
+        position = self._find(chat['id'])
+        if position is not None:
+            self.model.remove(position)
+        self.model.insert(0, ChatListItem(chat))
+
+    def remove_chat(self, chat_id: str):
+        position = self._find(chat_id)
+        if position is not None:
+            self.model.remove(position)
+
+    def _find(self, chat_id):
+        for i in range(self.model.get_n_items()):
+            if self.model.get_item(i).chat_id == chat_id:
+                return i
+        return None
+
+    # --- Rows ---
+
+    def _on_setup_row(self, factory, list_item):
+        row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL)
+        row.set_spacing(6)
+
+        label = Gtk.Label()
+        label.set_hexpand(True)
+        label.set_xalign(0)
+        label.set_ellipsize(Pango.EllipsizeMode.END)
+        row.append(label)
+
+        delete_btn = Gtk.Button()
+        delete_btn.set_icon_name("user-trash-symbolic")
+        delete_btn.set_tooltip_text(self.lang_manager.get("window.delete_chat"))
+        delete_btn.add_css_class("flat")
+        delete_btn.connect("clicked", self._on_delete_clicked, list_item)
+        row.append(delete_btn)
+
+        list_item.set_child(row)
+
+    def _on_bind_row(self, factory, list_item):
+        item = list_item.get_item()
+        label = list_item.get_child().get_first_child()
+        label.set_label(item.title or self.lang_manager.get("window.new_chat"))
+        label.set_tooltip_text(item.title)
+
+    def _on_activate(self, list_view, position):
+        item = self.model.get_item(position)
+        if item:
+            self.emit("chat-activated", item.chat_id)
+
+    def _on_delete_clicked(self, button, list_item):
+        item = list_item.get_item()
+        if item:
+            self.emit("chat-delete-requested", item.chat_id)
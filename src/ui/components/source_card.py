@@ -1,9 +1,8 @@
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, Gdk, GLib
-import threading
-import requests
 from urllib.parse import urlparse
+from src.ui.images import ImageLoader, FaviconCache
 
 class SourceCard(Gtk.Box):
     """A compact, native GTK4 list row to display a web source link."""
@@ -73,48 +72,13 @@ class SourceCard(Gtk.Box):
         self._load_images(domain, favicon_url, image_url)
 
     def _load_images(self, domain, favicon_url, image_url):
-        def fetch():
-            # 1. Favicon
-            try:
-                f_url = favicon_url or f"https://www.google.com/s2/favicons?sz=64&domain={domain}"
-                response = requests.get(f_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=5)
-                if response.status_code == 200:
-                    GLib.idle_add(self._set_image, self.favicon_image, response.content, False)
-            except Exception as e:
-                print(f"Error fetching favicon for {domain}: {e}")
-            
-            # 2. Thumbnail Image
-            if image_url:
-                try:
-                    response = requests.get(image_url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=5)
-                    if response.status_code == 200:
-                        GLib.idle_add(self._set_image, self.thumbnail, response.content, True)
-                except Exception as e:
-                    print(f"Error fetching thumbnail for {domain}: {e}")
-
-        thread = threading.Thread(target=fetch)
-        thread.daemon = True
-        thread.start()
+        # 1. Favicon (per-domain cache, usually painted synchronously)
+        FaviconCache().load_into(self.favicon_image, domain, favicon_url)
 
-    def _set_image(self, image_widget, data, is_picture=False):
-        try:
-            from gi.repository import GdkPixbuf
-            loader = GdkPixbuf.PixbufLoader()
-            loader.write(data)
-            loader.close()
-            pixbuf = loader.get_pixbuf()
-            if pixbuf:
-                texture = Gdk.Texture.new_for_pixbuf(pixbuf)
-                if isinstance(image_widget, Gtk.Picture):
-                    image_widget.set_paintable(texture)
-                else:
-                    image_widget.set_from_paintable(texture)
-                
-                if is_picture:
-                    image_widget.set_visible(True)
-        except Exception as e:
-            print(f"Error setting image: {e}")
-        return False
+        # 2. Thumbnail Image
+        if image_url:
+            ImageLoader().load_into(self.thumbnail, image_url, width=64, height=64, fit="cover",
+                                    on_loaded=lambda texture: self.thumbnail.set_visible(True))
 
     def on_clicked(self, gesture, n_press, x, y):
         Gtk.show_uri(None, self.url, Gdk.CURRENT_TIME)
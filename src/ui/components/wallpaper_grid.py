@@ -1,9 +1,7 @@
 import gi
 gi.require_version('Gtk', '4.0')
 from gi.repository import Gtk, Gdk, GLib, Gio
-import threading
-import requests
-import os
+from src.ui.images import ImageLoader
 
 class WallpaperGrid(Gtk.Box):
     def __init__(self, images, on_click_callback=None):
@@ -100,20 +98,4 @@ class WallpaperGrid(Gtk.Box):
             self.on_click_callback(index)
 
     def _load_image_async(self, url, picture):
-        def load():
-            try:
-                session = requests.Session()
-                session.headers.update({'User-Agent': 'Mozilla/5.0 GaiaBot/1.0'})
-                resp = session.get(url, timeout=10, stream=True)
-                if resp.status_code == 200:
-                    import tempfile
-                    fd, path = tempfile.mkstemp(suffix=".jpg")
-                    with os.fdopen(fd, 'wb') as tmp:
-                        for chunk in resp.iter_content(chunk_size=1024):
-                            tmp.write(chunk)
-                    f = Gio.File.new_for_path(path)
-                    GLib.idle_add(picture.set_file, f)
-            except Exception as e:
-                print(f"Error loading grid image: {e}")
-        
-        threading.Thread(target=load, daemon=True).start()
+        ImageLoader().load_into(picture, url, width=160, height=140, fit="cover")
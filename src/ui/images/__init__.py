@@ -0,0 +1,2 @@
+from .loader import ImageLoader, decode_texture
+from .favicons import FaviconCache
@@ -0,0 +1,97 @@
+import gi
+import threading
+from collections import OrderedDict
+
+gi.require_version('Gtk', '4.0')
+from gi.repository import GLib
+
+from src.core.favicons import FaviconStore, normalize_domain
+from src.ui.images.loader import decode_texture
+
+
+class FaviconCache:
+    """
+    Singleton in-memory layer over FaviconStore.
+    Keeps decoded favicon textures per domain so every SourceCard for a
+    known domain is painted synchronously, without a thread or request.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    ICON_SIZE = 64  # Decoded once at this size, scaled down by Gtk.Image
+    MAX_TEXTURES = 256
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(FaviconCache, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.store = FaviconStore()
+        self._textures = OrderedDict()  # domain -> Gdk.Texture
+        self._waiting = {}  # domain -> [Gtk.Image]
+
+    def load_into(self, image_widget, url_or_domain: str, favicon_url: str = None):
+        """
+        Paint the favicon for a domain into a Gtk.Image. Must be called from the main loop.
+        Leaves the widget untouched if the domain has no icon.
+        """
+        domain = normalize_domain(url_or_domain)
+        if not domain:
+            return
+
+        if favicon_url:
+            self.store.remember(domain, favicon_url, prefetch=False)
+
+        # 1. Decoded texture in memory
+        texture = self._textures.get(domain)
+        if texture is not None:
+            self._textures.move_to_end(domain)
+            image_widget.set_from_paintable(texture)
+            return
+
+        # 2. Icon file on disk, decode now (icons are tiny)
+        path = self.store.get_path(domain)
+        if path:
+            texture = self._decode(domain, path)
+            if texture is not None:
+                image_widget.set_from_paintable(texture)
+            return
+
+        # 3. Known to have no icon
+        if self.store.is_missing(domain):
+            return
+
+        # 4. Fetch once, paint every widget that asked in the meantime
+        waiting = self._waiting.get(domain)
+        if waiting is not None:
+            waiting.append(image_widget)
+            return
+        self._waiting[domain] = [image_widget]
+        self.store.fetch_async(domain, lambda path: GLib.idle_add(self._on_fetched, domain, path))
+
+    def _on_fetched(self, domain, path):
+        widgets = self._waiting.pop(domain, [])
+        texture = self._decode(domain, path) if path else None
+        if texture is not None:
+            for widget in widgets:
+                widget.set_from_paintable(texture)
+        return False
+
+    def _decode(self, domain, path):
+        try:
+            texture = decode_texture(path, self.ICON_SIZE, self.ICON_SIZE)
+        except Exception as e:
+            print(f"[FaviconCache] Could not decode icon for {domain}: {e}")
+            texture = None
+
+        if texture is None:
+            self.store.mark_missing(domain)
+            return None
+
+        self._textures[domain] = texture
+        while len(self._textures) > self.MAX_TEXTURES:
+            self._textures.popitem(last=False)
+        return texture
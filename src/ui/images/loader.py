@@ -0,0 +1,359 @@
+import gi
+import os
+import json
+import time
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+gi.require_version('Gtk', '4.0')
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import Gtk, Gdk, GdkPixbuf, GLib
+
+USER_AGENT = "Mozilla/5.0 GaiaBot/1.0"
+
+
+def get_image_cache_dir():
+    """Get the on-disk image cache directory in ~/.cache/gaia/images."""
+    cache_dir = os.path.expanduser("~/.cache/gaia/images")
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def decode_texture(path, width=-1, height=-1, fit="contain"):
+    """Decode an image file directly at the requested size (never upscaling)."""
+    loader = GdkPixbuf.PixbufLoader()
+
+    def on_size_prepared(pixbuf_loader, src_w, src_h):
+        if src_w <= 0 or src_h <= 0:
+            return
+        scales = []
+        if width > 0:
+            scales.append(width / src_w)
+        if height > 0:
+            scales.append(height / src_h)
+        if not scales:
+            return
+        scale = max(scales) if fit == "cover" else min(scales)
+        if scale < 1.0:
+            pixbuf_loader.set_size(max(1, int(src_w * scale)), max(1, int(src_h * scale)))
+
+    loader.connect("size-prepared", on_size_prepared)
+    try:
+        with open(path, "rb") as f:
+            while True:
+                chunk = f.read(64 * 1024)
+                if not chunk:
+                    break
+                loader.write(chunk)
+    finally:
+        loader.close()
+
+    pixbuf = loader.get_pixbuf()
+    if pixbuf is None:
+        return None
+    return Gdk.Texture.new_for_pixbuf(pixbuf)
+
+
+class ImageLoader:
+    """
+    Singleton image service shared by every widget that shows remote images.
+
+    - A bounded worker pool does all downloading and decoding.
+    - Concurrent requests for the same image are coalesced into one job.
+    - Decoded textures are kept in an in-memory LRU (bounded by bytes).
+    - Raw downloads are kept on disk in ~/.cache/gaia/images, revalidated
+      with ETag/Last-Modified once stale and evicted oldest-first by size.
+    - Images are decoded directly at the displayed size.
+    """
+    _instance = None
+    _lock = threading.Lock()
+
+    MAX_WORKERS = 4
+    MEMORY_CACHE_BYTES = 64 * 1024 * 1024
+    DISK_CACHE_BYTES = 200 * 1024 * 1024
+    DEFAULT_MAX_AGE = 24 * 3600
+    REQUEST_TIMEOUT = 10
+
+    def __new__(cls):
+        with cls._lock:
+            if cls._instance is None:
+                cls._instance = super(ImageLoader, cls).__new__(cls)
+                cls._instance._initialize()
+        return cls._instance
+
+    def _initialize(self):
+        self.cache_dir = get_image_cache_dir()
+        self._executor = ThreadPoolExecutor(max_workers=self.MAX_WORKERS, thread_name_prefix="gaia-image")
+        self._state_lock = threading.Lock()
+
+        # (url, width, height, fit) -> Gdk.Texture
+        self._textures = OrderedDict()
+        self._texture_bytes = 0
+
+        # (url, width, height, fit) -> [callbacks] for jobs in flight
+        self._pending = {}
+
+        # url -> Lock, so two sizes of the same URL only download once
+        self._url_locks = {}
+
+        self._disk_usage = None
+
+    # --- Public API ---
+
+    def load(self, url, width=-1, height=-1, callback=None, fit="contain"):
+        """
+        Load an image asynchronously and call callback(texture) on the main loop.
+
+        :param width: Target width in pixels, or -1 for unconstrained.
+        :param height: Target height in pixels, or -1 for unconstrained.
+        :param fit: "contain" scales to fit inside the box, "cover" scales to fill it.
+        The callback is only invoked when the image was loaded successfully.
+        """
+        if not url:
+            return
+
+        key = (url, width, height, fit)
+
+        with self._state_lock:
+            texture = self._textures.get(key)
+            if texture is not None:
+                self._textures.move_to_end(key)
+            elif key in self._pending:
+                # Already being loaded, just wait for the same result
+                if callback:
+                    self._pending[key].append(callback)
+                return
+            else:
+                self._pending[key] = [callback] if callback else []
+
+        if texture is not None:
+            if callback:
+                callback(texture)
+            return
+
+        self._executor.submit(self._run_job, key)
+
+    def load_into(self, widget, url, width=-1, height=-1, fit="contain", on_loaded=None):
+        """Load an image straight into a Gtk.Picture or Gtk.Image."""
+        # Decode for the real pixel density so HiDPI screens stay sharp
+        scale = max(widget.get_scale_factor(), 1)
+        if width > 0:
+            width *= scale
+        if height > 0:
+            height *= scale
+
+        def apply(texture):
+            if isinstance(widget, Gtk.Picture):
+                widget.set_paintable(texture)
+            else:
+                widget.set_from_paintable(texture)
+            if on_loaded:
+                on_loaded(texture)
+
+        self.load(url, width, height, apply, fit)
+
+    def clear_memory(self):
+        """Drop all decoded textures (the disk cache is kept)."""
+        with self._state_lock:
+            self._textures.clear()
+            self._texture_bytes = 0
+
+    # --- Worker side ---
+
+    def _run_job(self, key):
+        url, width, height, fit = key
+        texture = None
+        try:
+            if url.startswith("file://"):
+                path = GLib.filename_from_uri(url)[0]
+            elif url.startswith("/"):
+                path = url
+            else:
+                path = self._fetch_to_disk(url)
+
+            if path and os.path.exists(path):
+                texture = decode_texture(path, width, height, fit)
+        except Exception as e:
+            print(f"[ImageLoader] Failed to load {url}: {e}")
+
+        with self._state_lock:
+            callbacks = self._pending.pop(key, [])
+            if texture is not None:
+                self._remember_texture(key, texture)
+
+        if texture is not None and callbacks:
+            GLib.idle_add(self._deliver, texture, callbacks)
+
+    def _deliver(self, texture, callbacks):
+        for callback in callbacks:
+            try:
+                callback(texture)
+            except Exception as e:
+                print(f"[ImageLoader] Callback failed: {e}")
+        return False
+
+    def _remember_texture(self, key, texture):
+        """Insert into the LRU and evict until under the memory budget. Caller holds the lock."""
+        size = texture.get_width() * texture.get_height() * 4
+        self._textures[key] = texture
+        self._textures.move_to_end(key)
+        self._texture_bytes += size
+
+        while self._texture_bytes > self.MEMORY_CACHE_BYTES and len(self._textures) > 1:
+            _, old = self._textures.popitem(last=False)
+            self._texture_bytes -= old.get_width() * old.get_height() * 4
+
+    # --- Disk cache ---
+
+    def _get_session(self):
+        from src.core.network.http_client import get_session
+        return get_session()
+
+    def _paths_for(self, url):
+        digest = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, digest)
+        return base + ".img", base + ".json"
+
+    def _url_lock(self, url):
+        with self._state_lock:
+            lock = self._url_locks.get(url)
+            if lock is None:
+                lock = self._url_locks[url] = threading.Lock()
+            return lock
+
+    def _fetch_to_disk(self, url):
+        """Return a local path for url, downloading or revalidating as needed."""
+        data_path, meta_path = self._paths_for(url)
+
+        with self._url_lock(url):
+            meta = None
+            if os.path.exists(data_path) and os.path.exists(meta_path):
+                try:
+                    with open(meta_path, "r") as f:
+                        meta = json.load(f)
+                except Exception:
+                    meta = None
+
+            if meta is not None:
+                age = time.time() - meta.get("fetched_at", 0)
+                if age < meta.get("max_age", self.DEFAULT_MAX_AGE):
+                    self._touch(data_path)
+                    return data_path
+
+            headers = {'User-Agent': USER_AGENT}
+            if meta is not None:
+                if meta.get("etag"):
+                    headers["If-None-Match"] = meta["etag"]
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = meta["last_modified"]
+
+            try:
+                resp = self._get_session().get(url, headers=headers, timeout=self.REQUEST_TIMEOUT)
+            except Exception as e:
+                if meta is not None:
+                    # Offline or flaky: a stale copy is better than nothing
+                    print(f"[ImageLoader] Revalidation failed for {url}, using stale copy: {e}")
+                    return data_path
+                raise
+
+            if resp.status_code == 304 and meta is not None:
+                meta["fetched_at"] = time.time()
+                meta["max_age"] = self._parse_max_age(resp.headers, meta.get("max_age"))
+                self._write_meta(meta_path, meta)
+                self._touch(data_path)
+                return data_path
+
+            if resp.status_code != 200 or not resp.content:
+                print(f"[ImageLoader] HTTP {resp.status_code} for {url}")
+                return data_path if meta is not None else None
+
+            old_size = os.path.getsize(data_path) if os.path.exists(data_path) else 0
+            tmp_path = data_path + ".part"
+            with open(tmp_path, "wb") as f:
+                f.write(resp.content)
+            os.replace(tmp_path, data_path)
+
+            self._write_meta(meta_path, {
+                "url": url,
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+                "max_age": self._parse_max_age(resp.headers),
+            })
+
+        self._account_disk(len(resp.content) - old_size)
+        return data_path
+
+    def _parse_max_age(self, headers, fallback=None):
+        cache_control = headers.get("Cache-Control", "") or ""
+        for part in cache_control.split(","):
+            part = part.strip().lower()
+            if part.startswith("max-age="):
+                try:
+                    return max(int(part.split("=", 1)[1]), 0)
+                except ValueError:
+                    break
+        return fallback if fallback is not None else self.DEFAULT_MAX_AGE
+
+    def _write_meta(self, meta_path, meta):
+        try:
+            with open(meta_path, "w") as f:
+                json.dump(meta, f)
+        except Exception as e:
+            print(f"[ImageLoader] Failed to write cache metadata: {e}")
+
+    def _touch(self, path):
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+
+    def _account_disk(self, delta):
+        with self._state_lock:
+            if self._disk_usage is None:
+                self._disk_usage = self._scan_disk_usage()
+            else:
+                self._disk_usage += delta
+            over = self._disk_usage > self.DISK_CACHE_BYTES
+        if over:
+            self._evict_disk()
+
+    def _scan_disk_usage(self):
+        total = 0
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith(".img"):
+                    total += entry.stat().st_size
+        return total
+
+    def _evict_disk(self):
+        """Delete least recently used images until the cache is at 80% of its budget."""
+        entries = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith(".img"):
+                    st = entry.stat()
+                    entries.append((st.st_mtime, st.st_size, entry.path))
+        entries.sort()
+
+        total = sum(size for _, size, _ in entries)
+        target = int(self.DISK_CACHE_BYTES * 0.8)
+        removed = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                meta_path = path[:-len(".img")] + ".json"
+                if os.path.exists(meta_path):
+                    os.remove(meta_path)
+                total -= size
+                removed += 1
+            except OSError:
+                pass
+
+        with self._state_lock:
+            self._disk_usage = total
+        print(f"[ImageLoader] Evicted {removed} cached images ({total // 1024} KiB left)")
@@ -0,0 +1,101 @@
+import gi
+gi.require_version('Gtk', '4.0')
+gi.require_version('Adw', '1')
+from gi.repository import Gtk, Adw, GLib
+
+from src.core.language_manager import LanguageManager
+from src.ui.chat.hibernation import get_process_rss
+
+
+def _format_mb(num_bytes):
+    return f"{num_bytes / (1024 * 1024):.1f} MB"
+
+
+class MemoryDebugWindow(Adw.Window):
+    """Debug view listing the process RSS and the footprint of each open chat page."""
+
+    def __init__(self, parent):
+        super().__init__(transient_for=parent)
+        self.lang_manager = LanguageManager()
+        self.main_window = parent
+        self.set_title(self.lang_manager.get("window.memory.title"))
+        self.set_default_size(480, 520)
+
+        toolbar_view = Adw.ToolbarView()
+        header = Adw.HeaderBar()
+
+        refresh_btn = Gtk.Button()
+        refresh_btn.set_icon_name("view-refresh-symbolic")
+        refresh_btn.set_tooltip_text(self.lang_manager.get("window.memory.refresh"))
+        refresh_btn.connect("clicked", lambda b: self.refresh())
+        header.pack_start(refresh_btn)
+
+        hibernate_btn = Gtk.Button(label=self.lang_manager.get("window.memory.enforce"))
+        hibernate_btn.connect("clicked", self.on_enforce_clicked)
+        header.pack_end(hibernate_btn)
+
+        toolbar_view.add_top_bar(header)
+
+        self.page = Adw.PreferencesPage()
+        toolbar_view.set_content(self.page)
+        self.set_content(toolbar_view)
+
+        self._groups = []
+        self.refresh()
+        self._timer_id = GLib.timeout_add_seconds(2, self._on_timer)
+        self.connect("close-request", self._on_close_request)
+
+    def refresh(self):
+        for group in self._groups:
+            self.page.remove(group)
+        self._groups = []
+
+        manager = self.main_window.memory_manager
+
+        summary = Adw.PreferencesGroup()
+        summary.set_title(self.lang_manager.get("window.memory.process"))
+        rss_row = Adw.ActionRow(title=self.lang_manager.get("window.memory.rss"))
+        rss_row.add_suffix(Gtk.Label(label=_format_mb(get_process_rss())))
+        summary.add(rss_row)
+        budget_row = Adw.ActionRow(title=self.lang_manager.get("window.memory.budget"))
+        budget_row.add_suffix(Gtk.Label(label=_format_mb(manager.budget_bytes)))
+        summary.add(budget_row)
+        self._add_group(summary)
+
+        pages = Adw.PreferencesGroup()
+        pages.set_title(self.lang_manager.get("window.memory.pages"))
+        for entry in manager.page_report():
+            if entry["hibernated"]:
+                state = self.lang_manager.get("window.memory.hibernated")
+            elif entry["selected"]:
+                state = self.lang_manager.get("window.memory.selected")
+            else:
+                state = self.lang_manager.get("window.memory.active")
+            subtitle = self.lang_manager.get(
+                "window.memory.page_subtitle",
+                state=state,
+                messages=entry["messages"],
+                idle=entry["idle_seconds"] // 60
+            )
+            row = Adw.ActionRow(title=GLib.markup_escape_text(entry["title"]), subtitle=subtitle)
+            row.add_suffix(Gtk.Label(label=_format_mb(entry["rss_bytes"])))
+            pages.add(row)
+        self._add_group(pages)
+
+    def _add_group(self, group):
+        self.page.add(group)
+        self._groups.append(group)
+
+    def on_enforce_clicked(self, button):
+        self.main_window.memory_manager.enforce()
+        self.refresh()
+
+    def _on_timer(self):
+        self.refresh()
+        return True
+
+    def _on_close_request(self, window):
+        if self._timer_id:
+            GLib.source_remove(self._timer_id)
+            self._timer_id = None
+        return False
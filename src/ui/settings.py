@@ -361,7 +361,7 @@ class SettingsWindow(Adw.PreferencesWindow):
         self.scrape_len_row.set_title(self.lang_manager.get("settings.deep_research.max_scrape_length"))
         self.scrape_len_row.set_subtitle(self.lang_manager.get("settings.deep_research.max_scrape_length_subtitle"))
         
-        scrape_adj = Gtk.Adjustment.new(self.config.get("dr_max_scrape_length", 5000), 1000, 20000, 500, 1000, 0)
+        scrape_adj = Gtk.Adjustment.new(self.config.get("dr_max_scrape_length", 15000), 1000, 20000, 500, 1000, 0)
         self.scrape_spin = Gtk.SpinButton.new(scrape_adj, 1, 0)
         self.scrape_spin.set_valign(Gtk.Align.CENTER)
         self.scrape_spin.connect("value-changed", self.on_max_scrape_length_changed)
@@ -851,6 +851,10 @@ class SettingsWindow(Adw.PreferencesWindow):
             GLib.idle_add(btn.set_sensitive, False)
             
             success, reason = renew_tor_identity()
+            if success:
+                # New circuits need new connections
+                from src.core.network.http_client import reset_clients
+                reset_clients()
             
             def handle_result():
                 btn.set_sensitive(True)
@@ -4,11 +4,14 @@ import threading
 gi.require_version('Gtk', '4.0')
 gi.require_version('Adw', '1')
 
-from gi.repository import Gtk, Adw, Gio, GLib, Gdk
+from gi.repository import Gtk, Adw, Gio, GLib, Gdk, GObject
 
 from src.core.chat_storage import ChatStorage
 from src.ui.artifacts_panel import ArtifactsPanel
 from src.ui.chat.page import ChatPage
+from src.ui.chat.sidebar import ChatSidebar
+from src.ui.chat.hibernation import MemoryBudgetManager
+from src.core.config import ConfigManager
 from src.core.network.proxy import apply_proxy_settings # Proxy support
 from src.core.language_manager import LanguageManager
 from src.voice.manager import VoiceManager
@@ -29,10 +32,12 @@ class MainWindow(Adw.ApplicationWindow):
         self.set_icon_name("icon")
         
         self.storage = storage
-        self.chat_pages = {}  # chat_id -> ChatPage
-        self.all_chats = []  # Store all chat data for lazy loading
+        self.chat_pages = {}  # chat_id -> ChatPage (only chats open as tabs)
         self._creating_chat = False  # Flag to prevent recursive creation
 
+        # Hibernates least-recently-viewed pages when over the memory budget
+        self.memory_manager = MemoryBudgetManager(self)
+
         # Tab View
         self.tab_view = Adw.TabView()
         self.tab_view.connect("close-page", self.on_close_page)
@@ -43,11 +48,21 @@ class MainWindow(Adw.ApplicationWindow):
         self.main_paned.set_wide_handle(True)
         self.set_content(self.main_paned)
 
-        # Tab Overview (Left side)
+        # Chat list sidebar (metadata only) + Tab Overview (Left side)
+        self.sidebar = ChatSidebar()
+        self.sidebar.connect("chat-activated", self.on_sidebar_chat_activated)
+        self.sidebar.connect("chat-delete-requested", self.on_sidebar_chat_delete)
+
+        self.split_view = Adw.OverlaySplitView()
+        self.split_view.set_sidebar(self.sidebar)
+        self.split_view.set_show_sidebar(False)
+        self.main_paned.set_start_child(self.split_view)
+        self.split_view.set_hexpand(True)
+
         self.tab_overview = Adw.TabOverview()
         self.tab_overview.set_view(self.tab_view)
         self.tab_overview.set_enable_new_tab(False)
-        self.main_paned.set_start_child(self.tab_overview)
+        self.split_view.set_content(self.tab_overview)
         self.tab_overview.set_hexpand(True)
 
         # Artifacts Sidebar (Right side)
@@ -71,6 +86,14 @@ class MainWindow(Adw.ApplicationWindow):
         self.new_chat_button.set_tooltip_text(self.lang_manager.get("window.new_chat"))
         self.new_chat_button.connect("clicked", self.on_new_chat_clicked)
         self.header_bar.pack_start(self.new_chat_button)
+
+        # Chat List Toggle (left side)
+        self.sidebar_button = Gtk.ToggleButton()
+        self.sidebar_button.set_icon_name("view-list-symbolic")
+        self.sidebar_button.set_tooltip_text(self.lang_manager.get("window.show_chat_list"))
+        self.sidebar_button.bind_property("active", self.split_view, "show-sidebar",
+                                          GObject.BindingFlags.BIDIRECTIONAL | GObject.BindingFlags.SYNC_CREATE)
+        self.header_bar.pack_start(self.sidebar_button)
         
         # Internal state for fullscreen
         self.saved_paned_position = 400 # Default fallback
@@ -105,8 +128,13 @@ class MainWindow(Adw.ApplicationWindow):
         action_about = Gio.SimpleAction.new("about", None)
         action_about.connect("activate", self.on_about_action)
         self.add_action(action_about)
+
+        action_memory = Gio.SimpleAction.new("memory", None)
+        action_memory.connect("activate", self.on_memory_action)
+        self.add_action(action_memory)
         
         menu.append(self.lang_manager.get("window.menu.settings"), "win.preferences")
+        menu.append(self.lang_manager.get("window.menu.memory"), "win.memory")
         menu.append(self.lang_manager.get("window.menu.about"), "win.about")
         
         # Tab View goes after header
@@ -115,9 +143,11 @@ class MainWindow(Adw.ApplicationWindow):
         # Always create a new chat first
         self._create_initial_chat()
         
-        # Then load existing chats in background
+        # Then load the chat list (metadata only) in background
         GLib.idle_add(self._load_existing_chats)
 
+        # Periodically close tabs that have not been looked at for a while
+        GLib.timeout_add_seconds(60, self._close_idle_pages)
 
     def toggle_artifact_fullscreen(self):
         """Toggle the visibility of the chat pane to make artifacts fullscreen."""
@@ -143,17 +173,12 @@ class MainWindow(Adw.ApplicationWindow):
             self._creating_chat = False
 
     def _load_existing_chats(self):
-        """Load existing chat data - create tabs for all but lazy-load only active one."""
+        """Load the saved chat list into the sidebar. No ChatPage is built here."""
         def load_in_thread():
             try:
-                # Heavy IO: List all chats
+                # Served from the metadata index, not from the chat files
                 chats = self.storage.list_chats()
-                
-                # Store all chats for lazy loading
-                self.all_chats = chats
-                
-                # Update UI on main thread
-                GLib.idle_add(self._populate_chat_tabs, chats)
+                GLib.idle_add(self.sidebar.set_chats, chats)
             except Exception as e:
                 print(f"[DEBUG] Error loading chats: {e}")
 
@@ -161,13 +186,41 @@ class MainWindow(Adw.ApplicationWindow):
         thread.start()
         return False
 
-    def _populate_chat_tabs(self, chats):
-        """Populate tabs from the loaded chats list (runs on main thread)."""
-        # Create tabs for all existing chats (all lazy loaded since we have a new chat active)
-        for i, chat in enumerate(chats):
-            self._add_chat_tab(chat, lazy=True)
-        return False
-    
+    def open_chat(self, chat_id: str):
+        """Select the tab of a chat, building its ChatPage first if it is not open."""
+        page = self.chat_pages.get(chat_id)
+        if page is not None:
+            tab_page = self.tab_view.get_page(page)
+        else:
+            chat = self.storage.load_chat(chat_id)
+            if not chat:
+                self.sidebar.remove_chat(chat_id)
+                return None
+            tab_page = self._add_chat_tab(chat)
+        self.tab_view.set_selected_page(tab_page)
+        return tab_page
+
+    def on_sidebar_chat_activated(self, sidebar, chat_id):
+        self.open_chat(chat_id)
+        if self.split_view.get_collapsed():
+            self.split_view.set_show_sidebar(False)
+
+    def on_sidebar_chat_delete(self, sidebar, chat_id):
+        """Delete a chat for good: close its tab (without saving) and remove it from disk."""
+        page = self.chat_pages.pop(chat_id, None)
+        if page is not None:
+            page.teardown(save=False)
+            tab_page = self.tab_view.get_page(page)
+            if tab_page:
+                self.tab_view.close_page(tab_page)
+        self.storage.delete_chat(chat_id)
+        self.sidebar.remove_chat(chat_id)
+
+    def on_chat_metadata_changed(self, chat_data: dict):
+        """Called by ChatPage when a chat was saved (new title, new message)."""
+        if chat_data.get('_is_persisted', True):
+            self.sidebar.upsert_chat(chat_data)
+
     def _add_chat_tab(self, chat: dict, lazy: bool = False) -> Adw.TabPage:
         """Add a chat as a new tab."""
         # If chat is just metadata (no history), load full data if not lazy
@@ -177,6 +230,7 @@ class MainWindow(Adw.ApplicationWindow):
                 chat = full_chat
         
         page = ChatPage(chat, self.storage, lazy_loading=lazy)
+        page.last_viewed = GLib.get_monotonic_time()
         self.chat_pages[chat['id']] = page
         
         tab_page = self.tab_view.append(page)
@@ -205,6 +259,10 @@ class MainWindow(Adw.ApplicationWindow):
         settings = SettingsWindow(parent=self)
         settings.present()
 
+    def on_memory_action(self, action, param):
+        from src.ui.memory_window import MemoryDebugWindow
+        MemoryDebugWindow(self).present()
+
     def on_about_action(self, action, param):
         """Show the About dialog."""
         about = Adw.AboutWindow(transient_for=self)
@@ -224,12 +282,12 @@ class MainWindow(Adw.ApplicationWindow):
         self.create_new_chat()
     
     def on_close_page(self, tab_view, page):
-        """Handle tab close - delete the chat."""
+        """Handle tab close - tear the page down. The chat stays in the sidebar."""
         child = page.get_child()
         if isinstance(child, ChatPage):
             chat_id = child.chat_data['id']
-            self.storage.delete_chat(chat_id)
-            if chat_id in self.chat_pages:
+            child.teardown()
+            if self.chat_pages.get(chat_id) is child:
                 del self.chat_pages[chat_id]
         
         # Allow the close
@@ -247,6 +305,34 @@ class MainWindow(Adw.ApplicationWindow):
             self.create_new_chat()
         return False  # Don't repeat
 
+    def _close_idle_pages(self):
+        """Close tabs that were not viewed within the idle timeout (they can be reopened from the sidebar)."""
+        timeout_min = ConfigManager().get("idle_tab_timeout_minutes", 30)
+        if not timeout_min or timeout_min <= 0:
+            return True
+
+        now = GLib.get_monotonic_time()
+        limit = timeout_min * 60 * 1_000_000
+        selected = self.tab_view.get_selected_page()
+
+        for chat_id, child in list(self.chat_pages.items()):
+            tab_page = self.tab_view.get_page(child)
+            if tab_page is None or tab_page == selected or tab_page.get_pinned():
+                continue
+            if child._is_generating or self._has_background_task(chat_id):
+                continue
+            if now - getattr(child, "last_viewed", now) > limit:
+                print(f"[MainWindow] Closing idle chat tab {chat_id}")
+                self.tab_view.close_page(tab_page)
+        return True
+
+    def _has_background_task(self, chat_id):
+        """Whether a deep research or web build still runs (or awaits approval) for the chat."""
+        from src.tools.deep_research.manager import BackgroundResearchManager
+        from src.tools.web_builder.manager import BackgroundWebBuilderManager
+        return (chat_id in BackgroundResearchManager().active_tasks
+                or chat_id in BackgroundWebBuilderManager().active_tasks)
+
     def on_artifacts_toggled(self, button):
         self.artifacts_panel.set_visible(button.get_active())
         if button.get_active():
@@ -265,15 +351,26 @@ class MainWindow(Adw.ApplicationWindow):
     def on_tab_changed(self, *args):
         """Handle tab changes and trigger lazy loading."""
         self.artifacts_panel.clear()
+
+        # The page we are leaving was viewed until now
+        previous = getattr(self, "_last_selected_child", None)
+        if previous is not None:
+            previous.last_viewed = GLib.get_monotonic_time()
         
         # Trigger lazy loading for the selected tab if needed
         selected_page = self.tab_view.get_selected_page()
         if selected_page:
             child = selected_page.get_child()
             if isinstance(child, ChatPage):
+                child.last_viewed = GLib.get_monotonic_time()
+                self._last_selected_child = child
+
                 # Restore artifacts (Simple preview restore)
                 child.restore_artifacts(self.artifacts_panel)
 
+                if child.hibernated:
+                    child.rehydrate()
+
                 if child.lazy_loading:
                     child.lazy_loading = False
                     # Load limited chat data if we only have metadata
@@ -285,6 +382,13 @@ class MainWindow(Adw.ApplicationWindow):
                             child.history = full_chat.get('history', [])
                     GLib.idle_add(child._load_history_batch)
 
+        # Switching tabs is a good moment to give memory back
+        GLib.idle_add(self._enforce_memory_budget)
+
+    def _enforce_memory_budget(self):
+        self.memory_manager.enforce()
+        return False
+
     def get_active_chat_page(self):
         """Return the currently active ChatPage or None."""
         page = self.tab_view.get_selected_page()
@@ -1,10 +1,10 @@
 import os
-import requests
 import zipfile
 import tarfile
 import threading
 from pathlib import Path
 from src.core.config import ConfigManager
+from src.core.network.http_client import get_session
 
 class VoiceInstaller:
     def __init__(self):
@@ -136,7 +136,7 @@ class VoiceInstaller:
         local_path = os.path.join(dest_dir, local_filename)
         
         # Download
-        with requests.get(url, stream=True) as r:
+        with get_session().get(url, stream=True) as r:
             r.raise_for_status()
             total_length = int(r.headers.get('content-length', 0))
             downloaded = 0
@@ -191,7 +191,7 @@ class VoiceInstaller:
         local_filename = url.split('/')[-1]
         local_path = os.path.join(dest_dir, local_filename)
         
-        with requests.get(url, stream=True) as r:
+        with get_session().get(url, stream=True) as r:
             r.raise_for_status()
             with open(local_path, 'wb') as f:
                 for chunk in r.iter_content(chunk_size=8192):
@@ -64,9 +64,9 @@ class VoiceManager:
                  subdirs = [f.path for f in os.scandir(local_vosk) if f.is_dir()]
                  if subdirs: model_path = subdirs[0]
 
-        if model_path:
-             print(f"[VoiceManager] Loading Vosk model from: {model_path}")
-             self.listener.set_model_path(model_path)
+        # The Vosk model (and the vosk/sounddevice stack) is only loaded
+        # when voice mode is started, not at window creation.
+        self.model_path = model_path
             
         # Configure TTS path if installed locally
         local_piper_bin = os.path.join(os.path.expanduser("~/.gaia/voice/piper/piper/piper"))
@@ -148,6 +148,7 @@ class VoiceManager:
         
         target_model_path = self.config.get(f"vosk_model_path_{current_lang}")
         if not target_model_path: target_model_path = self.config.get("vosk_model_path")
+        if not target_model_path: target_model_path = self.model_path
         
         # If we have a path and (no model loaded OR different path?)
         # For simplicity, if model is not loaded, load it.
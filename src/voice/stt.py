@@ -4,16 +4,24 @@ import queue
 import sys
 import time
 import threading
-try:
-    import sounddevice as sd
-except OSError:
-    sd = None
-    print("Warning: PortAudio library not found. Voice mode will be unavailable.")
-except ImportError:
-    sd = None
-    print("Warning: sounddevice module not found. Voice mode will be unavailable.")
 
-from vosk import Model, KaldiRecognizer
+# vosk and sounddevice are heavy (native libs, PortAudio probing), so they
+# are imported on first use instead of at application startup.
+_sd = None
+_sd_checked = False
+
+def _get_sounddevice():
+    global _sd, _sd_checked
+    if not _sd_checked:
+        _sd_checked = True
+        try:
+            import sounddevice
+            _sd = sounddevice
+        except OSError:
+            print("Warning: PortAudio library not found. Voice mode will be unavailable.")
+        except ImportError:
+            print("Warning: sounddevice module not found. Voice mode will be unavailable.")
+    return _sd
 
 class VoskListener:
     def __init__(self, language="en"):
@@ -24,9 +32,6 @@ class VoskListener:
         self.running = False
         self.paused = False
         self.device = None # Default device
-        
-        if sd is None:
-             print("VoskListener: sounddevice/PortAudio not available.")
 
     def _load_model(self):
         # Helper to find model path based on language
@@ -39,6 +44,7 @@ class VoskListener:
             print(f"Vosk model path not found: {path}")
             return False
         try:
+            from vosk import Model
             self.model = Model(path)
             return True
         except Exception as e:
@@ -54,8 +60,10 @@ class VoskListener:
             print("No Vosk model loaded.")
             return
 
+        from vosk import KaldiRecognizer
         self.recognizer = KaldiRecognizer(self.model, 16000)
         self.running = True
+        sd = _get_sounddevice()
 
         def callback(indata, frames, time, status):
             if status: